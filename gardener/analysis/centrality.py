@@ -2,10 +2,54 @@
 Centrality calculation functions for dependency graph analysis
 """
 
+import heapq
+import warnings
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from operator import itemgetter
+
 import networkx as nx
+import numpy as np
+import scipy.sparse as sp
+import scipy.sparse.linalg as spla
+from scipy.sparse.csgraph import reverse_cuthill_mckee
 
+from gardener.analysis._pagerank_numba import NUMBA_AVAILABLE, pagerank_step
 from gardener.common.defaults import GraphAnalysisConfig as cfg
 
+try:
+    import nx_cugraph  # noqa: F401  # registers the "cugraph" networkx dispatch backend
+
+    GPU_BACKEND_AVAILABLE = True
+except Exception:  # ImportError, or a CUDA runtime that fails to initialize
+    GPU_BACKEND_AVAILABLE = False
+
+# Below this many stored entries a mat-vec is cheaper than dispatching it to worker threads
+PARALLEL_SPMV_MIN_NNZ = 500_000
+
+# Graphs at least this large are reordered by reverse Cuthill-McKee so mat-vecs read x in a narrow band
+RCM_MIN_NODES = 100_000
+
+METRIC_LABELS = {"katz": "Katz centrality", "pagerank": "PageRank"}
+
+# Fraction of current nodes that must carry a previous score before it seeds the next solve
+WARM_START_MIN_OVERLAP = 0.8
+
+
+def _row_chunks(n_rows, n_workers):
+    """
+    Split a row range into contiguous chunks, roughly four per worker
+
+    Args:
+        n_rows (int): Number of matrix rows
+        n_workers (int): Number of workers sharing the rows
+
+    Returns:
+        List of (start, stop) row bounds
+    """
+    size = max(1, n_rows // (4 * n_workers))
+    return [(start, min(start + size, n_rows)) for start in range(0, n_rows, size)]
+
 
 class CentralityCalculator:
     """
@@ -18,43 +62,55 @@ class CentralityCalculator:
             logger (Logger): Optional logger instance for debugging and progress reporting
         """
         self.logger = logger
+        self._csr_cache = {}  # (id(graph), nodes, edges, dtype) -> (graph, nodelist, weighted CSR)
+        self._transition_cache = {}  # CSR cache key + use_weights -> (graph, transition matrix, dangling mask)
+        self._last_scores = {}  # (metric, use_weights) -> previous scores, reused as a warm start
+        self._metric_impls = {"katz": self._calculate_katz, "pagerank": self._calculate_pagerank}
 
-    def calculate_importance(self, graph):
+    def calculate_importance(self, graph, top_k=None):
         """
         Calculate importance scores (PageRank or Katz) for the graph
 
         Args:
             graph (networkx.Graph): NetworkX graph to analyze
+            top_k (int): Optional number of highest-scoring nodes to return; with Katz this
+                lets the calculation stop as soon as the top-k ranking is settled
 
         Returns:
             Dictionary mapping node IDs to importance scores
         """
-        if not graph or graph.number_of_nodes() == 0:
+        num_nodes = graph.number_of_nodes() if graph else 0
+        if num_nodes == 0:
             if self.logger:
                 self.logger.warning("Graph is empty or not provided. Skipping importance calculation")
             return {}
 
         try:
+            num_edges = graph.number_of_edges()
             if self.logger:
                 self.logger.info(
-                    f"... Calculating importance on the full graph ({graph.number_of_nodes()} nodes, {graph.number_of_edges()} edges)"
+                    f"... Calculating importance on the full graph ({num_nodes} nodes, {num_edges} edges)"
                 )  # noqa
 
             # Calculate centrality based on configured metric
             ranked = {}
+            metric = cfg.CENTRALITY_METRIC.lower()
+            impl = self._metric_impls.get(metric)
+            if impl is None:
+                if self.logger:
+                    self.logger.error(f"Invalid centrality metric: {cfg.CENTRALITY_METRIC}")
+                return {}  # Return empty if metric is invalid
             try:
-                if cfg.CENTRALITY_METRIC.lower() == "katz":
-                    if self.logger:
-                        self.logger.debug("Using Katz centrality for importance calculation on full graph")
-                    ranked = self._calculate_katz(graph)
-                elif cfg.CENTRALITY_METRIC.lower() == "pagerank":
-                    if self.logger:
-                        self.logger.debug("Using PageRank for importance calculation on full graph")
-                    ranked = self._calculate_pagerank(graph)
+                if self.logger:
+                    self.logger.debug(f"Using {METRIC_LABELS[metric]} for importance calculation on full graph")
+                if num_edges == 0:
+                    # No walks at all: Katz keeps each node's exogenous influence (beta) and
+                    # PageRank, with every node dangling, settles on the uniform distribution
+                    ranked = dict.fromkeys(graph, 1.0 if metric == "katz" else 1.0 / num_nodes)
+                elif top_k is not None and metric == "katz":
+                    ranked = self._calculate_katz_topk(graph, top_k)
                 else:
-                    if self.logger:
-                        self.logger.error(f"Invalid centrality metric: {cfg.CENTRALITY_METRIC}")
-                    return {}  # Return empty if metric is invalid
+                    ranked = impl(graph)
             except Exception as e:
                 if self.logger:
                     self.logger.warning(
@@ -67,16 +123,246 @@ class CentralityCalculator:
                         self.logger.error(f"Fallback PageRank calculation also failed: {fallback_e}")
                     return {}  # Return empty if fallback fails
 
+            if top_k is not None:
+                ranked = self._select_top_k(ranked, top_k)
             return ranked
         except Exception as e:
             if self.logger:
                 self.logger.error(f"Error during importance calculation: {str(e)}")
             return {}
 
+    def calculate_importance_raw(self, graph):
+        """
+        Calculate importance scores without logging, fallbacks or exception shielding
+
+        Fast path for bulk callers (e.g. ranking thousands of subgraphs) that validate
+        their input and handle failures around the whole batch themselves
+
+        Args:
+            graph (networkx.Graph): Non-empty NetworkX graph to analyze
+
+        Returns:
+            Dictionary mapping node IDs to importance scores
+
+        Raises:
+            KeyError: If cfg.CENTRALITY_METRIC is not a supported metric
+        """
+        metric = cfg.CENTRALITY_METRIC.lower()
+        if graph.number_of_edges() == 0:
+            return dict.fromkeys(graph, 1.0 if metric == "katz" else 1.0 / graph.number_of_nodes())
+        return self._metric_impls[metric](graph)
+
+    @staticmethod
+    def _select_top_k(ranked, k):
+        """
+        Keep the k highest-scoring entries of a score mapping
+
+        Args:
+            ranked (dict): Mapping of node IDs to scores
+            k (int): Number of entries to keep
+
+        Returns:
+            Dictionary of the top k entries ordered by descending score
+        """
+        if k >= len(ranked):
+            return dict(sorted(ranked.items(), key=itemgetter(1), reverse=True))
+        return dict(heapq.nlargest(max(k, 0), ranked.items(), key=itemgetter(1)))
+
+    def _graph_to_csr(self, graph, use_weights=True):
+        """
+        Convert a graph to a CSR adjacency matrix, reusing the previous conversion
+        when called again on the same graph
+
+        Only the weighted matrix is cached; the unweighted variant is a binarized copy
+        so weight-dropping fallbacks never pay for a second conversion. Values use
+        cfg.CENTRALITY_DTYPE, which sets the precision of all downstream iterations.
+        Large graphs are permuted by reverse Cuthill-McKee, so nodelist follows the
+        bandwidth-reducing order rather than graph.nodes()
+
+        Args:
+            graph (networkx.Graph): NetworkX graph
+            use_weights (bool): Whether to use edge weights
+
+        Returns:
+            Tuple (nodelist, csr) where row/column i of csr corresponds to nodelist[i]
+        """
+        dtype = np.dtype(cfg.CENTRALITY_DTYPE)
+        key = (id(graph), graph.number_of_nodes(), graph.number_of_edges(), dtype.str)
+        cached = self._csr_cache.get(key)
+        if cached is None or cached[0] is not graph:
+            nodelist = list(graph.nodes())
+            csr = nx.to_scipy_sparse_array(graph, nodelist=nodelist, weight="weight", dtype=dtype, format="csr")
+            nodelist, csr = self._cache_csr(graph, nodelist, csr)
+        else:
+            _, nodelist, csr = cached
+
+        if not use_weights:
+            csr = csr.copy()
+            csr.data[:] = 1.0
+        return nodelist, csr
+
+    def set_adjacency(self, graph, nodelist, csr):
+        """
+        Register a prebuilt weighted adjacency matrix for a graph
+
+        Lets graph builders that already track edges by index skip the NetworkX to
+        SciPy conversion. The matrix is used until the graph's node or edge count changes
+
+        Args:
+            graph (networkx.Graph): Graph the matrix describes
+            nodelist (list): Node IDs in row/column order
+            csr (scipy.sparse.csr_array): Weighted adjacency matrix, csr[i, j] = weight of nodelist[i] -> nodelist[j]
+        """
+        self._cache_csr(graph, list(nodelist), sp.csr_array(csr, dtype=cfg.CENTRALITY_DTYPE))
+
+    def _cache_csr(self, graph, nodelist, csr):
+        """
+        Apply the bandwidth-reducing reordering to a weighted CSR matrix and cache it for graph
+
+        Args:
+            graph (networkx.Graph): Graph the matrix describes
+            nodelist (list): Node IDs in row/column order
+            csr (scipy.sparse.csr_array): Weighted adjacency matrix in cfg.CENTRALITY_DTYPE
+
+        Returns:
+            Tuple (nodelist, csr) as cached
+        """
+        if len(nodelist) >= RCM_MIN_NODES:
+            perm = reverse_cuthill_mckee(csr, symmetric_mode=False)
+            csr = csr[perm][:, perm]
+            nodelist = [nodelist[i] for i in perm]
+        key = (id(graph), graph.number_of_nodes(), graph.number_of_edges(), csr.dtype.str)
+        # Keep a single entry; holding the graph also prevents id() reuse
+        self._csr_cache.clear()
+        self._csr_cache[key] = (graph, nodelist, csr)
+        return nodelist, csr
+
+    def _transition_matrix(self, graph, use_weights=True):
+        """
+        Build the transposed PageRank transition matrix and dangling-node mask once per graph
+
+        Args:
+            graph (networkx.Graph): NetworkX graph
+            use_weights (bool): Whether to use edge weights
+
+        Returns:
+            Tuple of (nodelist, row-major transposed transition matrix, boolean dangling mask)
+        """
+        key = (id(graph), graph.number_of_nodes(), graph.number_of_edges(), cfg.CENTRALITY_DTYPE, use_weights)
+        cached = self._transition_cache.get(key)
+        if cached is not None and cached[0] is graph:
+            return cached[1:]
+
+        nodelist, A = self._graph_to_csr(graph, use_weights)
+        N = len(nodelist)
+
+        # Scale each source column of A^T by its inverse out-weight: the transposed transition
+        # matrix, stored row-major so x_next = M @ x splits cleanly by target rows
+        S = np.asarray(A.sum(axis=1)).ravel()
+        dangling = S == 0
+        Dinv = np.zeros(N, dtype=A.dtype)
+        Dinv[~dangling] = 1.0 / S[~dangling]
+        AT = A.T.tocsr()
+        M = sp.csr_array((AT.data * Dinv[AT.indices], AT.indices, AT.indptr), shape=AT.shape)
+
+        # Keep a single entry, like the CSR cache
+        self._transition_cache.clear()
+        self._transition_cache[key] = (graph, nodelist, M, dangling)
+        return nodelist, M, dangling
+
+    @contextmanager
+    def _spmv(self, A):
+        """
+        Provide a mat-vec callable for A, split by row chunks across worker threads
+
+        SciPy's sparse kernels release the GIL, so row slices can be multiplied
+        concurrently without copying the vector to other processes. Runs serially
+        unless cfg.CENTRALITY_WORKERS > 1 and A is large enough to amortize dispatch
+
+        Args:
+            A (scipy.sparse.csr_array): Matrix to multiply with
+
+        Yields:
+            Callable mapping a vector x to A @ x
+        """
+        workers = cfg.CENTRALITY_WORKERS
+        if workers <= 1 or A.nnz < PARALLEL_SPMV_MIN_NNZ:
+            yield A.dot
+            return
+
+        slices = [(start, stop, A[start:stop]) for start, stop in _row_chunks(A.shape[0], workers)]
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+
+            def matvec(x):
+                x = np.ravel(x)
+                y = np.empty(A.shape[0], dtype=np.result_type(A.dtype, x.dtype))
+
+                def _slice_product(chunk):
+                    start, stop, rows = chunk
+                    y[start:stop] = rows @ x
+
+                for _ in executor.map(_slice_product, slices):
+                    pass
+                return y
+
+            yield matvec
+
+    def _calculate_on_gpu(self, algorithm, graph, **kwargs):
+        """
+        Run a networkx centrality algorithm on the cuGraph backend for large graphs
+
+        Args:
+            algorithm (callable): networkx algorithm supporting backend dispatch
+            graph (networkx.Graph): NetworkX graph
+            **kwargs: Keyword arguments forwarded to the algorithm
+
+        Returns:
+            Dictionary mapping node IDs to scores, or None when the GPU path is not
+            available, not worthwhile for this graph size, or fails
+        """
+        if not GPU_BACKEND_AVAILABLE or graph.number_of_edges() < cfg.CENTRALITY_GPU_MIN_EDGES:
+            return None
+        try:
+            ranked = algorithm(graph, backend="cugraph", **kwargs)
+        except Exception as e:
+            if self.logger:
+                self.logger.debug(f"cuGraph {algorithm.__name__} failed ({e}); using CPU implementation")
+            return None
+        if self.logger:
+            self.logger.debug(f"Calculated {algorithm.__name__} for {len(ranked)} nodes on the cuGraph backend")
+        return {node: float(score) for node, score in ranked.items()}
+
+    def _warm_start_vector(self, key, nodelist, default, dtype):
+        """
+        Build an initial guess from the previous result for the same metric
+
+        Args:
+            key (tuple): (metric, use_weights) key of the stored result
+            nodelist (list): Node order of the current matrix
+            default (float): Value for nodes without a previous score
+            dtype (numpy.dtype): Dtype of the returned vector
+
+        Returns:
+            numpy.ndarray in nodelist order, or None when too few nodes overlap
+        """
+        previous = self._last_scores.get(key)
+        if not previous:
+            return None
+        values = [previous.get(n) for n in nodelist]
+        hits = len(values) - values.count(None)
+        if hits < WARM_START_MIN_OVERLAP * len(nodelist):
+            return None
+        return np.array([default if v is None else v for v in values], dtype=dtype)
+
     def _calculate_pagerank(self, graph, use_weights=True):
         """
         Calculate PageRank on the given graph
 
+        Runs the power iteration directly against a row-stochastic CSR matrix so each
+        step is a single sparse matrix-vector product; dangling nodes (no out-weight)
+        redistribute their mass uniformly, matching networkx.pagerank
+
         Args:
             graph (networkx.Graph): NetworkX graph
             use_weights (bool): Whether to use edge weights
@@ -84,18 +370,140 @@ class CentralityCalculator:
         Returns:
             Dictionary mapping node IDs to PageRank scores
         """
-        weight_attr = "weight" if use_weights else None
-        ranked = nx.pagerank(graph, weight=weight_attr, alpha=cfg.PAGERANK_ALPHA, max_iter=1000)
+        alpha = cfg.PAGERANK_ALPHA
+        tol = cfg.CENTRALITY_TOL
+        # The L1 change contracts by alpha every step starting from at most 2, so convergence
+        # is reached within this many steps; the margin absorbs floating-point rounding
+        max_iter = int(np.ceil(np.log(tol / 2.0) / np.log(alpha))) + 10 if 0.0 < alpha < 1.0 else 1000
+
+        ranked = self._calculate_on_gpu(
+            nx.pagerank, graph, alpha=alpha, weight="weight" if use_weights else None, tol=tol, max_iter=max_iter
+        )
+        if ranked is not None:
+            return ranked
+
+        nodelist, M, dangling = self._transition_matrix(graph, use_weights)
+        N = len(nodelist)
+
+        teleport = (1.0 - alpha) / N
+        x = self._warm_start_vector(("pagerank", use_weights), nodelist, 1.0 / N, M.dtype)
+        if x is None:
+            x = np.full(N, 1.0 / N, dtype=M.dtype)
+        else:
+            x /= x.sum()
+        period = cfg.PAGERANK_AITKEN_PERIOD
+        history = []  # iterates since the last extrapolation, when Aitken acceleration is enabled
+        if NUMBA_AVAILABLE:
+            # Fused mat-vec, damping and convergence check in one pass over the CSR arrays
+            y = np.empty_like(x)
+            for iterations in range(1, max_iter + 1):
+                shift = alpha * x[dangling].sum() / N + teleport
+                err = pagerank_step(M.indptr, M.indices, M.data, x, y, alpha, shift)
+                x, y = y, x
+                if err < N * tol:
+                    break
+                if period >= 3:
+                    x, history = self._aitken_step(x.copy(), history, iterations, period)
+            else:
+                raise nx.PowerIterationFailedConvergence(max_iter)
+        else:
+            with self._spmv(M) as matvec:
+                for iterations in range(1, max_iter + 1):
+                    x_last = x
+                    x = alpha * matvec(x_last)
+                    x += alpha * x_last[dangling].sum() / N + teleport
+                    if np.abs(x - x_last).sum() < N * tol:
+                        break
+                    if period >= 3:
+                        x, history = self._aitken_step(x, history, iterations, period)
+                else:
+                    raise nx.PowerIterationFailedConvergence(max_iter)
+        ranked = dict(zip(nodelist, x.tolist()))
+
+        self._last_scores[("pagerank", use_weights)] = ranked
         if self.logger:
             self.logger.debug(
-                f"Calculated PageRank for {len(ranked)} nodes " f"{'with' if use_weights else 'without'} edge weights"
+                f"Calculated PageRank for {len(ranked)} nodes "
+                f"{'with' if use_weights else 'without'} edge weights in {iterations} iterations"
             )
         return ranked
 
+    @staticmethod
+    def _aitken_step(x, history, iteration, period):
+        """
+        Apply Aitken delta-squared extrapolation to the last three PageRank iterates
+
+        Follows the extrapolation family of Kamvar et al. / Langville & Meyer: every
+        `period` iterations each component is extrapolated from its last three values,
+        dividing only where the second difference is non-negligible, then clipped to be
+        non-negative and renormalized to a probability vector
+
+        Args:
+            x (numpy.ndarray): Latest iterate (not aliased by the caller)
+            history (list): Iterates recorded since the last extrapolation
+            iteration (int): 1-based iteration number
+            period (int): Extrapolate every this many iterations
+
+        Returns:
+            Tuple of (iterate to continue from, updated history)
+        """
+        history = (history + [x])[-3:]
+        if iteration % period or len(history) < 3:
+            return x, history
+
+        x2, x1, _ = history
+        second_diff = x - 2.0 * x1 + x2
+        safe = np.abs(second_diff) > np.finfo(x.dtype).eps * np.abs(x).max()
+        extrapolated = x.copy()
+        extrapolated[safe] -= (x[safe] - x1[safe]) ** 2 / second_diff[safe]
+        np.maximum(extrapolated, 0.0, out=extrapolated)
+        extrapolated /= extrapolated.sum()
+        return extrapolated, []
+
+    def _solve_katz_system(self, A, beta, x0=None):
+        """
+        Solve (I - alpha * A^T) x = beta, the closed form of unnormalized Katz centrality
+
+        Uses GMRES, which only needs sparse matrix-vector products, and falls back to a
+        direct sparse factorization when it does not converge. For a nonnegative adjacency
+        the Katz series converges exactly when the solution is nonnegative, so a negative
+        or non-finite solution is reported as a convergence failure
+
+        Args:
+            A (scipy.sparse.csr_array): Adjacency matrix
+            beta (numpy.ndarray): Exogenous influence per node
+            x0 (numpy.ndarray): Optional initial guess for GMRES
+
+        Returns:
+            numpy.ndarray of Katz scores in matrix order
+
+        Raises:
+            numpy.linalg.LinAlgError: If the system cannot be solved or the series diverges
+        """
+        N = A.shape[0]
+        M = (sp.eye(N, dtype=A.dtype, format="csr") - cfg.KATZ_ALPHA * A.T).tocsr()
+        with self._spmv(M) as matvec:
+            operator = spla.LinearOperator(M.shape, matvec=matvec, dtype=M.dtype)
+            x, info = spla.gmres(operator, beta, x0=x0, tol=cfg.CENTRALITY_TOL, atol=0.0)
+        if info != 0:
+            if self.logger:
+                self.logger.debug(f"GMRES Katz solve did not converge (info={info}); retrying with direct solve")
+            with warnings.catch_warnings():
+                # A singular factor is signalled by a warning plus NaNs; caught by the check below
+                warnings.simplefilter("ignore", spla.MatrixRankWarning)
+                x = spla.spsolve(M.tocsc(), beta)
+
+        if not np.all(np.isfinite(x)) or x.min() < 0:
+            raise np.linalg.LinAlgError(f"Katz series diverges for alpha={cfg.KATZ_ALPHA}")
+        return x
+
     def _calculate_katz(self, graph, use_weights=True):
         """
         Calculate Katz centrality on the given graph
 
+        Solves the linear system directly instead of running power iteration;
+        scores match networkx.katz_centrality(normalized=False) with beta=1
+
         Args:
             graph (networkx.Graph): NetworkX graph
             use_weights (bool): Whether to use edge weights
@@ -103,29 +511,110 @@ class CentralityCalculator:
         Returns:
             Dictionary mapping node IDs to Katz centrality scores
         """
-        # Initial centrality values (beta)
+        ranked = self._calculate_on_gpu(
+            nx.katz_centrality,
+            graph,
+            alpha=cfg.KATZ_ALPHA,
+            beta=1.0,
+            normalized=False,
+            weight="weight" if use_weights else None,
+        )
+        if ranked is not None:
+            return ranked
+
+        nodelist, A = self._graph_to_csr(graph, use_weights)
         # Use a uniform exogenous influence of 1.0 for all nodes
-        beta = {n: 1.0 for n in graph.nodes()}
+        beta = np.ones(len(nodelist), dtype=A.dtype)
 
-        # Calculate Katz centrality
-        weight_attr = "weight" if use_weights else None
         try:
-            ranked = nx.katz_centrality(
-                graph, alpha=cfg.KATZ_ALPHA, beta=beta, normalized=False, weight=weight_attr, max_iter=1000
-            )
+            x0 = self._warm_start_vector(("katz", use_weights), nodelist, 1.0, A.dtype)
+            x = self._solve_katz_system(A, beta, x0=x0)
             if self.logger:
                 self.logger.debug(
-                    f"Calculated Katz centrality for {len(ranked)} nodes {'with' if use_weights else 'without'} edge weights (alpha={cfg.KATZ_ALPHA})"
+                    f"Calculated Katz centrality for {len(nodelist)} nodes {'with' if use_weights else 'without'} edge weights (alpha={cfg.KATZ_ALPHA})"
                 )  # noqa
-        except nx.PowerIterationFailedConvergence:
+        except np.linalg.LinAlgError:
             if self.logger:
                 self.logger.warning(
                     f"Katz centrality failed to converge with alpha={cfg.KATZ_ALPHA}. " f"Trying without weights."
                 )
             # Fallback without edge weights
-            ranked = nx.katz_centrality(graph, alpha=cfg.KATZ_ALPHA, beta=beta, normalized=False, max_iter=1000)
+            use_weights = False
+            _, A = self._graph_to_csr(graph, use_weights=False)
+            x0 = self._warm_start_vector(("katz", use_weights), nodelist, 1.0, A.dtype)
+            x = self._solve_katz_system(A, beta, x0=x0)
             if self.logger:
                 self.logger.debug(
-                    f"Calculated Katz centrality for {len(ranked)} nodes without edge weights (alpha={cfg.KATZ_ALPHA})"
+                    f"Calculated Katz centrality for {len(nodelist)} nodes without edge weights (alpha={cfg.KATZ_ALPHA})"
                 )  # noqa
+        ranked = dict(zip(nodelist, x.tolist()))
+        self._last_scores[("katz", use_weights)] = ranked
         return ranked
+
+    def _calculate_katz_topk(self, graph, k, use_weights=True, max_iter=None):
+        """
+        Calculate Katz centrality for the k most central nodes only
+
+        Accumulates the Katz series one walk length at a time while tracking per-node
+        lower/upper bounds; nodes whose upper bound drops below the k-th largest lower
+        bound are pruned, and iteration stops once the top-k ranking is separated.
+        The tail bound assumes alpha times the maximum weighted in-degree is below 1;
+        otherwise the full Katz vector is computed and truncated
+
+        Args:
+            graph (networkx.Graph): NetworkX graph
+            k (int): Number of top nodes to return
+            use_weights (bool): Whether to use edge weights
+            max_iter (int): Maximum number of walk lengths to accumulate; derived from the
+                bound contraction rate and cfg.CENTRALITY_TOL when omitted
+
+        Returns:
+            Dictionary mapping the top-k node IDs to Katz scores, ordered by score
+        """
+        nodelist, A = self._graph_to_csr(graph, use_weights)
+        N = len(nodelist)
+        alpha = cfg.KATZ_ALPHA
+        max_in_weight = float(np.asarray(A.sum(axis=0)).max()) if A.nnz else 0.0
+        if k <= 0 or k >= N or alpha * max_in_weight >= 1.0:
+            if self.logger:
+                self.logger.debug(f"Top-{k} Katz bounds not applicable; computing full Katz vector")
+            return self._select_top_k(self._calculate_katz(graph, use_weights), k)
+
+        # Tail of the series past walk length r is at most alpha^r * w_r(v) * tail_factor
+        tail_factor = alpha * max_in_weight / (1.0 - alpha * max_in_weight)
+        tol = cfg.CENTRALITY_TOL
+        if max_iter is None:
+            # Bound gap is at most tail_factor * (alpha * max_in_weight)^r and every lower bound is >= 1
+            max_iter = 1
+            if tail_factor > tol:
+                max_iter += int(np.ceil(np.log(tol / tail_factor) / np.log(alpha * max_in_weight)))
+        AT = A.T.tocsr()
+        walks = np.ones(N, dtype=A.dtype)  # weighted count of walks of length r ending at each node
+        lower = np.ones(N, dtype=A.dtype)  # beta term plus series accumulated so far
+        candidates = np.ones(N, dtype=bool)
+        scale = 1.0
+        with self._spmv(AT) as matvec:
+            for r in range(1, max_iter + 1):
+                walks = matvec(walks)
+                scale *= alpha
+                lower += scale * walks
+                upper = lower + scale * tail_factor * walks
+
+                kth_lower = np.partition(lower, N - k)[N - k]
+                candidates &= upper >= kth_lower
+
+                cand_idx = np.flatnonzero(candidates)
+                order = cand_idx[np.argsort(-lower[cand_idx], kind="stable")]
+                # Ranking is settled when every top-k lower bound clears all upper bounds ranked below it
+                suffix_max_upper = np.maximum.accumulate(upper[order][::-1])[::-1]
+                separated = np.all(lower[order[: k - 1]] >= suffix_max_upper[1:k]) and (
+                    len(order) == k or lower[order[k - 1]] >= suffix_max_upper[k]
+                )
+                if separated or np.max(upper[order] - lower[order]) <= tol * lower[order[k - 1]]:
+                    break
+            else:
+                raise np.linalg.LinAlgError(f"Top-{k} Katz bounds did not separate within {max_iter} iterations")
+
+        if self.logger:
+            self.logger.debug(f"Settled top-{k} Katz ranking after {r} walk lengths ({len(order)} candidates left)")
+        return {nodelist[i]: float(lower[i]) for i in order[:k]}
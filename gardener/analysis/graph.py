@@ -2,15 +2,37 @@
 Graph building and PageRank calculation
 """
 
-from collections import defaultdict
+import bisect
+import functools
+import itertools
+import logging
+import os
 
 import networkx as nx
-from gardener.common.language_detection import filename_to_lang
+import numpy as np
+import scipy.sparse as sp
+from gardener.common.language_detection import PARSERS
 
 from gardener.analysis.centrality import CentralityCalculator
 from gardener.common.defaults import GraphAnalysisConfig as cfg
 
 
+@functools.lru_cache(maxsize=64)
+def _language_for_extension(ext):
+    """
+    Return the language for a file extension, honoring .mjs/.cjs overrides
+
+    Args:
+        ext (str): File extension including the dot (e.g., '.py'), or ''
+
+    Returns:
+        Language name string or 'unknown'
+    """
+    if ext in (".mjs", ".cjs"):
+        return "javascript"
+    return PARSERS.get(ext) or "unknown"
+
+
 class DependencyGraphBuilder:
     """
     Builds and analyzes the dependency graph by constructing a directed graph of file,
@@ -44,9 +66,11 @@ class DependencyGraphBuilder:
             logger (Logger): Optional logger instance for debugging and progress reporting
         """
         self.logger = logger
+        self._refresh_log_levels()
         self.graph = None
         self.object_nodes = set()
         self.import_to_node = {}
+        self._import_prefixes = []  # sorted keys of import_to_node for longest-prefix lookups
         self.import_to_dist = {}
         self._ambiguous_choices = {}  # import_name -> {chosen: str, candidates: [str, ...]}
         self.external_packages = {}
@@ -54,6 +78,19 @@ class DependencyGraphBuilder:
         self.local_imports_map = {}
         self.source_files = {}
         self.file_imports = {}
+        self._node_index = {}  # node id -> row/column of the adjacency matrix
+        # Edges recorded as parallel int32/float arrays (12 bytes per edge at float32) filled up to _edge_count
+        self._edge_src = np.empty(0, dtype=np.int32)
+        self._edge_dst = np.empty(0, dtype=np.int32)
+        self._edge_w = np.empty(0, dtype=cfg.CENTRALITY_DTYPE)
+        self._edge_count = 0
+        self._pending_edges = []  # (src, dst, attrs) batched until the current build phase ends
+        self._shared_edge_attrs = {}  # (edge_type, weight) -> attrs dict shared by edges without extra attributes
+        self._node_attrs = {}  # node id -> the attribute dict NetworkX stores for it
+        self._import_resolution_cache = {}  # (import name, file language) -> imports_package edge target
+        self._string_pool = {}  # one shared copy of each package/ecosystem string stored on nodes
+        self._node_dist = np.empty(0, dtype=np.int32)  # adjacency row -> index into _dist_names, -1 for files
+        self._dist_names = []  # distribution names that package and component scores aggregate into
         self.centrality_calculator = CentralityCalculator(logger=logger)
 
         # Initialize instance-level edge weights from configuration so CLI overrides apply
@@ -61,6 +98,7 @@ class DependencyGraphBuilder:
         self.EDGE_W_IMPORTS_LOCAL = cfg.EDGE_W_IMPORTS_LOCAL
         self.EDGE_W_CONTAINS_COMPONENT = cfg.EDGE_W_CONTAINS_COMPONENT
         self.EDGE_W_USES_COMPONENT = cfg.EDGE_W_USES_COMPONENT
+        self._bind_edge_adders()  # rebound per build, so weights changed after __init__ still apply
 
     def build_dependency_graph(
         self, source_files, external_packages, file_imports, file_package_components, local_imports_map
@@ -80,6 +118,19 @@ class DependencyGraphBuilder:
             NetworkX directed graph
         """
         G = nx.DiGraph()
+        self._refresh_log_levels()
+        self._node_index = {}
+        self._edge_count = 0
+        self._allocate_edge_arrays(
+            sum(map(len, file_imports.values()))
+            + 2 * sum(map(len, file_package_components.values()))
+            + sum(map(len, local_imports_map.values()))
+        )
+        self._pending_edges = []
+        self._node_attrs = {}
+        self._import_resolution_cache = {}
+        self._string_pool = {}
+        self._bind_edge_adders()
 
         # Orchestration pipeline:
         # 1) Build import→distribution map
@@ -100,7 +151,7 @@ class DependencyGraphBuilder:
 
         self._add_file_nodes(G, source_files)
 
-        if self.logger:
+        if self._debug:
             self.logger.debug(f"Adding package nodes from distribution names")
         self.object_nodes.clear()
 
@@ -109,30 +160,48 @@ class DependencyGraphBuilder:
 
         # First create nodes for each unique distribution package
         self._add_external_package_nodes(G, external_packages)
+        self._import_prefixes = sorted(self.import_to_node)
 
         # Connect files directly to imported packages (overall file dependency)
         # This needs to run BEFORE _add_package_component_edges so that stdlib package nodes
         # and their entries in self.import_to_node are created
-        if self.logger:
+        if self._debug:
             self.logger.debug("Connecting files to directly imported packages")
         self._add_file_package_edges(G)
+        self._flush_edges(G)
 
         # Connect imported package components
-        if self.logger:
+        if self._debug:
             self.logger.debug("Connecting package components")
         self._add_package_component_edges(G)
+        self._flush_edges(G)
 
-        if self.logger:
+        if self._debug:
             self.logger.debug("Connecting local file imports")
         self._add_local_import_edges(G)
+        self._flush_edges(G)
 
         self.graph = G
+        nodelist, adjacency = self._build_adjacency(G)
+        self.centrality_calculator.set_adjacency(G, nodelist, adjacency)
+        self._index_distributions()
         if self.logger:
             self.logger.info(
                 f"... Dependency graph built with {G.number_of_nodes()} nodes and " f"{G.number_of_edges()} edges"
             )
         return G
 
+    def _refresh_log_levels(self):
+        """
+        Resolve which log levels the logger emits, once per build
+
+        Hot loops test these booleans so they skip building messages the logger would drop
+        """
+        logger = self.logger
+        self._debug = bool(logger) and logger.isEnabledFor(logging.DEBUG)
+        self._info = bool(logger) and logger.isEnabledFor(logging.INFO)
+        self._warn = bool(logger) and logger.isEnabledFor(logging.WARNING)
+
     def calculate_importance(self):
         """
         Calculate importance scores (PageRank or Katz) focusing on Package and PackageComponent nodes
@@ -173,44 +242,76 @@ class DependencyGraphBuilder:
             self.logger.error("Graph hasn't been built yet, cannot get node attributes")
             return []
 
-        # Accumulate importance scores by distribution name from the ranked_scores dictionary
-        package_scores = defaultdict(float)
-
-        # Iterate through the ranked nodes (packages and components)
-        for node, score in ranked_scores.items():
-            if not self.graph.has_node(node):
+        # Accumulate importance scores by distribution name with one scatter-add over node rows
+        index = self._node_index
+        count = len(ranked_scores)
+        rows = np.fromiter((index.get(node, -1) for node in ranked_scores), dtype=np.int64, count=count)
+        scores = np.fromiter(ranked_scores.values(), dtype=np.float64, count=count)
+        found = rows >= 0
+        if not found.all():
+            for node in itertools.compress(ranked_scores, ~found):
                 self.logger.warning(f"Node '{node}' from ranked_scores not found in graph, skipping")
-                continue
-
-            attrs = self.graph.nodes[node]
-            node_type = attrs.get("type")
 
-            if node_type in ("package", "package_component"):
-                # Use distribution_name for aggregating scores
-                # Fallback logic remains similar, using 'package' attribute or node ID itself if needed
-                dist = attrs.get("distribution_name", attrs.get("package", node))
-
-                package_scores[dist] += score
-                self.logger.debug(f"Adding score {score:.10f} to distribution '{dist}' from node '{node}'")
+        # Only package and package_component nodes carry a distribution
+        dist_ix = self._node_dist[rows[found]]
+        scores = scores[found]
+        is_object = dist_ix >= 0
+        dist_ix, scores = dist_ix[is_object], scores[is_object]
+        totals = np.zeros(len(self._dist_names), dtype=np.float64)
+        np.add.at(totals, dist_ix, scores)  # unbuffered, so sums accumulate in ranked_scores order
+
+        # Keep distributions in first-seen order so equal scores sort as before
+        seen, first = np.unique(dist_ix, return_index=True)
+        seen = seen[np.argsort(first)]
+        dist_names = self._dist_names
+        package_scores = dict(zip([dist_names[d] for d in seen.tolist()], totals[seen].tolist()))
+        if self._debug:
+            nodes = list(itertools.compress(ranked_scores, found))
+            for k in np.flatnonzero(is_object).tolist():
+                node = nodes[k]
+                self.logger.debug(
+                    f"Adding score {ranked_scores[node]:.10f} to distribution "
+                    f"'{dist_names[self._node_dist[index[node]]]}' from node '{node}'"
+                )
 
         if all_self_package_names is None:
             all_self_package_names = set()
 
-        self.logger.debug(f"Filtering scores. Filter set: {all_self_package_names}")
-        self.logger.debug(f"Package scores before filtering (sample): {dict(list(package_scores.items())[:20])}")
+        if self._debug:
+            self.logger.debug(f"Filtering scores. Filter set: {all_self_package_names}")
+            self.logger.debug(f"Package scores before filtering (sample): {dict(list(package_scores.items())[:20])}")
 
         filtered_scores = {
             pkg: score for pkg, score in package_scores.items() if score > 0 and pkg not in all_self_package_names
         }
 
-        self.logger.debug(f"Package scores after filtering (sample): {dict(list(filtered_scores.items())[:20])}")
+        if self._debug:
+            self.logger.debug(f"Package scores after filtering (sample): {dict(list(filtered_scores.items())[:20])}")
 
-        # Convert filtered scores to list and sort
-        scores_list = [(pkg, score) for pkg, score in filtered_scores.items()]
-        top_packages = sorted(scores_list, key=lambda x: x[1], reverse=True)
+        # Convert filtered scores to list and sort (stable, so ties keep first-seen order)
+        top_packages = sorted(filtered_scores.items(), key=lambda x: x[1], reverse=True)
 
         return top_packages
 
+    def _index_distributions(self):
+        """
+        Map every adjacency row to the distribution its node's score aggregates into
+
+        Package and package_component nodes map to their distribution_name (falling back
+        to the package attribute, then the node id); all other nodes map to -1
+        """
+        index = self._node_index
+        node_attrs = self._node_attrs
+        dist_ids = {}
+        node_dist = np.full(len(index), -1, dtype=np.int32)
+        for node in self.object_nodes:
+            attrs = node_attrs[node]
+            if attrs.get("type") in ("package", "package_component"):
+                dist = attrs.get("distribution_name", attrs.get("package", node))
+                node_dist[index[node]] = dist_ids.setdefault(dist, len(dist_ids))
+        self._node_dist = node_dist
+        self._dist_names = list(dist_ids)
+
     def _detect_language_from_filename(self, rel_path):
         """
         Return language inferred from rel_path, honoring .mjs/.cjs overrides
@@ -221,13 +322,11 @@ class DependencyGraphBuilder:
         Returns:
             Language name string inferred from filename or 'unknown'
         """
-        lang_result = filename_to_lang(rel_path)
-        language = lang_result if lang_result else "unknown"
-        if rel_path.endswith(".mjs"):
-            language = "javascript"
-        elif rel_path.endswith(".cjs"):
-            language = "javascript"
-        return language
+        basename = os.path.basename(rel_path)
+        if basename in PARSERS:  # whole-filename entries take precedence, as in filename_to_lang
+            return PARSERS[basename]
+        # Language depends only on the extension, so a many-file repo resolves a handful of keys
+        return _language_for_extension(os.path.splitext(basename)[1])
 
     def _stdlib_ecosystem_for_language(self, lang):
         """
@@ -252,18 +351,45 @@ class DependencyGraphBuilder:
             distribution_name (str): Distribution name to store on node
             import_names (list): Import names associated to the distribution
         """
-        G.add_node(
+        self._add_node(
+            G,
             node_id,
             type="package",
-            ecosystem=ecosystem,
-            distribution_name=distribution_name,
+            ecosystem=self._intern(ecosystem),
+            distribution_name=self._intern(distribution_name),
             import_names=import_names,
         )
         self.object_nodes.add(node_id)
 
+    def _intern(self, s):
+        """
+        Return the pooled copy of a string so repeated node attributes share one object
+
+        Args:
+            s (str): String to intern
+
+        Returns:
+            The first equal string seen during this build
+        """
+        return self._string_pool.setdefault(s, s)
+
+    def _add_node(self, G, node_id, **attrs):
+        """
+        Add or update a node and keep a direct reference to its attribute dict
+
+        Args:
+            G (networkx.DiGraph): Graph instance
+            node_id (str): Node identifier
+        """
+        G.add_node(node_id, **attrs)
+        self._node_attrs[node_id] = G.nodes[node_id]
+
     def _add_edge(self, G, src, dst, edge_type, weight, **attrs):
         """
-        Add a directed edge with uniform attributes
+        Queue a directed edge with uniform attributes; _flush_edges adds the batch to G
+
+        Both endpoints must already be nodes of G, so build phases never depend on
+        edges that are still pending
 
         Args:
             G (networkx.DiGraph): Graph instance
@@ -272,7 +398,128 @@ class DependencyGraphBuilder:
             edge_type (str): Edge type label
             weight (float): Edge weight
         """
-        G.add_edge(src, dst, weight=weight, type=edge_type, **attrs)
+        if attrs:
+            edge_attrs = {"weight": weight, "type": edge_type, **attrs}
+        else:
+            # _flush_edges copies attributes into each edge's own dict, so plain edges can share one
+            edge_attrs = self._shared_edge_attrs.get((edge_type, weight))
+            if edge_attrs is None:
+                edge_attrs = self._shared_edge_attrs[(edge_type, weight)] = {"weight": weight, "type": edge_type}
+        self._queue_edge(src, dst, edge_attrs, weight)
+
+    def _queue_edge(self, src, dst, edge_attrs, weight):
+        """
+        Queue an edge with a ready-made attribute dict and record it in the edge arrays
+
+        Args:
+            src (str): Source node id
+            dst (str): Destination node id
+            edge_attrs (dict): Attributes to store on the edge, including weight and type
+            weight (float): Edge weight recorded for the adjacency matrix
+        """
+        self._pending_edges.append((src, dst, edge_attrs))
+        index = self._node_index
+        i = self._edge_count
+        if i == len(self._edge_src):
+            self._allocate_edge_arrays(2 * i)
+        self._edge_src[i] = index.setdefault(src, len(index))
+        self._edge_dst[i] = index.setdefault(dst, len(index))
+        self._edge_w[i] = weight
+        self._edge_count = i + 1
+
+    def _bind_edge_adders(self):
+        """
+        Bind one edge adder per edge type with its label and current weight baked in
+
+        The build phases call these instead of _add_edge, so each edge skips the kwargs
+        merge and the shared-attrs lookup; plain edge types reuse a single attribute dict
+        """
+        queue = self._queue_edge
+
+        def plain_edge_adder(edge_type, weight):
+            edge_attrs = {"weight": weight, "type": edge_type}
+            return lambda src, dst: queue(src, dst, edge_attrs, weight)
+
+        def identified_edge_adder(edge_type, weight):
+            attrs_by_ident = {}  # many files import the same ident, so they share its attrs dict too
+
+            def add(src, dst, ident):
+                edge_attrs = attrs_by_ident.get(ident)
+                if edge_attrs is None:
+                    edge_attrs = attrs_by_ident[ident] = {"weight": weight, "type": edge_type, "ident": ident}
+                queue(src, dst, edge_attrs, weight)
+
+            return add
+
+        self._add_contains_component = plain_edge_adder(self.EDGE_T_CONTAINS_COMPONENT, self.EDGE_W_CONTAINS_COMPONENT)
+        self._add_imports_local = plain_edge_adder(self.EDGE_T_IMPORTS_LOCAL, self.EDGE_W_IMPORTS_LOCAL)
+        self._add_uses_component = identified_edge_adder(self.EDGE_T_USES_COMPONENT, self.EDGE_W_USES_COMPONENT)
+        self._add_imports_package = identified_edge_adder(self.EDGE_T_IMPORTS_PACKAGE, self.EDGE_W_IMPORTS_PACKAGE)
+
+    def _allocate_edge_arrays(self, capacity):
+        """
+        Size the edge arrays for at least capacity edges, keeping edges recorded so far
+
+        Args:
+            capacity (int): Expected number of edges
+        """
+        count = self._edge_count
+        capacity = max(capacity, count, 16)
+        for name in ("_edge_src", "_edge_dst", "_edge_w"):
+            old = getattr(self, name)
+            new = np.empty(capacity, dtype=old.dtype)
+            new[:count] = old[:count]
+            setattr(self, name, new)
+
+    def _flush_edges(self, G):
+        """
+        Add all queued edges to G in order, writing its adjacency dicts directly
+
+        Does what add_edges_from does for a DiGraph whose endpoints already exist (which
+        _add_edge guarantees): each new edge gets its own copy of the queued attrs, stored
+        under both the successor and predecessor entry, and a repeated edge updates the
+        existing dict. Skipping add_edges_from's per-edge node checks and tuple unpacking
+        roughly halves insert time on large graphs
+
+        Args:
+            G (networkx.DiGraph): Graph instance
+        """
+        succ, pred = G._succ, G._pred
+        for src, dst, edge_attrs in self._pending_edges:
+            nbrs = succ[src]
+            datadict = nbrs.get(dst)
+            if datadict is None:
+                nbrs[dst] = pred[dst][src] = edge_attrs.copy()
+            else:
+                datadict.update(edge_attrs)
+        clear_cache = getattr(nx, "_clear_cache", None)  # NetworkX >= 3.3 caches backend conversions
+        if clear_cache is not None:
+            clear_cache(G)
+        self._pending_edges.clear()
+
+    def _build_adjacency(self, G):
+        """
+        Materialize the edges recorded by _add_edge as a weighted CSR adjacency matrix
+
+        Args:
+            G (networkx.DiGraph): Graph the edges were added to
+
+        Returns:
+            Tuple (nodelist, csr) where row/column i of csr corresponds to nodelist[i]
+        """
+        index = self._node_index
+        for node in G:
+            index.setdefault(node, len(index))  # isolated nodes never passed through _add_edge
+        n = len(index)
+        count = self._edge_count
+        src, dst, weights = self._edge_src[:count], self._edge_dst[:count], self._edge_w[:count]
+
+        # A repeated edge overwrites the earlier one in the DiGraph, so keep each pair's last weight
+        keys = src.astype(np.int64) * n + dst
+        _, last_reversed = np.unique(keys[::-1], return_index=True)
+        keep = count - 1 - last_reversed
+        csr = sp.csr_array((weights[keep], (src[keep], dst[keep])), shape=(n, n))
+        return list(index), csr
 
     def _build_import_to_dist_map(self, external_packages):
         """
@@ -284,25 +531,29 @@ class DependencyGraphBuilder:
         Returns:
             dict mapping import names to distribution names
         """
-        # Gather candidate distributions per import name
-        candidates = defaultdict(set)
+        # Deterministically choose the lexicographically smallest distribution, keeping the
+        # running minimum per import name and collecting the other candidates only on a clash
+        import_to_dist = {}
+        ambiguous = {}  # import name -> distinct candidate distributions, in arrival order
         for dist, pkg_data in external_packages.items():
             import_names = pkg_data.get("import_names", []) or [dist]
             for imp in import_names:
-                candidates[imp].add(dist)
-
-        # Deterministically choose the lexicographically smallest distribution
-        import_to_dist = {}
-        self._ambiguous_choices = {}
-        for imp, dists in candidates.items():
-            sorted_cands = sorted(dists)
-            chosen = sorted_cands[0]
-            import_to_dist[imp] = chosen
-            if len(sorted_cands) > 1:
-                self._ambiguous_choices[imp] = {
-                    "chosen": chosen,
-                    "candidates": sorted_cands,
-                }
+                prev = import_to_dist.get(imp)
+                if prev is None:
+                    import_to_dist[imp] = dist
+                    continue
+                seen = ambiguous.get(imp)
+                if dist == prev or (seen and seen[-1] == dist):
+                    continue  # import name repeated within one distribution
+                if seen is None:
+                    seen = ambiguous[imp] = [prev]
+                seen.append(dist)
+                if dist < prev:
+                    import_to_dist[imp] = dist
+
+        self._ambiguous_choices = {
+            imp: {"chosen": import_to_dist[imp], "candidates": sorted(dists)} for imp, dists in ambiguous.items()
+        }
 
         # Log one standardized warning per ambiguous import
         if self.logger and self._ambiguous_choices:
@@ -312,7 +563,7 @@ class DependencyGraphBuilder:
                     f"Ambiguous import '{imp}' has candidates: {cand_list}; choosing '{info['chosen']}' by lexicographic rule"
                 )  # noqa
 
-        if self.logger:
+        if self._debug:
             self.logger.debug(f"Created import-to-distribution mapping with {len(import_to_dist)} entries")
         return import_to_dist
 
@@ -324,17 +575,23 @@ class DependencyGraphBuilder:
             G (networkx.DiGraph): Graph instance
             source_files (dict): Map of relative path -> absolute path
         """
-        all_files = set(source_files.keys())
-        for rel_path in all_files:
-            abs_path = source_files.get(rel_path)
+        rel_paths = []
+        for rel_path, abs_path in source_files.items():
             if not abs_path:
-                if self.logger:
+                if self._warn:
                     self.logger.warning(f"Absolute path not found for {rel_path}, skipping file node")
                 continue
-
-            language = self._detect_language_from_filename(rel_path)
-            G.add_node(rel_path, type="file", language=language)
-            if self.logger:
+            rel_paths.append(rel_path)
+
+        # Detection is a cached per-extension lookup, so one serial pass beats fanning out to threads
+        languages = list(map(self._detect_language_from_filename, rel_paths))
+        G.add_nodes_from((rel_path, {"type": "file", "language": lang}) for rel_path, lang in zip(rel_paths, languages))
+        # Pool the node ids so edges from the import maps key on these objects, not equal copies
+        self._string_pool.update(zip(rel_paths, rel_paths))
+        nodes = G.nodes
+        self._node_attrs.update((rel_path, nodes[rel_path]) for rel_path in rel_paths)
+        if self._debug:
+            for rel_path, language in zip(rel_paths, languages):
                 self.logger.debug(f"Added file node: {rel_path} (lang: {language})")
 
     def _add_external_package_nodes(self, G, external_packages):
@@ -346,8 +603,9 @@ class DependencyGraphBuilder:
             external_packages (dict): External packages metadata
         """
         for dist_name, pkg_data in external_packages.items():
-            ecosystem = pkg_data.get("ecosystem", "unknown")
-            G.add_node(
+            ecosystem = self._intern(pkg_data.get("ecosystem", "unknown"))
+            self._add_node(
+                G,
                 dist_name,
                 type="package",
                 ecosystem=ecosystem,
@@ -355,16 +613,32 @@ class DependencyGraphBuilder:
                 import_names=pkg_data.get("import_names", [dist_name]),
             )
             self.object_nodes.add(dist_name)
-            if self.logger:
+            if self._debug:
                 self.logger.debug(f"Added package node: {dist_name} (ecosystem: {ecosystem})")
 
             for import_name in pkg_data.get("import_names", [dist_name]):
                 # Respect deterministic import->distribution resolution if present
                 resolved_dist = self.import_to_dist.get(import_name, dist_name)
                 self.import_to_node[import_name] = resolved_dist
-                if self.logger:
+                if self._debug:
                     self.logger.debug(f"Mapped import '{import_name}' to distribution node '{resolved_dist}'")
 
+    def _map_import(self, import_name, node_id):
+        """
+        Map an import name to a package node, keeping the sorted prefix index in sync
+
+        Args:
+            import_name (str): Import identifier
+            node_id (str): Package node id
+        """
+        previous = self.import_to_node.get(import_name)
+        if previous is None:
+            bisect.insort(self._import_prefixes, import_name)
+        elif previous != node_id:
+            # Remapping (e.g. 'fs' once 'node:fs' creates the fs node) invalidates memoized resolutions
+            self._import_resolution_cache.clear()
+        self.import_to_node[import_name] = node_id
+
     def _resolve_dist_node_for_import(self, package_name):
         """
         Return mapped distribution node id for an import name, applying
@@ -379,14 +653,28 @@ class DependencyGraphBuilder:
         node = self.import_to_node.get(package_name)
         if node:
             return node
-        if "/" in package_name:
-            prefix = package_name
-            while "/" in prefix:
-                prefix = prefix.rsplit("/", 1)[0]
-                node = self.import_to_node.get(prefix)
+
+        keys = self._import_prefixes
+        name = package_name
+        while True:
+            # The largest key below name is the longest mapped prefix whenever it is a prefix at all
+            i = bisect.bisect_left(keys, name)
+            if i == 0:
+                return None
+            candidate = keys[i - 1]
+            if name.startswith(candidate) and name[len(candidate)] == "/":
+                node = self.import_to_node.get(candidate)
                 if node:
                     return node
-        return None
+            # Any shorter mapped prefix also prefixes candidate, so cut name back to the
+            # deepest "/" inside their common prefix and search again
+            cut = name.rfind("/", 0, len(os.path.commonprefix([candidate, name])) + 1)
+            if cut <= 0:
+                return None
+            name = name[:cut]
+            node = self.import_to_node.get(name)
+            if node:
+                return node
 
     def _ensure_stdlib_node_if_needed(self, G, file_path, package_name):
         """
@@ -400,13 +688,13 @@ class DependencyGraphBuilder:
         Returns:
             Tuple (dist_node, dist_node_for_edge, ecosystem)
         """
-        file_lang = G.nodes[file_path].get("language", "unknown")
+        file_lang = self._node_attrs[file_path].get("language", "unknown")
         ecosystem = "unknown"
         # Language-aware stdlib classification
         if file_lang == "go":
             # Only mark Go stdlib when first path segment has no dot
-            first_seg = package_name.split("/", 1)[0]
-            if "." not in first_seg:
+            slash = package_name.find("/")
+            if "." not in (package_name if slash < 0 else package_name[:slash]):
                 ecosystem = self._stdlib_ecosystem_for_language(file_lang)
         elif file_lang == "python":
             ecosystem = self._stdlib_ecosystem_for_language(file_lang)
@@ -419,10 +707,10 @@ class DependencyGraphBuilder:
         elif file_lang == "typescript":
             ecosystem = self._stdlib_ecosystem_for_language(file_lang)
         self._create_package_node(G, package_name, ecosystem, package_name, [package_name])
-        self.import_to_node[package_name] = package_name
+        self._map_import(package_name, package_name)
         dist_node = package_name
         dist_node_for_edge = dist_node
-        if self.logger:
+        if self._debug:
             self.logger.debug(
                 f"Created {'stdlib' if ecosystem.endswith('_stdlib') else 'unknown'} package node: "
                 f"{package_name} (ecosystem: {ecosystem})"
@@ -444,7 +732,7 @@ class DependencyGraphBuilder:
         ecosystem = self.external_packages[package_name].get("ecosystem", "npm")
         import_names_attr = self.external_packages[package_name].get("import_names", [package_name])
         self._create_package_node(G, node_id_to_add, ecosystem, distribution_name_attr, import_names_attr)
-        self.import_to_node[package_name] = node_id_to_add
+        self._map_import(package_name, node_id_to_add)
 
     def _ensure_unknown_or_stdlib_node_if_missing(self, G, package_name, dist_node, dist_node_for_edge, ecosystem):
         """
@@ -465,12 +753,12 @@ class DependencyGraphBuilder:
 
         self._create_package_node(G, node_id_to_add, ecosystem, distribution_name_attr, import_names_attr)
         if dist_node == "node:fs":
-            self.import_to_node["fs"] = node_id_to_add
-            self.import_to_node["node:fs"] = node_id_to_add
+            self._map_import("fs", node_id_to_add)
+            self._map_import("node:fs", node_id_to_add)
         else:
-            self.import_to_node[package_name] = node_id_to_add
+            self._map_import(package_name, node_id_to_add)
 
-        if self.logger:
+        if self._debug:
             self.logger.debug(
                 f"Created {'stdlib' if str(ecosystem).endswith('_stdlib') else 'unknown'} package node: "
                 f"{node_id_to_add} (ecosystem: {ecosystem})"
@@ -481,17 +769,18 @@ class DependencyGraphBuilder:
         """
         Add file -> imports_package -> package edge using internal constants
         """
-        edge_attrs = {"ident": package_name}
         if package_name in self._ambiguous_choices:
-            edge_attrs["ambiguity_resolution"] = "lexicographic"
-        self._add_edge(
-            G,
-            file_path,
-            dist_node_for_edge,
-            self.EDGE_T_IMPORTS_PACKAGE,
-            self.EDGE_W_IMPORTS_PACKAGE,
-            **edge_attrs,
-        )
+            self._add_edge(
+                G,
+                file_path,
+                dist_node_for_edge,
+                self.EDGE_T_IMPORTS_PACKAGE,
+                self.EDGE_W_IMPORTS_PACKAGE,
+                ident=package_name,
+                ambiguity_resolution="lexicographic",
+            )
+        else:
+            self._add_imports_package(file_path, dist_node_for_edge, package_name)
 
     def _resolve_distribution_context(self, G, pkg_name):
         """
@@ -505,13 +794,13 @@ class DependencyGraphBuilder:
         if not dist_node:
             if pkg_name in self.external_packages:
                 dist_node = pkg_name
-                if self.logger:
+                if self._debug:
                     self.logger.debug(
                         f"Package '{pkg_name}' not found in import_to_node mapping, "
                         f"using as its own distribution node"
                     )
             else:
-                if self.logger:
+                if self._debug:
                     self.logger.debug(
                         f"Skipping unknown package '{pkg_name}' " f"(not found in import_to_node or external_packages)"
                     )
@@ -519,8 +808,8 @@ class DependencyGraphBuilder:
 
         dist = dist_node
         ecosystem = "unknown"
-        if G.has_node(dist_node):
-            node_attrs = G.nodes[dist_node]
+        node_attrs = self._node_attrs.get(dist_node)
+        if node_attrs is not None:
             dist = node_attrs.get("distribution_name", dist_node)
             ecosystem = node_attrs.get("ecosystem", "unknown")
         return dist_node, dist, ecosystem
@@ -529,62 +818,49 @@ class DependencyGraphBuilder:
         """
         Normalize component identifier and return (final_component_node_id, simple_name_for_attr)
         """
-        simple_name_for_attr = component_name_from_visitor
-        base_component_path = component_name_from_visitor
-        normalized_component_path = component_name_from_visitor
-
-        if " as " in normalized_component_path:
-            normalized_component_path = normalized_component_path.split(" as ")[0].strip()
-
-        if " {" in normalized_component_path and normalized_component_path.endswith("}"):
-            normalized_component_path = normalized_component_path.split(" {")[0].strip()
-
-        if normalized_component_path.endswith(".sol") and (
-            "/" in normalized_component_path or "." in normalized_component_path
-        ):
-            normalized_component_path = normalized_component_path[:-4]
-
-        if normalized_component_path.startswith(pkg_name + "."):
-            base_component_path = normalized_component_path[len(pkg_name) + 1 :]
-        else:
-            base_component_path = normalized_component_path
-
-        if not base_component_path:
-            return None, simple_name_for_attr
-
-        if normalized_component_path.startswith(pkg_name + "."):
-            full_component_name = normalized_component_path
-        elif normalized_component_path.startswith(pkg_name + "::"):
-            full_component_name = normalized_component_path
-        else:
-            full_component_name = f"{pkg_name}.{base_component_path}"
-
-        return full_component_name, simple_name_for_attr
+        path = component_name_from_visitor
+
+        # Drop an alias ("X as Y"), then a trailing member list ("X {a, b}"), slicing once each
+        cut = path.find(" as ")
+        if cut >= 0:
+            path = path[:cut].strip()
+        if path.endswith("}"):
+            cut = path.find(" {")
+            if cut >= 0:
+                path = path[:cut].strip()
+        if path.endswith(".sol"):
+            path = path[:-4]
+
+        dotted_prefix = pkg_name + "."
+        if path.startswith(dotted_prefix):
+            if len(path) == len(dotted_prefix):
+                return None, component_name_from_visitor
+            return path, component_name_from_visitor
+        if not path:
+            return None, component_name_from_visitor
+        if path.startswith(pkg_name + "::"):
+            return path, component_name_from_visitor
+        return f"{dotted_prefix}{path}", component_name_from_visitor
 
     def _ensure_component_node_and_contains_edge(self, G, component_node_id, pkg_name, dist, ecosystem, simple_name):
         """
         Ensure component node exists and add contains_component edge from the package distribution
         """
         if not G.has_node(component_node_id):
-            G.add_node(
+            self._add_node(
+                G,
                 component_node_id,
                 type="package_component",
-                package=pkg_name,
-                distribution_name=dist,
-                ecosystem=ecosystem,
+                package=self._intern(pkg_name),
+                distribution_name=self._intern(dist),
+                ecosystem=self._intern(ecosystem),
                 component=simple_name,
             )
             self.object_nodes.add(component_node_id)
             dist_node_for_contains = self.import_to_node.get(pkg_name, pkg_name)
             if G.has_node(dist_node_for_contains):
-                self._add_edge(
-                    G,
-                    dist_node_for_contains,
-                    component_node_id,
-                    self.EDGE_T_CONTAINS_COMPONENT,
-                    self.EDGE_W_CONTAINS_COMPONENT,
-                )
-            if self.logger:
+                self._add_contains_component(dist_node_for_contains, component_node_id)
+            if self._debug:
                 self.logger.debug(
                     f"Added component node: {component_node_id} " f"(for package {pkg_name}, distribution {dist})"
                 )
@@ -593,16 +869,10 @@ class DependencyGraphBuilder:
         """
         Add file -> uses_component -> component edge if both nodes exist
         """
-        if G.has_node(file_path) and G.has_node(component_node_id):
-            self._add_edge(
-                G,
-                file_path,
-                component_node_id,
-                self.EDGE_T_USES_COMPONENT,
-                self.EDGE_W_USES_COMPONENT,
-                ident=component_ident,
-            )
-            if self.logger:
+        nodes = G._node  # the dict G.has_node wraps
+        if file_path in nodes and component_node_id in nodes:
+            self._add_uses_component(file_path, component_node_id, component_ident)
+            if self._debug:
                 self.logger.debug(f"Added file-to-component edge: {file_path} -> {component_node_id}")
 
     def _add_package_component_edges(self, G):
@@ -616,20 +886,26 @@ class DependencyGraphBuilder:
         Args:
             G (networkx.DiGraph): NetworkX graph to add edges to
         """
-        if self.logger:
+        if self._debug:
             self.logger.debug(f"Processing package components for {len(self.file_package_components)} files")
+        # The same (package, component) pairs recur across many files; normalize each once
+        normalized_components = {}
         for file_path, components in self.file_package_components.items():
             if not G.has_node(file_path):
                 continue
+            file_path = self._intern(file_path)
 
             for pkg_name, component_name_from_visitor in components:
+                component_key = (pkg_name, component_name_from_visitor)
                 dist_node, dist, ecosystem = self._resolve_distribution_context(G, pkg_name)
                 if not dist_node:
                     continue
 
-                final_component_node_id, simple_name_for_attr = self._normalize_component_identifier(
-                    pkg_name, component_name_from_visitor
-                )
+                normalized = normalized_components.get(component_key)
+                if normalized is None:
+                    normalized = self._normalize_component_identifier(pkg_name, component_name_from_visitor)
+                    normalized_components[component_key] = normalized
+                final_component_node_id, simple_name_for_attr = normalized
                 if not final_component_node_id:
                     continue
 
@@ -656,126 +932,159 @@ class DependencyGraphBuilder:
         Args:
             G (networkx.DiGraph): NetworkX graph to add edges to
         """
+        # Resolution depends only on the import name and the importing file's language (the
+        # first resolution maps the name, so later files would land on the same node anyway)
+        resolved = self._import_resolution_cache
         for file_path, package_names in self.file_imports.items():
             if not G.has_node(file_path):
                 continue
+            file_path = self._intern(file_path)
 
+            file_lang = self._node_attrs[file_path].get("language", "unknown")
             for package_name in package_names:
-                dist_node = self._resolve_dist_node_for_import(package_name)
-                dist_node_for_edge = dist_node
-                ecosystem = None
-
-                if not dist_node:
-                    if package_name in self.external_packages:
-                        dist_node = package_name
-                        dist_node_for_edge = dist_node
-                        if self.logger:
-                            self.logger.warning(
-                                f"Package '{package_name}' in external_packages " f"but not in import_to_node mapping"
-                            )
-                    else:
-                        # JavaScript/TypeScript heuristic: map unknown '@scope/foo' to '@scope/core' if present
-                        file_lang = G.nodes[file_path].get("language", "unknown")
-                        if file_lang in ("javascript", "typescript") and package_name.startswith("@"):
-                            parts = package_name.split("/")
-                            if len(parts) >= 2:
-                                scope = parts[0]
-                                core_candidate = f"{scope}/core"
-                                if core_candidate in self.external_packages:
-                                    dist_node = core_candidate
-                                    dist_node_for_edge = dist_node
-                                    # Cache this resolution to avoid repeating work
-                                    self.import_to_node[package_name] = dist_node
-                                    if self.logger:
-                                        self.logger.debug(
-                                            f"Mapped unknown scoped import '{package_name}' to '{dist_node}' via '@scope/core' heuristic"  # noqa
-                                        )
-                        if not dist_node:
-                            dist_node, dist_node_for_edge, ecosystem = self._ensure_stdlib_node_if_needed(
-                                G, file_path, package_name
-                            )
-
-                if dist_node == "node:fs":
-                    dist_node_for_edge = self._normalize_node_fs_target(dist_node)
-
-                if not G.has_node(dist_node_for_edge):
-                    if package_name in self.external_packages:
-                        self._ensure_external_package_node_if_missing(G, package_name, dist_node)
-                    else:
-                        dist_node_for_edge = self._ensure_unknown_or_stdlib_node_if_missing(
-                            G, package_name, dist_node, dist_node_for_edge, ecosystem
-                        )
+                dist_node_for_edge = resolved.get((package_name, file_lang))
+                if dist_node_for_edge is None:
+                    dist_node_for_edge = self._resolve_and_ensure_package_node(G, file_path, package_name, file_lang)
+                    resolved[(package_name, file_lang)] = dist_node_for_edge
 
                 self._add_imports_package_edge(G, file_path, dist_node_for_edge, package_name)
-                self.logger.debug(
-                    f"Added imports_package edge: {file_path} -> {dist_node_for_edge} (import: {package_name})"
-                )
+                if self._debug:
+                    self.logger.debug(
+                        f"Added imports_package edge: {file_path} -> {dist_node_for_edge} (import: {package_name})"
+                    )
 
-    def _ensure_file_node_if_missing(self, G, rel_path, importing_file):
+    def _resolve_and_ensure_package_node(self, G, file_path, package_name, file_lang):
         """
-        Ensure a file node exists for a locally imported file; log accordingly
+        Resolve the package node an import should point to, creating it when missing
 
-        Returns True if the node exists or was created; False to skip
+        Args:
+            G (networkx.DiGraph): Graph instance
+            file_path (str): File path importing the package
+            package_name (str): Import name
+            file_lang (str): Language of the importing file
+
+        Returns:
+            Node id for the imports_package edge target
         """
-        if not G.has_node(rel_path):
-            if rel_path in self.source_files:
-                lang_result = filename_to_lang(rel_path)
-                language = lang_result if lang_result else "unknown"
-                G.add_node(rel_path, type="file", language=language)
-                if self.logger:
-                    self.logger.info(
-                        f"Locally imported file '{rel_path}' (from '{importing_file}') not found in graph. Adding it now."  # noqa
+        dist_node = self._resolve_dist_node_for_import(package_name)
+        dist_node_for_edge = dist_node
+        ecosystem = None
+
+        if not dist_node:
+            if package_name in self.external_packages:
+                dist_node = package_name
+                dist_node_for_edge = dist_node
+                if self._warn:
+                    self.logger.warning(
+                        f"Package '{package_name}' in external_packages " f"but not in import_to_node mapping"
                     )
             else:
-                if self.logger:
-                    self.logger.warning(
-                        f"Locally imported file '{rel_path}' (from '{importing_file}') not found in source files or graph."  # noqa
+                # JavaScript/TypeScript heuristic: map unknown '@scope/foo' to '@scope/core' if present
+                if file_lang in ("javascript", "typescript") and package_name.startswith("@"):
+                    slash = package_name.find("/")
+                    if slash >= 0:
+                        core_candidate = f"{package_name[:slash]}/core"
+                        if core_candidate in self.external_packages:
+                            dist_node = core_candidate
+                            dist_node_for_edge = dist_node
+                            # Cache this resolution to avoid repeating work
+                            self._map_import(package_name, dist_node)
+                            if self._debug:
+                                self.logger.debug(
+                                    f"Mapped unknown scoped import '{package_name}' to '{dist_node}' via '@scope/core' heuristic"  # noqa
+                                )
+                if not dist_node:
+                    dist_node, dist_node_for_edge, ecosystem = self._ensure_stdlib_node_if_needed(
+                        G, file_path, package_name
                     )
-                return False
-        return True
 
-    def _add_local_import_edge(self, G, importing_file, imported_file):
+        if dist_node == "node:fs":
+            dist_node_for_edge = self._normalize_node_fs_target(dist_node)
+
+        if not G.has_node(dist_node_for_edge):
+            if package_name in self.external_packages:
+                self._ensure_external_package_node_if_missing(G, package_name, dist_node)
+            else:
+                dist_node_for_edge = self._ensure_unknown_or_stdlib_node_if_missing(
+                    G, package_name, dist_node, dist_node_for_edge, ecosystem
+                )
+        return dist_node_for_edge
+
+    def _missing_file_node_attrs(self, rel_path, importing_file):
         """
-        Add a local import edge using internal constants and preserve debug log
+        Return attributes for a locally imported file that has no node yet; log accordingly
+
+        Args:
+            rel_path (str): Imported file path
+            importing_file (str): File path that imports it
+
+        Returns:
+            Node attribute dict when rel_path is a known source file, else None to skip the import
         """
-        self._add_edge(
-            G,
-            importing_file,
-            imported_file,
-            self.EDGE_T_IMPORTS_LOCAL,
-            self.EDGE_W_IMPORTS_LOCAL,
-        )
-        if self.logger:
-            self.logger.debug(f"Added local import edge: {importing_file} -> {imported_file}")
+        if rel_path in self.source_files:
+            if self._info:
+                self.logger.info(
+                    f"Locally imported file '{rel_path}' (from '{importing_file}') not found in graph. Adding it now."  # noqa
+                )
+            return {"type": "file", "language": self._detect_language_from_filename(rel_path)}
+        if self._warn:
+            self.logger.warning(
+                f"Locally imported file '{rel_path}' (from '{importing_file}') not found in source files or graph."  # noqa
+            )
+        return None
 
     def _add_local_import_edges(self, G):
         """
         Add edges between files for local imports
 
         Creates file -> imports_local -> file relationships for intra-repository dependencies
-        Creates missing file nodes as needed for imported local files
+        Creates missing file nodes as needed for imported local files, in one add_nodes_from
+        call ahead of the phase's bulk edge flush
 
         Args:
             G (networkx.DiGraph): NetworkX graph to add edges to
         """
-        added_edges = 0
+        # Bind everything the per-edge loop touches to locals; membership tests read NetworkX's
+        # node dict (what G.has_node wraps) directly to skip a call frame per import
+        nodes = G._node
+        missing_file_node_attrs = self._missing_file_node_attrs
+        add_edge = self._add_imports_local
+        debug = self.logger.debug if self._debug else None
+        intern = self._intern
+
+        new_files = {}  # imported file -> attrs of a file node created after the walk
+        queued_before = len(self._pending_edges)
+        # One C-level pass finds importers without a node; set.difference only probes a plain
+        # dict directly, which is another reason to hold the node dict rather than G.nodes
+        absent_importers = set(self.local_imports_map).difference(nodes)
         for importing_file, imported_files in self.local_imports_map.items():
-            if not G.has_node(importing_file):
-                if self.logger:
+            if importing_file in absent_importers and importing_file not in new_files:
+                if self._warn:
                     self.logger.warning(
                         f"Importing file '{importing_file}' not found in graph, skipping local imports."
                     )
                 continue
 
-            for imported_file in imported_files:
-                if not self._ensure_file_node_if_missing(G, imported_file, importing_file):
-                    continue
+            importing_file = intern(importing_file)
+            # A module imported by several statements yields one edge; queue it once
+            for imported_file in dict.fromkeys(imported_files):
+                imported_file = intern(imported_file)
+                if imported_file not in nodes and imported_file not in new_files:
+                    attrs = missing_file_node_attrs(imported_file, importing_file)
+                    if attrs is None:
+                        continue
+                    new_files[imported_file] = attrs
 
-                self._add_local_import_edge(G, importing_file, imported_file)
-                added_edges += 1
+                add_edge(importing_file, imported_file)
+                if debug is not None:
+                    debug(f"Added local import edge: {importing_file} -> {imported_file}")
 
-        if self.logger:
-            self.logger.debug(f"Added {added_edges} local import edges")
+        if new_files:
+            G.add_nodes_from(new_files.items())
+            self._node_attrs.update((rel_path, nodes[rel_path]) for rel_path in new_files)
+
+        if self._debug:
+            self.logger.debug(f"Added {len(self._pending_edges) - queued_before} local import edges")
 
     def get_graph_data(self):
         """
@@ -786,21 +1095,55 @@ class DependencyGraphBuilder:
             or empty dict if no graph has been built
         """
         if self.graph:
-            data = nx.node_link_data(self.graph)
-            if cfg.SERIALIZE_SORT_KEYS:
-                # Sort nodes by (type, id) and links by (type, source, target, ident)
-                nodes = data.get("nodes", [])
-                links = data.get("links", [])
-                nodes.sort(key=lambda n: (str(n.get("type", "")), str(n.get("id", ""))))
-                links.sort(
-                    key=lambda e: (
-                        str(e.get("type", "")),
-                        str(e.get("source", "")),
-                        str(e.get("target", "")),
-                        str(e.get("ident", "")),
-                    )
-                )
-                data["nodes"] = nodes
-                data["links"] = links
-            return data
+            return self._serialize_graph(self.graph, sort=cfg.SERIALIZE_SORT_KEYS)
         return {}
+
+    @staticmethod
+    def _graph_items(G, sort):
+        """
+        Return the graph's nodes and edges as references to its own attribute dicts
+
+        Sorting orders these (id, attrs) and (source, target, attrs) tuples before any
+        node-link dict is built: nodes by (type, id), links by (type, source, target, ident)
+
+        Args:
+            G (networkx.DiGraph): Graph to walk
+            sort (bool): Whether to return nodes and links in serialization order
+
+        Returns:
+            Tuple (nodes, links) of iterables
+        """
+        nodes = G.nodes(data=True)
+        links = ((src, dst, attrs) for src, nbrs in G.adjacency() for dst, attrs in nbrs.items())
+        if sort:
+            nodes = sorted(nodes, key=lambda n: (str(n[1].get("type", "")), str(n[0])))
+            links = sorted(
+                links,
+                key=lambda e: (str(e[2].get("type", "")), str(e[0]), str(e[1]), str(e[2].get("ident", ""))),
+            )
+        return nodes, links
+
+    @classmethod
+    def _serialize_graph(cls, G, sort=False):
+        """
+        Convert the dependency DiGraph to node-link data
+
+        Produces the same structure as networkx.node_link_data for a DiGraph, walking
+        the node and adjacency dicts directly instead of going through its generic
+        multigraph and custom-key handling
+
+        Args:
+            G (networkx.DiGraph): Graph to serialize
+            sort (bool): Emit nodes and links already in get_graph_data's sorted order
+
+        Returns:
+            Dictionary with directed, multigraph, graph, nodes and links entries
+        """
+        nodes, links = cls._graph_items(G, sort)
+        return {
+            "directed": True,
+            "multigraph": False,
+            "graph": G.graph,
+            "nodes": [{**attrs, "id": node} for node, attrs in nodes],
+            "links": [{**attrs, "source": src, "target": dst} for src, dst, attrs in links],
+        }
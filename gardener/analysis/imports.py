@@ -6,10 +6,13 @@ local path resolution, and a file walker that extracts external and local import
 using tree‑sitter parsers
 """
 
+import itertools
 import logging
 import os
+import posixpath
 import signal
 from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
 from contextlib import contextmanager
 from pathlib import Path
 
@@ -19,6 +22,58 @@ from gardener.common.tsl import get_parser
 JS_TS_SOURCE_EXTS = [".js", ".jsx", ".ts", ".tsx", ".mjs", ".cjs"]
 JSONLIKE_EXTS = [".json"]
 
+# How a legacy tsconfig `paths` target template is filled in with the wildcard part of an import
+_TARGET_LITERAL, _TARGET_DIR_WILDCARD, _TARGET_WILDCARD, _TARGET_UNSUPPORTED = range(4)
+_KNOWN_JS_EXTS = tuple(JS_TS_SOURCE_EXTS + JSONLIKE_EXTS)
+
+
+def _pathstr(path):
+    """
+    Return str(Path(path)) for a POSIX path without building a Path
+
+    Collapses repeated slashes and "." segments and drops a trailing slash; ".." is kept
+    """
+    if (
+        path
+        and "//" not in path
+        and "/./" not in path
+        and not path.endswith("/")
+        and not path.startswith("./")
+        and not path.endswith("/.")
+        and path != "."
+    ):
+        return path
+    root = "//" if path.startswith("//") and not path.startswith("///") else "/" if path.startswith("/") else ""
+    return root + "/".join(part for part in path.split("/") if part and part != ".") or "."
+
+
+def _join(*parts):
+    """
+    Return str(Path(*parts)) without building a Path
+    """
+    return _pathstr(posixpath.join(*parts)) if parts else "."
+
+
+def _parent(path):
+    """
+    Return str(Path(path).parent) without building a Path
+    """
+    path = _pathstr(path)
+    head, sep, _ = path.rpartition("/")
+    if not sep:
+        return "."
+    if not head.strip("/"):
+        return path[: len(head) + 1]
+    return head
+
+
+def _name(path):
+    """
+    Return Path(path).name without building a Path
+    """
+    name = _pathstr(path).rpartition("/")[2]
+    return "" if name == "." else name
+
 
 class TimeoutError(Exception):
     """
@@ -87,23 +142,87 @@ class LocalImportResolver:
         self.go_module_path = go_module_path
         self.remappings = remappings or {}
         self.hardhat_remappings = hardhat_remappings or {}
+        # Longest prefix first, as solc applies remappings; ties keep their configured order
+        self._remappings_by_length = self._sort_remappings(self.remappings)
+        self._hardhat_remappings_by_length = self._sort_remappings(self.hardhat_remappings)
         self.solidity_src_path = solidity_src_path
         self.logger = logger
 
+        # Legacy tsconfig `paths` keyed by the literal part of each pattern, so a lookup probes the
+        # prefixes of the import instead of scanning every alias
+        self._js_alias_exact = {}
+        self._js_alias_dir_prefixes = {}  # "prefix/*" patterns
+        self._js_alias_prefixes = {}  # "prefix*" patterns
+        for order, (alias_pattern, targets) in enumerate(self.js_ts_path_aliases.items()):
+            targets = self._classify_alias_targets(targets)
+            if "*" not in alias_pattern:
+                self._js_alias_exact[alias_pattern] = (order, targets)
+            elif alias_pattern.endswith("/*"):
+                self._js_alias_dir_prefixes[alias_pattern[:-2]] = (order, targets)
+            elif alias_pattern.endswith("*"):
+                self._js_alias_prefixes[alias_pattern[:-1]] = (order, targets)
+        self._js_alias_dir_prefix_lengths = sorted({len(prefix) for prefix in self._js_alias_dir_prefixes})
+        self._js_alias_prefix_lengths = sorted({len(prefix) for prefix in self._js_alias_prefixes})
+
+        # Lookup maps over source_files; resolvers register files as they find them, so these are
+        # extended lazily by _index_new_sources
+        self._sources_by_stem = {}  # path before each extension -> {extension: source path}
+        self._index_files_by_dir = {}  # directory -> {extension: its index file}
+        self._go_files_by_dir = {}  # directory -> .go sources below it
+        self._rust_files_by_module = {}  # "a/b" -> "a/b.rs"
+        self._rust_mod_files_by_dir = {}  # "a/b" -> "a/b/mod.rs"
+        self._indexed_sources = 0
+
+        self._resolve_cache = {}
+        self._js_extensions_cache = {}  # module string -> extensions to try
+        self._importing_dirs = {}  # importing file -> (its directory, its absolute directory)
+        self._disk_file_cache = {}  # absolute path -> os.path.isfile result
+
+    def _importing_dir(self, importing_file_rel_path):
+        """
+        Return (str(Path(file).parent), its absolute counterpart) for an importing file, computed once per file
+        """
+        dirs = self._importing_dirs.get(importing_file_rel_path)
+        if dirs is None:
+            dirs = self._importing_dirs[importing_file_rel_path] = (
+                _parent(importing_file_rel_path),
+                _parent(_join(self.repo_path, importing_file_rel_path)),
+            )
+        return dirs
+
+    def _cached_resolve(self, key, resolve, *args):
+        """
+        Return resolve(*args), memoized on key
+
+        Args:
+            key (tuple): Everything besides source_files the resolution depends on
+            resolve (callable): Uncached resolver
+            *args: Arguments for resolve
+
+        Returns:
+            str|None: Resolved path
+        """
+        # Resolvers may register files they find on disk, which can change later answers
+        key += (len(self.source_files),)
+        try:
+            return self._resolve_cache[key]
+        except KeyError:
+            resolved = self._resolve_cache[key] = resolve(*args)
+            return resolved
+
     # --- Python helpers ---
     def _py_is_invalid_blank_absolute(self, module_str, level):
         return not module_str and level == 0
 
     def _py_base_dir_for_relative(self, importing_file_rel_path, level):
-        importing_file_rel_path_norm = str(Path(importing_file_rel_path))
-        base_dir = str(Path(importing_file_rel_path_norm).parent)
+        base_dir = self._importing_dir(importing_file_rel_path)[0]
         if level <= 0:
             return base_dir
         current_dir = base_dir
         for _ in range(level - 1):
             if current_dir == "":
                 return None
-            current_dir = str(Path(current_dir).parent)
+            current_dir = _parent(current_dir)
         return current_dir
 
     def _py_target_paths(self, importing_file_rel_path, module_str, level):
@@ -111,28 +230,26 @@ class LocalImportResolver:
         if level > 0 and not module_str:
             if current_dir is None:
                 return []
-            return [str(Path(current_dir) / "__init__.py")]
+            return [_join(current_dir, "__init__.py")]
 
         if level > 0:
             if current_dir is None:
                 return []
             module_parts = module_str.split(".") if module_str else []
-            import_path_base = (
-                str(Path(current_dir).joinpath(*module_parts)) if module_parts else current_dir
-            )
+            import_path_base = _join(current_dir, *module_parts) if module_parts else current_dir
         else:
             module_parts = module_str.split(".") if module_str else []
-            import_path_base = str(Path(*module_parts)) if module_parts else "."
+            import_path_base = _join(*module_parts) if module_parts else "."
 
-        standard = str(Path(f"{import_path_base}.py"))
-        init_file = str(Path(import_path_base) / "__init__.py")
+        standard = _pathstr(f"{import_path_base}.py")
+        init_file = _join(import_path_base, "__init__.py")
         return [standard, init_file]
 
     def _py_first_existing(self, candidates):
+        # _py_target_paths builds its candidates with _join/_pathstr, so they are already normalized
         for path in candidates:
-            normalized = str(Path(path))
-            if normalized in self.source_files:
-                return normalized
+            if path in self.source_files:
+                return path
         return None
 
     def resolve_python(self, importing_file_rel_path, module_str, relative_level):
@@ -147,6 +264,12 @@ class LocalImportResolver:
         Returns:
             str|None: Repo‑relative target path if resolved, otherwise None
         """
+        # Only relative imports depend on where the importing file lives
+        importing_dir = self._importing_dir(importing_file_rel_path)[0] if relative_level > 0 else ""
+        key = ("python", importing_dir, module_str, relative_level)
+        return self._cached_resolve(key, self._resolve_python, importing_file_rel_path, module_str, relative_level)
+
+    def _resolve_python(self, importing_file_rel_path, module_str, relative_level):
         if self._py_is_invalid_blank_absolute(module_str, relative_level):
             return None
         candidates = self._py_target_paths(importing_file_rel_path, module_str, relative_level)
@@ -154,21 +277,35 @@ class LocalImportResolver:
 
     # --- JS/TS helpers ---
     def _join_norm(self, *parts):
-        return str(Path(*parts)) if parts else "."
+        return _join(*parts)
 
     def _rel_to_repo(self, abs_path):
-        try:
-            rel = str(Path(abs_path).relative_to(self.repo_path))
-        except ValueError:
+        # Same result as str(Path(abs_path).relative_to(self.repo_path)), falling back to relpath
+        abs_path = _pathstr(abs_path)
+        root = _pathstr(self.repo_path)
+        prefix = root if root.endswith("/") else root + "/"
+        if abs_path == root:
+            rel = "."
+        elif root == ".":
+            rel = abs_path if not abs_path.startswith("/") else os.path.relpath(abs_path, self.repo_path)
+        elif abs_path.startswith(prefix) and abs_path.startswith("//") == root.startswith("//"):
+            rel = abs_path[len(prefix) :]
+        else:
             rel = os.path.relpath(abs_path, self.repo_path)
-        return str(Path(rel))
+        return _pathstr(rel)
 
     def _source_has(self, rel_path):
         return rel_path in self.source_files
 
+    def _is_disk_file(self, abs_path):
+        # One cached stat per path; the repository does not change while imports are resolved
+        is_file = self._disk_file_cache.get(abs_path)
+        if is_file is None:
+            is_file = self._disk_file_cache[abs_path] = os.path.isfile(abs_path)
+        return is_file
+
     def _disk_file_exists(self, rel_path):
-        candidate = Path(self.repo_path) / rel_path
-        return candidate.exists() and candidate.is_file()
+        return self._is_disk_file(_join(self.repo_path, rel_path))
 
     def _js_resolve_framework_package_alias(self, importing_file_rel_path, module_str):
         if not self.alias_resolver:
@@ -189,14 +326,19 @@ class LocalImportResolver:
             module_str (str): Import string as written in source
 
         Returns:
-            list: Ordered list of file extensions to try
+            tuple: Ordered file extensions to try, cached per module string
         """
+        extensions = self._js_extensions_cache.get(module_str)
+        if extensions is not None:
+            return extensions
+        extensions = tuple(JS_TS_SOURCE_EXTS)
         if self.alias_resolver and getattr(self.alias_resolver, "config", None):
             try:
-                return list(self.alias_resolver.config.get_all_extensions_for_module(module_str))
+                extensions = tuple(self.alias_resolver.config.get_all_extensions_for_module(module_str))
             except Exception:
-                return list(JS_TS_SOURCE_EXTS)
-        return list(JS_TS_SOURCE_EXTS)
+                pass
+        self._js_extensions_cache[module_str] = extensions
+        return extensions
 
     def _js_resolve_path_alias(self, importing_file_rel_path, module_str):
         if not self.alias_resolver:
@@ -206,109 +348,162 @@ class LocalImportResolver:
             return resolved
         return None
 
-    def _js_legacy_path_alias(self, importing_file_rel_path, module_str):
-        if not self.js_ts_path_aliases:
-            return None
+    def _index_new_sources(self):
+        """
+        Add source_files entries registered since the last call to the lookup maps
+        """
+        if self._indexed_sources == len(self.source_files):
+            return
+        for path in itertools.islice(self.source_files, self._indexed_sources, None):
+            self._index_source(path)
+        self._indexed_sources = len(self.source_files)
 
-        for alias_pattern, targets in self.js_ts_path_aliases.items():
-            module_wildcard_part = None
-
-            if "*" in alias_pattern:
-                if alias_pattern.endswith("/*"):
-                    prefix = alias_pattern[:-2]
-                    if module_str.startswith(prefix + "/"):
-                        module_wildcard_part = module_str[len(prefix) + 1 :]
-                    elif module_str == prefix:
-                        module_wildcard_part = ""
-                    else:
-                        continue
-                elif alias_pattern.endswith("*"):
-                    prefix = alias_pattern[:-1]
-                    if module_str.startswith(prefix):
-                        module_wildcard_part = module_str[len(prefix) :]
-                    else:
-                        continue
-                else:
-                    continue
-            elif alias_pattern == module_str:
-                module_wildcard_part = ""
+    def _index_source(self, path):
+        """
+        Add one repo-relative source path to the lookup maps
+
+        Every dotted suffix of a file name counts as an extension, so "a/b.d.ts" is found as "a/b" + ".d.ts"
+        and as "a/b.d" + ".ts". Directory keys are spelled like str(Path(directory)) so they match the
+        candidates the resolvers build
+        """
+        dot = path.find(".", path.rfind("/") + 1)
+        while dot != -1:
+            stem = path[:dot]
+            ext = path[dot:]
+            self._sources_by_stem.setdefault(stem, {}).setdefault(ext, path)
+            if stem == "index" or stem.endswith("/index"):
+                directory = stem[:-6].rstrip("/") or ("/" if stem.startswith("/") else ".")
+                if _join(directory, path[len(stem) - 5 :]) == path:
+                    self._index_files_by_dir.setdefault(directory, {}).setdefault(ext, path)
+            dot = path.find(".", dot + 1)
+
+        if path.endswith(".go"):
+            end = path.find(os.sep)
+            if end == -1:
+                self._go_files_by_dir.setdefault(".", []).append(path)
+            while end != -1:
+                ancestor = path[:end]
+                if ancestor != ".":
+                    self._go_files_by_dir.setdefault(ancestor, []).append(path)
+                end = path.find(os.sep, end + 1)
+
+        if path.endswith(".rs"):
+            self._rust_files_by_module.setdefault(path[:-3], path)
+            if path == "mod.rs" or path.endswith("/mod.rs"):
+                directory = path[:-7].rstrip("/") or ("/" if path.startswith("/") else ".")
+                if _join(directory, "mod.rs") == path:
+                    self._rust_mod_files_by_dir.setdefault(directory, path)
+
+    @staticmethod
+    def _classify_alias_targets(targets):
+        """
+        Return (kind, template, literal part) for each target template of a legacy alias
+        """
+        classified = []
+        for template in targets:
+            if not isinstance(template, str):
+                continue
+            if "*" not in template:
+                classified.append((_TARGET_LITERAL, template, template))
+            elif template.endswith("/*"):
+                classified.append((_TARGET_DIR_WILDCARD, template, template[:-2]))
+            elif template.endswith("*"):
+                classified.append((_TARGET_WILDCARD, template, template[:-1]))
             else:
+                classified.append((_TARGET_UNSUPPORTED, template, None))
+        return classified
+
+    def _js_legacy_alias_matches(self, module_str):
+        """
+        Return (targets, wildcard_part) for each legacy alias matching module_str, in configuration order
+        """
+        matches = []
+        exact = self._js_alias_exact.get(module_str)
+        if exact:
+            matches.append((exact[0], exact[1], ""))
+        for length in self._js_alias_dir_prefix_lengths:
+            if length > len(module_str):
+                break
+            entry = self._js_alias_dir_prefixes.get(module_str[:length])
+            if entry is None:
                 continue
+            if module_str[length:length + 1] == "/":
+                matches.append((entry[0], entry[1], module_str[length + 1 :]))
+            elif length == len(module_str):
+                matches.append((entry[0], entry[1], ""))
+        for length in self._js_alias_prefix_lengths:
+            if length > len(module_str):
+                break
+            entry = self._js_alias_prefixes.get(module_str[:length])
+            if entry is not None:
+                matches.append((entry[0], entry[1], module_str[length:]))
+        matches.sort(key=lambda match: match[0])
+        return [(targets, part) for _, targets, part in matches]
 
-            for target_template in targets:
-                if "*" in target_template:
-                    if target_template.endswith("/*"):
-                        base_target = target_template[:-2]
-                        resolved_segment = (
-                            str(Path(base_target) / module_wildcard_part)
-                            if module_wildcard_part
-                            else base_target
-                        )
-                    elif target_template.endswith("*"):
-                        base_target = target_template[:-1]
-                        resolved_segment = base_target + module_wildcard_part
-                    else:
-                        if self.logger:
-                            self.logger.warning(
-                                f"Complex wildcard in target path template '{target_template}' not fully supported. Skipping"  # noqa
-                            )
-                        continue
-                else:
-                    resolved_segment = target_template
+    def _js_legacy_path_alias(self, importing_file_rel_path, module_str):
+        if not self.js_ts_path_aliases:
+            return None
 
-                if self.js_ts_base_url and self.js_ts_base_url != ".":
-                    path_from_root = str(Path(self.js_ts_base_url) / resolved_segment)
+        base_url = self.js_ts_base_url if self.js_ts_base_url and self.js_ts_base_url != "." else None
+        for targets, module_wildcard_part in self._js_legacy_alias_matches(module_str):
+            for kind, target_template, base_target in targets:
+                if kind == _TARGET_DIR_WILDCARD:
+                    resolved_segment = _join(base_target, module_wildcard_part) if module_wildcard_part else base_target
+                elif kind == _TARGET_LITERAL:
+                    resolved_segment = base_target
+                elif kind == _TARGET_WILDCARD:
+                    resolved_segment = base_target + module_wildcard_part
                 else:
-                    path_from_root = resolved_segment
+                    if self.logger:
+                        self.logger.warning(
+                            f"Complex wildcard in target path template '{target_template}' not fully supported. Skipping"  # noqa
+                        )
+                    continue
 
-                path_from_root = str(Path(path_from_root))
+                path_from_root = _join(base_url, resolved_segment) if base_url else resolved_segment
+                path_from_root = _pathstr(path_from_root)
 
                 if path_from_root in self.source_files:
                     return path_from_root
 
-                candidate_path = str(Path(self.repo_path) / path_from_root)
-                if (
-                    os.path.splitext(path_from_root)[1]
-                    and Path(candidate_path).exists()
-                    and Path(candidate_path).is_file()
-                ):
+                candidate_path = _join(self.repo_path, path_from_root)
+                if os.path.splitext(path_from_root)[1] and self._is_disk_file(candidate_path):
                     self.source_files[path_from_root] = {
                         "absolute_path": candidate_path,
                         "language": "javascript",
                     }
                     return path_from_root
 
-                for ext in JS_TS_SOURCE_EXTS:
-                    target_with_ext = str(Path(f"{path_from_root}{ext}"))
-                    if target_with_ext in self.source_files:
-                        return target_with_ext
-
-                has_known_extension = any(
-                    path_from_root.endswith(ext) for ext in JS_TS_SOURCE_EXTS + JSONLIKE_EXTS
-                )
-                if not has_known_extension:
+                self._index_new_sources()
+                by_stem, index_files_by_dir = self._sources_by_stem, self._index_files_by_dir
+                with_ext = by_stem.get(path_from_root)
+                if with_ext:
                     for ext in JS_TS_SOURCE_EXTS:
-                        index_path = str(Path(path_from_root) / f"index{ext}")
-                        index_path = str(Path(index_path))
-                        if index_path in self.source_files:
-                            return index_path
+                        if ext in with_ext:
+                            return with_ext[ext]
+
+                if not path_from_root.endswith(_KNOWN_JS_EXTS):
+                    index_files = index_files_by_dir.get(path_from_root)
+                    if index_files:
+                        for ext in JS_TS_SOURCE_EXTS:
+                            if ext in index_files:
+                                return index_files[ext]
 
         return None
 
     def _js_resolve_relative_base(self, importing_file_rel_path, module_str):
-        if not module_str.startswith("."):
+        if module_str[:1] != ".":
             return None
-        abs_dir = str((Path(self.repo_path) / importing_file_rel_path).parent)
-        abs_target = str(Path(abs_dir) / module_str)
-        normalized = str(Path(abs_target).resolve())
+        abs_dir = self._importing_dir(importing_file_rel_path)[1]
+        # Path.resolve() is os.path.realpath plus a stat; symlinks are still followed
+        normalized = os.path.realpath(_join(abs_dir, module_str))
         return self._rel_to_repo(normalized)
 
     def _js_try_as_is_or_data_like(self, rel_base):
         if self._source_has(rel_base):
             return rel_base
-        full_path = str(Path(self.repo_path) / rel_base)
-        full_path_path = Path(full_path)
-        if full_path_path.exists() and full_path_path.is_file():
+        full_path = _join(self.repo_path, rel_base)
+        if self._is_disk_file(full_path):
             if rel_base.endswith(tuple(JSONLIKE_EXTS + [".cjs", ".mjs"])):
                 self.source_files[rel_base] = {
                     "absolute_path": full_path,
@@ -318,8 +513,15 @@ class LocalImportResolver:
         return None
 
     def _js_try_with_source_exts(self, rel_base, module_str):
+        self._index_new_sources()
+        with_ext = self._sources_by_stem.get(rel_base, {})
         for ext in self._js_extensions(module_str):
-            target = str(Path(f"{rel_base}{ext}"))
+            # Plain ".ext" suffixes come straight from the index; anything else is normalized and probed
+            if ext[:1] == "." and len(ext) > 1 and "/" not in ext:
+                if ext in with_ext:
+                    return with_ext[ext]
+                continue
+            target = _pathstr(f"{rel_base}{ext}")
             if self._source_has(target):
                 return target
         return None
@@ -327,9 +529,14 @@ class LocalImportResolver:
     def _js_try_index_files(self, rel_base, module_str):
         if os.path.splitext(rel_base)[1]:
             return None
+        self._index_new_sources()
+        index_files = self._index_files_by_dir.get(rel_base, {})
         for ext in self._js_extensions(module_str):
-            candidate = str(Path(rel_base) / f"index{ext}")
-            candidate = str(Path(candidate))
+            if ext[:1] == "." and len(ext) > 1 and "/" not in ext:
+                if ext in index_files:
+                    return index_files[ext]
+                continue
+            candidate = _join(rel_base, f"index{ext}")
             if self._source_has(candidate):
                 return candidate
         return None
@@ -346,6 +553,15 @@ class LocalImportResolver:
         Returns:
             str|None: Repo‑relative target path or None when treated as external
         """
+        is_relative = module_str[:1] == "."
+        if not is_relative and not self.alias_resolver and not self.js_ts_path_aliases:
+            # Bare package imports can only resolve through aliases
+            return None
+        # Aliases ignore the importing file and relative imports only depend on its directory
+        key = ("js", self._importing_dir(importing_file_rel_path)[0] if is_relative else "", module_str)
+        return self._cached_resolve(key, self._resolve_js, importing_file_rel_path, module_str)
+
+    def _resolve_js(self, importing_file_rel_path, module_str):
         if self.alias_resolver:
             pkg_marker = self._js_resolve_framework_package_alias(importing_file_rel_path, module_str)
             if pkg_marker:
@@ -358,7 +574,7 @@ class LocalImportResolver:
             if legacy:
                 return legacy
 
-        if not module_str.startswith("."):
+        if module_str[:1] != ".":
             return None
 
         rel_base = self._js_resolve_relative_base(importing_file_rel_path, module_str)
@@ -386,12 +602,12 @@ class LocalImportResolver:
         first_part = use_path_parts[0]
         if first_part == "crate":
             return "src", "crate", use_path_parts[1:]
+        importing_dir = self._importing_dir(importing_file_rel_path)[0]
         if first_part == "self":
-            return str(Path(importing_file_rel_path).parent), "self", use_path_parts[1:]
+            return importing_dir, "self", use_path_parts[1:]
         if first_part == "super":
-            return str(Path(importing_file_rel_path).parent.parent), "super", use_path_parts[1:]
-        importing_dir = str(Path(importing_file_rel_path).parent)
-        if importing_dir == "src" and Path(importing_file_rel_path).name in ["main.rs", "lib.rs"]:
+            return _parent(importing_dir), "super", use_path_parts[1:]
+        if importing_dir == "src" and _name(importing_file_rel_path) in ["main.rs", "lib.rs"]:
             current_dir = "src"
         else:
             current_dir = importing_dir
@@ -405,32 +621,31 @@ class LocalImportResolver:
     def _rust_handle_empty_or_wildcard(self, first_part, importing_file_rel_path, current_dir, remainder):
         if not remainder:
             if first_part == "crate":
-                lib_path = str(Path(current_dir) / "lib.rs")
+                lib_path = _join(current_dir, "lib.rs")
                 if lib_path in self.source_files:
                     return lib_path, True
-                main_path = str(Path(current_dir) / "main.rs")
+                main_path = _join(current_dir, "main.rs")
                 if main_path in self.source_files:
                     return main_path, True
             return None, True
 
         if len(remainder) == 1 and remainder[0] == "*":
             if first_part == "crate":
-                lib_path = str(Path(current_dir) / "lib.rs")
+                lib_path = _join(current_dir, "lib.rs")
                 if lib_path in self.source_files:
                     return lib_path, True
-                main_path = str(Path(current_dir) / "main.rs")
+                main_path = _join(current_dir, "main.rs")
                 if main_path in self.source_files:
                     return main_path, True
                 return None, True
             if first_part == "self":
                 return importing_file_rel_path, True
             if first_part == "super":
-                parent_dir = str(Path(importing_file_rel_path).parent)
-                segment = Path(parent_dir).name
-                target_rs = str(Path(current_dir) / f"{segment}.rs")
+                segment = _name(self._importing_dir(importing_file_rel_path)[0])
+                target_rs = _join(current_dir, f"{segment}.rs")
                 if target_rs in self.source_files:
                     return target_rs, True
-                target_mod = str(Path(current_dir) / segment / "mod.rs")
+                target_mod = _join(current_dir, segment, "mod.rs")
                 if target_mod in self.source_files:
                     return target_mod, True
                 return None, True
@@ -438,23 +653,25 @@ class LocalImportResolver:
         return None, False
 
     def _rust_try_module_candidates(self, current_dir, remainder):
+        self._index_new_sources()
         for length in range(len(remainder), 0, -1):
             module_segments = remainder[:length]
-            if not module_segments or module_segments[-1] == "*":
+            last = module_segments[-1]
+            if last == "*":
+                continue
+            if last in ("", ".") or "/" in last:
+                # Joining would fold these into the directory, so probe the literal candidates instead
+                candidate_rs = _join(current_dir, *module_segments[:-1], f"{last}.rs")
+                if candidate_rs in self.source_files:
+                    return candidate_rs
+                candidate_mod = _join(current_dir, *module_segments, "mod.rs")
+                if candidate_mod in self.source_files:
+                    return candidate_mod
                 continue
-            path_parts_rs = [current_dir]
-            if len(module_segments) > 1:
-                path_parts_rs.extend(module_segments[:-1])
-            path_parts_rs.append(f"{module_segments[-1]}.rs")
-            candidate_rs = str(Path(*path_parts_rs)) if path_parts_rs else "."
-            if candidate_rs in self.source_files:
-                return candidate_rs
-            path_parts_mod = [current_dir]
-            path_parts_mod.extend(module_segments)
-            path_parts_mod.append("mod.rs")
-            candidate_mod = str(Path(*path_parts_mod)) if path_parts_mod else "."
-            if candidate_mod in self.source_files:
-                return candidate_mod
+            module_path = _join(current_dir, *module_segments)
+            resolved = self._rust_files_by_module.get(module_path) or self._rust_mod_files_by_dir.get(module_path)
+            if resolved:
+                return resolved
         return None
 
     def resolve_rust(self, importing_file_rel_path, use_path_parts):
@@ -468,6 +685,11 @@ class LocalImportResolver:
         Returns:
             str|None: Repo‑relative module path if resolved, otherwise None
         """
+        # `self::*` and src/main.rs or src/lib.rs lookups depend on the file itself, not just its directory
+        key = ("rust", importing_file_rel_path, tuple(use_path_parts))
+        return self._cached_resolve(key, self._resolve_rust, importing_file_rel_path, use_path_parts)
+
+    def _resolve_rust(self, importing_file_rel_path, use_path_parts):
         if not use_path_parts:
             return None
 
@@ -496,32 +718,27 @@ class LocalImportResolver:
         return bool(self.go_module_path and module_str.startswith(self.go_module_path))
 
     def _go_import_path_for_relative(self, importing_file_rel_path, module_str):
-        abs_dir = str((Path(self.repo_path) / importing_file_rel_path).parent)
-        abs_target = str((Path(abs_dir) / module_str).resolve())
-        try:
-            rel = str(Path(abs_target).relative_to(self.repo_path))
-        except ValueError:
-            rel = os.path.relpath(abs_target, self.repo_path)
-        return str(Path(rel))
+        abs_dir = self._importing_dir(importing_file_rel_path)[1]
+        return self._rel_to_repo(os.path.realpath(_join(abs_dir, module_str)))
 
     def _go_candidate_files(self, import_path):
-        package_dir = Path(import_path).name
-        yield str(Path(f"{import_path}.go"))
-        yield str(Path(import_path) / f"{package_dir}.go")
+        package_dir = _name(import_path)
+        yield _pathstr(f"{import_path}.go")
+        yield _join(import_path, f"{package_dir}.go")
+
+    def _go_files_under(self, directory):
+        """
+        Return the .go sources below directory in source_files order; "." means files at the repo root only
+        """
+        self._index_new_sources()
+        return self._go_files_by_dir.get(directory, ())
 
     def _go_find_single_go_in_dir(self, import_path):
-        prefix = "" if import_path == "." else import_path + os.sep
-        found = []
-        for rel_path in self.source_files:
-            if prefix == "":
-                if os.sep not in rel_path and rel_path.endswith(".go"):
-                    found.append(rel_path)
-            elif rel_path.startswith(prefix) and rel_path.endswith(".go"):
-                found.append(rel_path)
+        found = self._go_files_under(import_path)
         if len(found) == 1:
             return found[0]
         if len(found) > 1:
-            return found
+            return list(found)
         return None
 
     def resolve_go(self, importing_file_rel_path, module_str):
@@ -535,17 +752,24 @@ class LocalImportResolver:
         Returns:
             str|None: Repo‑relative `.go` file if uniquely determined, otherwise None
         """
-        if not module_str.startswith("."):
+        is_relative = module_str[:1] == "."
+        if not is_relative and not self.go_module_path:
+            return None
+        key = ("go", self._importing_dir(importing_file_rel_path)[0] if is_relative else "", module_str)
+        return self._cached_resolve(key, self._resolve_go, importing_file_rel_path, module_str)
+
+    def _resolve_go(self, importing_file_rel_path, module_str):
+        if module_str[:1] != ".":
             if self._go_is_module_absolute(module_str):
                 relative_part = module_str[len(self.go_module_path) :].lstrip("/")
-                import_path = str(Path(relative_part).resolve())
+                import_path = os.path.realpath(relative_part)
             else:
                 return None
         else:
             import_path = self._go_import_path_for_relative(importing_file_rel_path, module_str)
 
         for candidate in self._go_candidate_files(import_path):
-            normalized = str(Path(candidate))
+            normalized = _pathstr(candidate)
             if normalized in self.source_files:
                 return normalized
 
@@ -560,32 +784,27 @@ class LocalImportResolver:
         return None
 
     # --- Solidity helpers ---
-    def _solidity_try_remappings(self, import_path_str, remappings_dict):
-        if not remappings_dict:
+    @staticmethod
+    def _sort_remappings(remappings_dict):
+        return sorted(remappings_dict.items(), key=lambda item: -len(item[0]))
+
+    def _solidity_try_remappings(self, import_path_str, remappings):
+        if not remappings:
             return None
-        for prefix, remapped_base in remappings_dict.items():
+        for prefix, remapped_base in remappings:
             if import_path_str.startswith(prefix):
                 path_after = import_path_str[len(prefix) :]
-                remapped_segment = str(Path(remapped_base) / path_after)
-                full_path = str((Path(self.repo_path) / remapped_segment).resolve())
-                try:
-                    rel = str(Path(full_path).relative_to(self.repo_path))
-                except ValueError:
-                    rel = os.path.relpath(full_path, self.repo_path)
-                rel = str(Path(rel))
+                remapped_segment = _join(remapped_base, path_after)
+                rel = self._rel_to_repo(os.path.realpath(_join(self.repo_path, remapped_segment)))
                 if rel in self.source_files:
                     return rel
         return None
 
     def _solidity_relative_target(self, importing_file_rel_path, import_path_str):
-        base_dir = str(Path(importing_file_rel_path).parent)
+        base_dir = self._importing_dir(importing_file_rel_path)[0]
         abs_base_dir = os.path.join(self.repo_path, base_dir)
         target_abs = os.path.normpath(os.path.join(abs_base_dir, import_path_str))
-        try:
-            target_rel = str(Path(target_abs).relative_to(self.repo_path))
-        except ValueError:
-            target_rel = os.path.relpath(target_abs, self.repo_path)
-        target_rel = str(Path(target_rel))
+        target_rel = self._rel_to_repo(target_abs)
         if not target_rel.endswith(".sol"):
             return None
         if target_rel in self.source_files:
@@ -596,8 +815,7 @@ class LocalImportResolver:
             and importing_file_rel_path.startswith(self.solidity_src_path + os.sep)
         ):
             remainder = import_path_str[3:]
-            fallback = str(Path(self.solidity_src_path) / remainder)
-            fallback = str(Path(fallback))
+            fallback = _join(self.solidity_src_path, remainder)
             if fallback in self.source_files:
                 return fallback
         return None
@@ -613,11 +831,16 @@ class LocalImportResolver:
         Returns:
             str|None: Repo‑relative path if resolved, otherwise None
         """
-        if not import_path_str.startswith("."):
-            resolved = self._solidity_try_remappings(import_path_str, self.hardhat_remappings)
+        # The solidity_src_path fallback for relative imports tests the importing path itself
+        key = ("solidity", importing_file_rel_path if import_path_str[:1] == "." else "", import_path_str)
+        return self._cached_resolve(key, self._resolve_solidity, importing_file_rel_path, import_path_str)
+
+    def _resolve_solidity(self, importing_file_rel_path, import_path_str):
+        if import_path_str[:1] != ".":
+            resolved = self._solidity_try_remappings(import_path_str, self._hardhat_remappings_by_length)
             if resolved:
                 return resolved
-            resolved = self._solidity_try_remappings(import_path_str, self.remappings)
+            resolved = self._solidity_try_remappings(import_path_str, self._remappings_by_length)
             if resolved:
                 return resolved
             return None
@@ -628,10 +851,193 @@ class LocalImportResolver:
         return None
 
 
+# LocalImportResolver method resolving each language's local imports
+_RESOLVER_BY_LANGUAGE = {
+    "python": "resolve_python",
+    "javascript": "resolve_js",
+    "typescript": "resolve_js",
+    "rust": "resolve_rust",
+    "go": "resolve_go",
+    "solidity": "resolve_solidity",
+}
+
+
+def _language_context(contexts, language, language_handlers, local_resolver):
+    """
+    Return the handler, parser and local resolver shared by every file of a language
+
+    Built on first use and kept in contexts, so the per-file loop does no per-language setup;
+    get_parser builds a new Parser on every call
+
+    Args:
+        contexts (dict): Per-process cache of contexts keyed by language
+        language (str): Language of the file being processed
+        language_handlers (dict): Registered language handlers keyed by language name
+        local_resolver (LocalImportResolver): Resolver for local file imports
+
+    Returns:
+        Tuple of (handler, parser, resolver_func, parser_error, import_query); parser is None when it could
+        not be built and import_query is None when the handler walks whole trees
+    """
+    context = contexts.get(language)
+    if context is not None:
+        return context
+
+    handler = language_handlers[language]
+    parser, parser_error, import_query = None, None, None
+    try:
+        parser = get_parser(language)
+        # tree-sitter enforces the limit itself, so parsing needs no SIGALRM and can run off the main thread
+        parser.timeout_micros = ResourceLimits.PARSE_TIMEOUT * 1_000_000
+        # Compiled against the parser's own grammar; a query run on another grammar's tree is unsafe
+        import_query = handler.import_query(getattr(parser, "language", None))
+    except Exception as exc:
+        parser, parser_error = None, exc
+
+    resolver_name = _RESOLVER_BY_LANGUAGE.get(language)
+    resolver_func = getattr(local_resolver, resolver_name) if resolver_name else None
+
+    context = contexts[language] = (handler, parser, resolver_func, parser_error, import_query)
+    return context
+
+
+def _extract_file_imports(rel_path, file_info, context, secure_file_ops, components, logger):
+    """
+    Parse one source file and run its language handler over the tree
+
+    Args:
+        rel_path (str): Repo-relative path of the file
+        file_info (dict): source_files metadata for the file
+        context (tuple): The file's language context from _language_context
+        secure_file_ops (SecureFileOps|None): Secure file operations or None
+        components (dict): file_package_components mapping the handler records into
+        logger (Logger|None): Optional logger for progress and warnings
+
+    Returns:
+        Tuple of (external_imports, local_imports), or None when the file was skipped
+    """
+    abs_path = file_info["absolute_path"]
+    handler, parser, resolver_func, parser_error, import_query = context
+
+    if parser is None:
+        if logger:
+            logger.warning(
+                f"Failed to get parser for {file_info['language']}: {str(parser_error)}, skipping file {rel_path}"
+            )
+        return None
+
+    try:
+        file_size = file_info.get("size")  # recorded by the secure scan
+        if file_size is None:
+            file_size = Path(abs_path).stat().st_size
+        if file_size > ResourceLimits.MAX_FILE_SIZE:
+            if logger:
+                logger.warning(
+                    f"Skipping {rel_path}: file size ({file_size / 1024 / 1024:.1f}MB) "
+                    f"exceeds limit ({ResourceLimits.MAX_FILE_SIZE / 1024 / 1024}MB)"
+                )
+            return None
+    except Exception as exc:
+        if logger:
+            logger.warning(f"Could not check file size for {abs_path}: {exc}")
+
+    try:
+        if secure_file_ops:
+            code = secure_file_ops.read_bytes(rel_path)
+        else:
+            with open(abs_path, "rb") as handle:
+                code = handle.read()
+        if not code.isascii():
+            try:
+                code.decode("utf-8")
+            except UnicodeDecodeError:
+                # Handlers decode node text strictly, so drop invalid bytes up front
+                code = code.decode("utf-8", errors="ignore").encode("utf-8")
+    except Exception as exc:
+        if logger:
+            logger.error(f"Could not read file {abs_path}: {exc}, skipping")
+        return None
+
+    if logger:
+        logger.debug(f"Parsing {rel_path} ({len(code)} bytes)")
+
+    try:
+        tree = parser.parse(code)
+    except ValueError:
+        # With a language set, tree-sitter only fails a parse when it hits timeout_micros
+        parser.reset()  # the cached parser must not resume this file's parse on the next one
+        if logger:
+            logger.warning(
+                f"Parsing timed out for {rel_path}: exceeded {ResourceLimits.PARSE_TIMEOUT} seconds, skipping"
+            )
+        return None
+    except Exception as exc:
+        parser.reset()
+        if logger:
+            logger.warning(f"Failed to parse {rel_path}: {str(exc)}, skipping")
+        return None
+
+    try:
+        if import_query is None:
+            return handler.extract_imports(tree.root_node, rel_path, components, resolver_func, logger=logger)
+        return handler.extract_imports(
+            tree.root_node, rel_path, components, resolver_func, logger=logger, import_query=import_query
+        )
+    except Exception as exc:
+        if logger:
+            logger.warning(f"Error extracting imports from {rel_path}: {str(exc)}")
+        return None
+
+
+_worker_state = {}
+
+
+def _init_import_worker(language_handlers, secure_file_ops, local_resolver, logger):
+    """
+    Pool initializer: keep the shared inputs in the worker process along with its own language contexts
+    """
+    _worker_state.update(
+        language_handlers=language_handlers,
+        secure_file_ops=secure_file_ops,
+        local_resolver=local_resolver,
+        logger=logger,
+        contexts={},
+    )
+
+
+def _extract_file_imports_in_worker(job):
+    """
+    Run _extract_file_imports for one (rel_path, file_info) job inside a pool worker
+
+    Returns:
+        Tuple of (result, components, registered), where registered lists the
+        (path, info) entries the resolver added to its copy of source_files
+    """
+    rel_path, file_info = job
+    state = _worker_state
+    logger = state["logger"]
+    registry = state["local_resolver"].source_files
+    known = len(registry)
+    components = defaultdict(list)
+    try:
+        context = _language_context(
+            state["contexts"], file_info["language"], state["language_handlers"], state["local_resolver"]
+        )
+        result = _extract_file_imports(rel_path, file_info, context, state["secure_file_ops"], components, logger)
+    except Exception:
+        if logger:
+            logger.exception(f"Unexpected error processing file {rel_path}")
+        result = None
+    registered = list(itertools.islice(registry.items(), known, None))
+    return result, dict(components), registered
+
+
 def extract_imports(source_files, language_handlers, repo_path, secure_file_ops, local_resolver, logger):
     """
     Extract imports from source files using provided handlers
 
+    Files are processed serially unless ResourceLimits.PARSE_WORKERS asks for a process pool
+
     Args:
         source_files (dict): Map of repo‑relative paths to file metadata
         language_handlers (dict): Registered language handlers keyed by language name
@@ -643,102 +1049,115 @@ def extract_imports(source_files, language_handlers, repo_path, secure_file_ops,
     Returns:
         Tuple of (file_imports, local_imports_map, file_package_components)
     """
-    file_imports = defaultdict(list)
-    local_imports_map = defaultdict(list)
+    # Results are stored whole per file, only when non-empty; handlers append components per file
+    file_imports = {}
+    local_imports_map = {}
     file_package_components = defaultdict(list)
 
     processed_files = 0
+    # Resolved local imports name source files; map each to the source_files key object so the
+    # stored paths share one string per file instead of holding a parsed copy per import
+    canonical_paths = dict(zip(source_files, source_files))
+
+    # A snapshot: resolvers add the files they find on disk to source_files while jobs run
+    jobs = [
+        (rel_path, file_info)
+        for rel_path, file_info in source_files.items()
+        if file_info["language"] and file_info["language"] in language_handlers
+    ]
+
+    workers = ResourceLimits.PARSE_WORKERS or os.cpu_count() or 1
+    if workers > 1 and len(jobs) > 1:
+        results = _extract_imports_in_pool(
+            jobs,
+            workers,
+            source_files,
+            file_package_components,
+            language_handlers,
+            secure_file_ops,
+            local_resolver,
+            logger,
+        )
+    else:
+        results = _extract_imports_serially(
+            jobs, file_package_components, language_handlers, secure_file_ops, local_resolver, logger
+        )
 
-    for rel_path, file_info in list(source_files.items()):
-        abs_path = file_info["absolute_path"]
-        language = file_info["language"]
-        if not language or language not in language_handlers:
+    for rel_path, result in results:
+        if result is None:
             continue
-        handler = language_handlers[language]
-
-        try:
-            try:
-                parser = get_parser(language)
-            except Exception as exc:
-                if logger:
-                    logger.warning(f"Failed to get parser for {language}: {str(exc)}, skipping file {rel_path}")
-                continue
-
-            try:
-                file_size = Path(abs_path).stat().st_size
-                if file_size > ResourceLimits.MAX_FILE_SIZE:
-                    if logger:
-                        logger.warning(
-                            f"Skipping {rel_path}: file size ({file_size / 1024 / 1024:.1f}MB) "
-                            f"exceeds limit ({ResourceLimits.MAX_FILE_SIZE / 1024 / 1024}MB)"
-                        )
-                    continue
-            except Exception as exc:
-                if logger:
-                    logger.warning(f"Could not check file size for {abs_path}: {exc}")
+        external_imports, local_imports = result
+        if external_imports:
+            file_imports[rel_path] = external_imports
+        if local_imports:
+            local_imports_map[rel_path] = tuple(canonical_paths.get(path, path) for path in local_imports)
+        processed_files += 1
 
-            try:
-                if secure_file_ops:
-                    code = secure_file_ops.read_file(rel_path, encoding="utf-8")
-                else:
-                    with open(abs_path, "r", encoding="utf-8", errors="ignore") as handle:
-                        code = handle.read()
-            except Exception as exc:
-                if logger:
-                    logger.error(f"Could not read file {abs_path}: {exc}, skipping")
-                continue
-
-            if logger:
-                logger.debug(f"Parsing {rel_path} ({len(code)} bytes)")
-
-            try:
-                with timeout(ResourceLimits.PARSE_TIMEOUT):
-                    tree = parser.parse(bytes(code, "utf-8"))
-            except TimeoutError as exc:
-                if logger:
-                    logger.warning(f"Parsing timed out for {rel_path}: {str(exc)}, skipping")
-                continue
-            except Exception as exc:
-                if logger:
-                    logger.warning(f"Failed to parse {rel_path}: {str(exc)}, skipping")
-                continue
-
-            resolver_func = None
-            if language == "python":
-                resolver_func = local_resolver.resolve_python
-            elif language in ["javascript", "typescript"]:
-                resolver_func = local_resolver.resolve_js
-            elif language == "rust":
-                resolver_func = local_resolver.resolve_rust
-            elif language == "go":
-                resolver_func = local_resolver.resolve_go
-            elif language == "solidity":
-                resolver_func = local_resolver.resolve_solidity
+    if logger:
+        logger.info(f"... Processed {processed_files}/{len(source_files)} files for imports")
 
-            try:
-                external_imports, local_imports = handler.extract_imports(
-                    tree.root_node,
-                    rel_path,
-                    file_package_components,
-                    resolver_func,
-                    logger=logger,
-                )
+    return file_imports, local_imports_map, file_package_components
 
-                if external_imports:
-                    file_imports[rel_path] = external_imports
-                if local_imports:
-                    local_imports_map[rel_path] = local_imports
 
-                processed_files += 1
-            except Exception as exc:
-                if logger:
-                    logger.warning(f"Error extracting imports from {rel_path}: {str(exc)}")
+def _extract_imports_serially(
+    jobs, file_package_components, language_handlers, secure_file_ops, local_resolver, logger
+):
+    """
+    Yield (rel_path, result) for each job, processed in this process
 
-        except Exception as exc:
+    Args:
+        jobs (list): (rel_path, file_info) pairs to process in order
+        file_package_components (dict): Mapping the handlers record components into
+        language_handlers (dict): Registered language handlers keyed by language name
+        secure_file_ops (SecureFileOps|None): Secure file operations or None
+        local_resolver (LocalImportResolver): Resolver for local file imports
+        logger (Logger|None): Optional logger for progress and warnings
+    """
+    contexts = {}
+    for rel_path, file_info in jobs:
+        try:
+            context = _language_context(contexts, file_info["language"], language_handlers, local_resolver)
+            result = _extract_file_imports(
+                rel_path, file_info, context, secure_file_ops, file_package_components, logger
+            )
+        except Exception:
             if logger:
                 logger.exception(f"Unexpected error processing file {rel_path}")
+            result = None
+        yield rel_path, result
 
-    if logger:
-        logger.info(f"... Processed {processed_files}/{len(source_files)} files for imports")
 
-    return file_imports, local_imports_map, file_package_components
+def _extract_imports_in_pool(
+    jobs, workers, source_files, file_package_components, language_handlers, secure_file_ops, local_resolver, logger
+):
+    """
+    Yield (rel_path, result) for each job, processed by a pool of worker processes
+
+    Each worker resolves against its own copy of source_files. Resolvers only register
+    files they found on disk, so the entries a worker adds are merged back here in job
+    order, which gives source_files the same contents and order as a serial run
+
+    Args:
+        jobs (list): (rel_path, file_info) pairs to process
+        workers (int): Number of worker processes
+        source_files (dict): Map of repo-relative paths to file metadata, updated in place
+        file_package_components (dict): Mapping the workers' components are merged into
+        language_handlers (dict): Registered language handlers keyed by language name
+        secure_file_ops (SecureFileOps|None): Secure file operations or None
+        local_resolver (LocalImportResolver): Resolver for local file imports
+        logger (Logger|None): Optional logger for progress and warnings
+    """
+    chunksize = max(1, len(jobs) // (workers * 4))
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_import_worker,
+        initargs=(language_handlers, secure_file_ops, local_resolver, logger),
+    ) as executor:
+        for (rel_path, _), (result, components, registered) in zip(
+            jobs, executor.map(_extract_file_imports_in_worker, jobs, chunksize=chunksize)
+        ):
+            for path, info in registered:
+                source_files.setdefault(path, info)
+            for path, names in components.items():
+                file_package_components[path].extend(names)
+            yield rel_path, result
@@ -5,13 +5,113 @@ Parses tsconfig.json/jsconfig.json to extract baseUrl and paths and
 constructs a UnifiedAliasResolver for consistent alias handling
 """
 
+import copy
 import json
 import os
 import re
-from pathlib import Path
 
 from gardener.common.alias_config import AliasConfiguration, UnifiedAliasResolver
 
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
+
+# Text that passes through unchanged: anything up to the next comment, or the next comma that only
+# whitespace separates from a closing bracket or a comment. Strings are consumed whole, so "//" or ",}"
+# inside them are kept. The alternatives start with distinct characters, so matching never backtracks
+_JSONC_PLAIN = re.compile(
+    r"(?:[^\"'/,]+"
+    r'|"(?:[^"\\]|\\.)*"?'
+    r"|'(?:[^'\\]|\\.)*'?"
+    r"|/(?![/*])"
+    r"|,(?!\s*(?:[\]}]|/[/*])))*",
+    re.S,
+)
+_LINE_END = re.compile(r"[\r\n]")
+
+# (absolute config path, mtime_ns, size) -> (base_url, paths) parsed from that file, so repeated
+# analyses of a repository skip re-reading and re-parsing an unchanged config
+_PARSED_CONFIGS = {}
+_PARSED_CONFIGS_MAX = 64
+
+
+def _strip_jsonc(content):
+    """
+    Turn tsconfig-style JSONC into JSON by removing comments and trailing commas in one pass
+
+    Strings are copied verbatim, so "//", "/*" or ",}" inside them are left alone
+
+    Args:
+        content (str): JSON text that may contain comments and trailing commas
+
+    Returns:
+        str: The cleaned text
+    """
+    out = []
+    pending_comma = None  # index in out of a comma that is dropped if a closing bracket comes next
+    index = 0
+    length = len(content)
+    while True:
+        end = _JSONC_PLAIN.match(content, index).end()
+        if end > index:
+            run = content[index:end]
+            if pending_comma is not None:
+                stripped = run.lstrip()
+                if stripped[:1] in ("]", "}"):
+                    out[pending_comma] = ""
+                if stripped:
+                    pending_comma = None
+            out.append(run)
+        if end >= length:
+            break
+
+        if content.startswith("//", end):
+            line_end = _LINE_END.search(content, end)
+            index = line_end.start() if line_end else length
+        elif content.startswith("/*", end):
+            close = content.find("*/", end + 2)
+            index = length if close == -1 else close + 2
+        else:
+            pending_comma = len(out)
+            out.append(",")
+            index = end + 1
+    return "".join(out)
+
+
+def _json_loads(text):
+    """
+    Decode JSON with orjson when it is installed, else the standard library
+
+    orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers handle both alike
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.loads(text)
+    return json.loads(text)
+
+
+def _load_jsonc(content):
+    """
+    Parse tsconfig-style JSONC, trying it as plain JSON first
+
+    Most configs carry no comments or trailing commas, and plain JSON needs no cleaning. Checking for
+    "//" or "/*" instead would not help, since `paths` patterns like "src/*" contain them. A JSONC file
+    fails fast, at its first comment
+
+    Args:
+        content (str): Config file text
+
+    Returns:
+        The decoded JSON value
+    """
+    try:
+        return _json_loads(content)
+    except json.JSONDecodeError:
+        return _json_loads(_strip_jsonc(content))
+
 
 def parse_ts_js_config(repo_path, js_config_files, ts_config_files, secure_file_ops, logger):
     """
@@ -29,31 +129,34 @@ def parse_ts_js_config(repo_path, js_config_files, ts_config_files, secure_file_
     """
 
     def _root_relative(path):
+        # relpath output is already normalized, so it needs no Path round-trip
         if secure_file_ops:
-            rel = secure_file_ops.get_relative_path(path)
-        else:
-            rel = os.path.relpath(path, repo_path)
-        return str(Path(rel))
+            return secure_file_ops.get_relative_path(path)
+        return os.path.relpath(path, repo_path)
 
     def _find_root_config(config_paths):
-        roots = [path for path in config_paths if str(Path(_root_relative(path)).parent) == "."]
+        """
+        Return (path, repo-relative path) of the first config at the repository root, or (None, None)
+        """
+        roots = []
+        for path in config_paths:
+            rel = _root_relative(path)
+            if os.sep not in rel:
+                roots.append((path, rel))
         if not roots:
-            return None
-        chosen = roots[0]
+            return None, None
+        chosen, chosen_rel = roots[0]
         if logger:
-            logger.info(
-                f"Found root {Path(chosen).name}: {_root_relative(chosen)}. This will be used for JS/TS path aliases."
-            )
+            name = os.path.basename(chosen)
+            logger.info(f"Found root {name}: {chosen_rel}. This will be used for JS/TS path aliases.")
             if len(roots) > 1:
-                logger.warning(
-                    f"Multiple root {Path(chosen).name} files found. Using the first one: {_root_relative(chosen)}"
-                )
-        return chosen
+                logger.warning(f"Multiple root {name} files found. Using the first one: {chosen_rel}")
+        return chosen, chosen_rel
 
-    chosen_config = _find_root_config(ts_config_files)
+    chosen_config, chosen_rel = _find_root_config(ts_config_files)
     config_type = "tsconfig.json"
     if not chosen_config:
-        chosen_config = _find_root_config(js_config_files)
+        chosen_config, chosen_rel = _find_root_config(js_config_files)
         config_type = "jsconfig.json"
 
     if not chosen_config:
@@ -65,33 +168,42 @@ def parse_ts_js_config(repo_path, js_config_files, ts_config_files, secure_file_
 
     try:
         if secure_file_ops:
-            rel_path = secure_file_ops.get_relative_path(chosen_config)
-            content = secure_file_ops.read_file(rel_path, encoding="utf-8-sig")
+            rel_path = chosen_rel  # already validated by get_relative_path in _root_relative
+            st = secure_file_ops.stat(rel_path)
+        else:
+            try:
+                st = os.stat(chosen_config)
+            except OSError:
+                st = None
+        cache_key = (os.path.abspath(chosen_config), st.st_mtime_ns, st.st_size) if st else None
+
+        cached = _PARSED_CONFIGS.get(cache_key) if cache_key else None
+        if cached is not None:
+            base_url, paths = cached
         else:
-            with open(chosen_config, "r", encoding="utf-8-sig") as handle:
-                content = handle.read()
-
-        comment_regex = r"'(\\'|[^'])*?'|\"(\\\"|[^\"])*?\"|//[^\r\n]*|/\*(?:(?!\*/).)*\*/"
-        content = re.sub(
-            comment_regex,
-            lambda match: match.group(0)
-            if match.group(0).startswith('"') or match.group(0).startswith("'")
-            else "",
-            content,
-            flags=re.S,
-        )
-        content = re.sub(r",\s*([\]}])", r"\1", content)
-
-        data = json.loads(content)
-        compiler_options = data.get("compilerOptions", {})
-
-        base_url = compiler_options.get("baseUrl")
-        if base_url is not None and not isinstance(base_url, str):
-            base_url = None
-
-        paths = compiler_options.get("paths")
-        if paths is not None and not isinstance(paths, dict):
-            paths = {}
+            if secure_file_ops:
+                content = secure_file_ops.read_file(rel_path, encoding="utf-8-sig")
+            else:
+                with open(chosen_config, "r", encoding="utf-8-sig") as handle:
+                    content = handle.read()
+
+            data = _load_jsonc(content)
+            compiler_options = data.get("compilerOptions", {})
+
+            base_url = compiler_options.get("baseUrl")
+            if base_url is not None and not isinstance(base_url, str):
+                base_url = None
+
+            paths = compiler_options.get("paths")
+            if paths is not None and not isinstance(paths, dict):
+                paths = {}
+
+            if cache_key:
+                if len(_PARSED_CONFIGS) >= _PARSED_CONFIGS_MAX:
+                    _PARSED_CONFIGS.pop(next(iter(_PARSED_CONFIGS)))
+                _PARSED_CONFIGS[cache_key] = (base_url, paths)
+        # Callers own the returned paths; the cached copy must not change with them
+        paths = copy.deepcopy(paths)
 
         if base_url and logger:
             logger.info(f"Extracted baseUrl '{base_url}' from {config_type}")
@@ -106,12 +218,12 @@ def parse_ts_js_config(repo_path, js_config_files, ts_config_files, secure_file_
     except json.JSONDecodeError as exc:
         if logger:
             logger.error(
-                f"Error decoding JSON from {config_type} ({_root_relative(chosen_config)}): {exc}. Path aliases may not be correctly parsed. Consider removing comments if present"  # noqa
+                f"Error decoding JSON from {config_type} ({chosen_rel}): {exc}. Path aliases may not be correctly parsed. Consider removing comments if present"  # noqa
             )
     except Exception as exc:
         if logger:
             logger.error(
-                f"An unexpected error occurred while processing {config_type} ({_root_relative(chosen_config)}): {exc}"
+                f"An unexpected error occurred while processing {config_type} ({chosen_rel}): {exc}"
             )
 
     return None, {}
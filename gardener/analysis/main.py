@@ -3,13 +3,14 @@ Main analysis module with persistence abstraction
 """
 
 import os
+from concurrent.futures import ThreadPoolExecutor
 
 import networkx as nx
 
 from gardener.analysis.centrality import CentralityCalculator
 from gardener.analysis.graph import DependencyGraphBuilder
 from gardener.analysis.tree import RepositoryAnalyzer
-from gardener.common.defaults import ConfigOverride, GraphAnalysisConfig as cfg, apply_config_overrides
+from gardener.common.defaults import ConfigOverride, GraphAnalysisConfig as cfg, ResourceLimits, apply_config_overrides
 from gardener.common.utils import Logger, get_repo
 from gardener.package_metadata.url_resolver import resolve_package_urls
 from gardener.persistence.file import FilePersistence
@@ -121,11 +122,12 @@ class DependencyAnalyzer:
             Set[str] of package names to exclude
         """
         root_package_distribution_names = self.repo_analyzer.root_package_names
+        external_packages = self.repo_analyzer.external_packages
         all_self_package_names = set(root_package_distribution_names)
         for root_dist_name in root_package_distribution_names:
-            if root_dist_name in self.repo_analyzer.external_packages:
-                import_names = self.repo_analyzer.external_packages[root_dist_name].get("import_names", [])
-                all_self_package_names.update(import_names)
+            package_info = external_packages.get(root_dist_name)
+            if package_info is not None:
+                all_self_package_names.update(package_info.get("import_names", []))
         return all_self_package_names
 
     def _normalize_top_dependencies(self, top_deps_tuples):
@@ -140,13 +142,17 @@ class DependencyAnalyzer:
         """
         top_deps = []
         total_score = sum(score for _, score in top_deps_tuples)
+        percent_per_score = (100.0 / total_score) if total_score > 0 else 0
+        external_packages = self.repo_analyzer.external_packages
         for package_name, score in top_deps_tuples:
-            percentage = (score / total_score * 100) if total_score > 0 else 0
-            repository_url = ""
-            ecosystem = "unknown"
-            if package_name in self.repo_analyzer.external_packages:
-                repository_url = self.repo_analyzer.external_packages[package_name].get("repository_url", "")
-                ecosystem = self.repo_analyzer.external_packages[package_name].get("ecosystem", "unknown")
+            percentage = score * percent_per_score
+            package_info = external_packages.get(package_name)
+            if package_info is not None:
+                repository_url = package_info.get("repository_url", "")
+                ecosystem = package_info.get("ecosystem", "unknown")
+            else:
+                repository_url = ""
+                ecosystem = "unknown"
 
             top_deps.append(
                 {
@@ -158,42 +164,43 @@ class DependencyAnalyzer:
             )
         return top_deps
 
-    def _assemble_results(self, graph, top_deps):
+    def _assemble_results(self, graph, top_deps, include_details=True):
         """
         Assemble final results dict with graph data and analyzer details
 
+        Args:
+            graph: NetworkX graph
+            top_deps (list): Normalized top dependencies
+            include_details (bool): Include the per-file import maps in analyzer_details
+
         Returns:
             Dict with keys: external_packages, dependency_graph, top_dependencies, analyzer_details
         """
+        repo_analyzer = self.repo_analyzer
+        analyzer_details = {}
+        if include_details:
+            analyzer_details["local_imports_map"] = repo_analyzer.local_imports_map
+            analyzer_details["file_imports"] = repo_analyzer.file_imports
+            analyzer_details["file_package_components"] = repo_analyzer.file_package_components
+        analyzer_details["total_files"] = len(repo_analyzer.source_files)
+        analyzer_details["languages_detected"] = list(repo_analyzer.languages_detected)
+
         results = {
-            "external_packages": self.repo_analyzer.external_packages,
+            "external_packages": repo_analyzer.external_packages,
             "dependency_graph": self.graph_builder.get_graph_data() if graph else {},
             "top_dependencies": top_deps,
-            "analyzer_details": {
-                "local_imports_map": self.repo_analyzer.local_imports_map,
-                "file_imports": self.repo_analyzer.file_imports,
-                "file_package_components": self.repo_analyzer.file_package_components,
-                "total_files": len(self.repo_analyzer.source_files),
-                "languages_detected": (
-                    list(
-                        set(
-                            file_info.get("language", "unknown")
-                            for file_info in self.repo_analyzer.source_files.values()
-                        )
-                    )
-                    if self.repo_analyzer.source_files
-                    else []
-                ),
-            },
+            "analyzer_details": analyzer_details,
         }
         return results
 
-    def analyze_dependencies(self, external_packages_with_urls):
+    def analyze_dependencies(self, external_packages_with_urls, include_details=True):
         """
         Analyze dependencies after URLs have been resolved for external packages
 
         Args:
             external_packages_with_urls (dict): The external packages dict, now with 'repository_url' populated
+            include_details (bool): Include the per-file import maps in analyzer_details; set False when only
+                the top dependencies and summary counts are needed
 
         Returns:
             The final analysis results dictionary
@@ -207,6 +214,18 @@ class DependencyAnalyzer:
         # Extract imports from files
         self.repo_analyzer.extract_imports_from_all_files()
 
+        return self._score_dependencies(include_details)
+
+    def _score_dependencies(self, include_details=True):
+        """
+        Build the graph, rank dependencies and assemble results once imports are extracted
+
+        Args:
+            include_details (bool): Include the per-file import maps in analyzer_details
+
+        Returns:
+            The final analysis results dictionary
+        """
         # Build dependency graph and calculate scores
         graph = self._build_dependency_graph()
         ranked_scores = self._calculate_importance_scores(graph)
@@ -219,7 +238,7 @@ class DependencyAnalyzer:
         top_deps = self._normalize_top_dependencies(top_deps_tuples)
 
         # Assemble and return results
-        return self._assemble_results(graph, top_deps)
+        return self._assemble_results(graph, top_deps, include_details)
 
     def _resolve_repository_urls(self, external_packages, url_cache=None):
         """
@@ -236,18 +255,18 @@ class DependencyAnalyzer:
         try:
             resolved_urls = resolve_package_urls(external_packages, self.logger, cache=url_cache)
             for package_name, url in resolved_urls.items():
-                if package_name in external_packages:
-                    external_packages[package_name]["repository_url"] = url
-            for package_name in external_packages:
-                if "repository_url" not in external_packages[package_name]:
-                    external_packages[package_name]["repository_url"] = ""
+                package_info = external_packages.get(package_name)
+                if package_info is not None:
+                    package_info["repository_url"] = url
+            for package_info in external_packages.values():
+                package_info.setdefault("repository_url", "")
         except Exception as e:
             self.logger.warning(f"Error during bulk URL resolution: {e}")
-            for package_name in external_packages:
-                external_packages[package_name].setdefault("repository_url", "")
+            for package_info in external_packages.values():
+                package_info.setdefault("repository_url", "")
         return external_packages
 
-    def analyze(self, repo_path, specific_languages=None, url_cache=None):
+    def analyze(self, repo_path, specific_languages=None, url_cache=None, include_details=True):
         """
         Analyze a repository and return the results as a data structure
 
@@ -257,6 +276,7 @@ class DependencyAnalyzer:
             repo_path (str): Path to the repository to analyze
             specific_languages (list): Optional list of languages to analyze
             url_cache (dict): Optional pre-populated cache for package URLs
+            include_details (bool): Include the per-file import maps in analyzer_details
 
         Returns:
             Dictionary containing:
@@ -268,14 +288,27 @@ class DependencyAnalyzer:
         # Step 1: Discover packages from manifests
         external_packages = self.discover_packages(repo_path, specific_languages)
 
-        # Step 2: Resolve repository URLs for external packages
-        external_packages = self._resolve_repository_urls(external_packages, url_cache)
+        # Worker processes are forked, which is unsafe while another thread is mid-request,
+        # so URL resolution only overlaps with import extraction when extraction runs serially
+        if ResourceLimits.PARSE_WORKERS != 1 or not external_packages:
+            # Step 2: Resolve repository URLs for external packages
+            external_packages = self._resolve_repository_urls(external_packages, url_cache)
+
+            # Step 3: Analyze dependencies with resolved URLs
+            return self.analyze_dependencies(external_packages, include_details)
 
-        # Step 3: Analyze dependencies with resolved URLs
-        return self.analyze_dependencies(external_packages)
+        # Steps 2 and 3 overlap: imports do not depend on URLs, so extraction (CPU-bound) runs here
+        # while URL resolution (network-bound) runs on a thread; scoring waits for both
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            urls_future = executor.submit(self._resolve_repository_urls, external_packages, url_cache)
+            self.repo_analyzer.extract_imports_from_all_files()
+            self.repo_analyzer.external_packages = urls_future.result()
+        return self._score_dependencies(include_details)
 
 
-def analyze_repository(repo_path, specific_languages=None, verbose=False, overrides=None, url_cache=None):
+def analyze_repository(
+    repo_path, specific_languages=None, verbose=False, overrides=None, url_cache=None, include_details=True
+):
     """
     Convenience function to analyze a repository
 
@@ -286,16 +319,35 @@ def analyze_repository(repo_path, specific_languages=None, verbose=False, overri
         specific_languages (list): Optional list of languages to analyze
         verbose (bool): Enable verbose logging
         url_cache (dict): Optional pre-populated cache for package URLs
+        include_details (bool): Include the per-file import maps in analyzer_details
 
     Returns:
         Dictionary containing analysis results
     """
     analyzer = DependencyAnalyzer(verbose=verbose)
+    return _analyze_with_overrides(analyzer, repo_path, specific_languages, overrides, url_cache, include_details)
+
+
+def _analyze_with_overrides(analyzer, repo_path, specific_languages, overrides, url_cache=None, include_details=True):
+    """
+    Run analyzer.analyze, inside a scoped ConfigOverride when overrides are given
+
+    Args:
+        analyzer (DependencyAnalyzer): Analyzer to run
+        repo_path (str): Path to the repository to analyze
+        specific_languages (list): Optional list of languages to analyze
+        overrides (dict): Optional configuration overrides
+        url_cache (dict): Optional pre-populated cache for package URLs
+        include_details (bool): Include the per-file import maps in analyzer_details
+
+    Returns:
+        Dictionary containing analysis results
+    """
     # Prefer scoped overrides when provided to avoid global mutation during tests
     if overrides:
         with ConfigOverride(overrides, logger=analyzer.logger):
-            return analyzer.analyze(repo_path, specific_languages, url_cache=url_cache)
-    return analyzer.analyze(repo_path, specific_languages, url_cache=url_cache)
+            return analyzer.analyze(repo_path, specific_languages, url_cache=url_cache, include_details=include_details)
+    return analyzer.analyze(repo_path, specific_languages, url_cache=url_cache, include_details=include_details)
 
 
 def save_analysis_results(results, output_prefix, persistence, logger):
@@ -321,13 +373,15 @@ def save_analysis_results(results, output_prefix, persistence, logger):
         return False
 
 
-def _maybe_generate_graph_viz(results, output_prefix, persistence, logger):
+def _maybe_generate_graph_viz(results, output_prefix, persistence, logger, live_graph=None):
     """
     If dependency graph present, generate graph HTML and save via persistence
+
+    The analyzer's live graph is used when given; otherwise the graph is rebuilt from the results' node-link data
     """
     if "dependency_graph" in results:
         logger.info("Generating dependency graph visualization...")
-        graph = nx.node_link_graph(results["dependency_graph"])
+        graph = live_graph if live_graph is not None else nx.node_link_graph(results["dependency_graph"])
         try:
             from gardener.visualization.generate_graph import generate_graph_viz
         except Exception as e:  # ImportError or missing optional deps
@@ -343,7 +397,9 @@ def _maybe_generate_graph_viz(results, output_prefix, persistence, logger):
             logger.warning("Failed to generate graph visualization")
 
 
-def generate_and_save_visualizations(results, output_prefix, persistence, logger, minimal_outputs=False):
+def generate_and_save_visualizations(
+    results, output_prefix, persistence, logger, minimal_outputs=False, live_graph=None
+):
     """
     Generate and save interactive visualization HTML file
 
@@ -353,6 +409,7 @@ def generate_and_save_visualizations(results, output_prefix, persistence, logger
         persistence (object): Persistence backend to use
         logger (Logger): Logger instance
         minimal_outputs (bool): Whether to skip visualization generation
+        live_graph (networkx.DiGraph): Optional graph the results were serialized from, reused as is
 
     Returns:
         True if successful, False otherwise
@@ -362,7 +419,7 @@ def generate_and_save_visualizations(results, output_prefix, persistence, logger
         return True
 
     try:
-        _maybe_generate_graph_viz(results, output_prefix, persistence, logger)
+        _maybe_generate_graph_viz(results, output_prefix, persistence, logger, live_graph)
         return True
     except Exception as e:
         logger.error(f"Error generating visualizations: {str(e)}")
@@ -432,7 +489,7 @@ def _determine_output_prefix(abs_path, output_prefix):
     return output_prefix
 
 
-def _persist_and_visualize(results, output_prefix, persistence, logger, minimal_outputs):
+def _persist_and_visualize(results, output_prefix, persistence, logger, minimal_outputs, live_graph=None):
     """
     Save analysis results and generate visualizations (delegates to existing functions)
 
@@ -442,12 +499,15 @@ def _persist_and_visualize(results, output_prefix, persistence, logger, minimal_
         persistence (object): Persistence backend
         logger (Logger): Logger instance
         minimal_outputs (bool): Whether to skip visualizations
+        live_graph (networkx.DiGraph): Optional in-memory dependency graph for the visualization
     """
     save_success = save_analysis_results(results, output_prefix, persistence, logger)
     if not save_success:
         logger.error("Failed to save analysis results")
 
-    viz_success = generate_and_save_visualizations(results, output_prefix, persistence, logger, minimal_outputs)
+    viz_success = generate_and_save_visualizations(
+        results, output_prefix, persistence, logger, minimal_outputs, live_graph
+    )
     if not viz_success:
         logger.warning("Failed to generate some visualizations")
 
@@ -461,15 +521,13 @@ def _report_top_dependencies(results, logger):
         logger (Logger): Logger instance
     """
     if "top_dependencies" in results and results["top_dependencies"]:
-        logger.info(f"\nTop dependencies by {cfg.CENTRALITY_METRIC} score:")
+        # One joined message rather than a logger call per dependency
+        lines = [f"\nTop dependencies by {cfg.CENTRALITY_METRIC} score:"]
         for dep in results["top_dependencies"]:
-            pkg = dep["package_name"]
-            pct = dep["percentage"]
             url = dep.get("package_url", "")
-            if url:
-                logger.info(f"  {pct:.2f}%: {pkg} ({url})")
-            else:
-                logger.info(f"  {pct:.2f}%: {pkg}")
+            suffix = f" ({url})" if url else ""
+            lines.append(f"  {dep['percentage']:.2f}%: {dep['package_name']}{suffix}")
+        logger.info("\n".join(lines))
     elif "error" not in results:
         logger.info("\nNo dependencies were found, or calculation failed")
 
@@ -482,6 +540,7 @@ def run_analysis(
     focus_languages_str=None,
     config_overrides=None,
     persistence=None,
+    include_details=True,
 ):
     """
     Run the full dependency analysis with the specified persistence backend
@@ -494,6 +553,7 @@ def run_analysis(
         focus_languages_str (str): Comma-separated list of languages to focus on
         config_overrides (dict): Optional dictionary of configuration parameter overrides
         persistence (object): Persistence backend to use (defaults to FilePersistence)
+        include_details (bool): Include the per-file import maps in the saved results
 
     Returns:
         Dict of analysis results
@@ -510,12 +570,16 @@ def run_analysis(
 
         focus_languages = _parse_focus_languages(focus_languages_str, logger)
         # Use scoped overrides for the run to avoid global state bleed-through
-        results = analyze_repository(
-            repo_path=abs_path, specific_languages=focus_languages, verbose=verbose, overrides=config_overrides
+        analyzer = DependencyAnalyzer(verbose=verbose)
+        results = _analyze_with_overrides(
+            analyzer, abs_path, focus_languages, config_overrides, include_details=include_details
         )
 
         output_prefix = _determine_output_prefix(abs_path, output_prefix)
-        _persist_and_visualize(results, output_prefix, persistence, logger, minimal_outputs)
+        # Hand the analyzer's graph to the visualization rather than rebuilding it from the node-link data
+        _persist_and_visualize(
+            results, output_prefix, persistence, logger, minimal_outputs, analyzer.graph_builder.graph
+        )
         _report_top_dependencies(results, logger)
         return results
 
@@ -133,13 +133,15 @@ def _scan_secure(repo_path, secure_file_ops, gitignore_spec, all_manifest_files,
         logger (Logger|None): Optional logger for progress and warnings
 
     Returns:
-        Tuple of (source_files, manifest_files, root_manifest_files, js_config_files, ts_config_files)
+        Tuple of (source_files, manifest_files, root_manifest_files, js_config_files, ts_config_files,
+        languages_detected)
     """
     source_files = {}
     manifest_files = []
     root_manifest_files = []
     js_config_files = []
     ts_config_files = []
+    languages_detected = set()
 
     visited_dirs = set()
 
@@ -189,7 +191,8 @@ def _scan_secure(repo_path, secure_file_ops, gitignore_spec, all_manifest_files,
                 _scan_dir_recursive(entry)
                 continue
 
-            if not secure_file_ops.is_file(entry):
+            file_size = secure_file_ops.file_size(entry)
+            if file_size is None:
                 continue
 
             rel_path = secure_file_ops.get_relative_path(full_path)
@@ -214,7 +217,9 @@ def _scan_secure(repo_path, secure_file_ops, gitignore_spec, all_manifest_files,
                     source_files[str(Path(rel_path))] = {
                         "absolute_path": full_path,
                         "language": language,
+                        "size": file_size,
                     }
+                    languages_detected.add(language)
 
     _scan_dir_recursive(repo_path)
     return (
@@ -223,6 +228,7 @@ def _scan_secure(repo_path, secure_file_ops, gitignore_spec, all_manifest_files,
         root_manifest_files,
         js_config_files,
         ts_config_files,
+        languages_detected,
     )
 
 
@@ -239,13 +245,15 @@ def _scan_standard(repo_path, gitignore_spec, all_manifest_files, all_extensions
         logger (Logger|None): Optional logger for progress and warnings
 
     Returns:
-        Tuple of (source_files, manifest_files, root_manifest_files, js_config_files, ts_config_files)
+        Tuple of (source_files, manifest_files, root_manifest_files, js_config_files, ts_config_files,
+        languages_detected)
     """
     source_files = {}
     manifest_files = []
     root_manifest_files = []
     js_config_files = []
     ts_config_files = []
+    languages_detected = set()
 
     for root, dirs, files in os.walk(repo_path, topdown=True):
         filtered_dirs = [
@@ -290,6 +298,7 @@ def _scan_standard(repo_path, gitignore_spec, all_manifest_files, all_extensions
                     language = {".cjs": "javascript", ".mjs": "javascript", ".svelte": "javascript"}.get(ext)
                 if language and language in active_languages:
                     source_files[rel_path] = {"absolute_path": file_path, "language": language}
+                    languages_detected.add(language)
 
     return (
         source_files,
@@ -297,6 +306,7 @@ def _scan_standard(repo_path, gitignore_spec, all_manifest_files, all_extensions
         root_manifest_files,
         js_config_files,
         ts_config_files,
+        languages_detected,
     )
 
 
@@ -366,7 +376,7 @@ def scan_repository(repo_path, secure_file_ops, focus_languages, language_handle
 
     Returns:
         dict: Keys: source_files, manifest_files, root_manifest_files, js_config_files,
-            ts_config_files, solidity_src_path, submodule_data, gitignore_spec
+            ts_config_files, languages_detected, solidity_src_path, submodule_data, gitignore_spec
     """
     gitignore_spec = load_gitignore(secure_file_ops, logger)
 
@@ -388,6 +398,7 @@ def scan_repository(repo_path, secure_file_ops, focus_languages, language_handle
             root_manifest_files,
             js_config_files,
             ts_config_files,
+            languages_detected,
         ) = _scan_secure(
             repo_path,
             secure_file_ops,
@@ -404,6 +415,7 @@ def scan_repository(repo_path, secure_file_ops, focus_languages, language_handle
             root_manifest_files,
             js_config_files,
             ts_config_files,
+            languages_detected,
         ) = _scan_standard(
             repo_path,
             gitignore_spec,
@@ -422,6 +434,7 @@ def scan_repository(repo_path, secure_file_ops, focus_languages, language_handle
         "root_manifest_files": root_manifest_files,
         "js_config_files": js_config_files,
         "ts_config_files": ts_config_files,
+        "languages_detected": languages_detected,
         "solidity_src_path": solidity_src_path,
         "submodule_data": submodule_data,
         "gitignore_spec": gitignore_spec,
@@ -6,6 +6,7 @@ import extraction using helper modules while preserving the public API surface
 of RepositoryAnalyzer
 """
 
+import itertools
 import os
 from collections import defaultdict
 from pathlib import Path
@@ -57,6 +58,7 @@ class RepositoryAnalyzer:
         self.manifest_files = []
         self.root_manifest_files = []
         self.source_files = {}
+        self.languages_detected = set()  # languages of the entries in source_files, kept current as files are added
         self.external_packages = {}
         self.file_imports = defaultdict(list)
         self.file_package_components = defaultdict(list)
@@ -143,6 +145,7 @@ class RepositoryAnalyzer:
         self.root_manifest_files = result["root_manifest_files"]
         self.js_config_files = result["js_config_files"]
         self.ts_config_files = result["ts_config_files"]
+        self.languages_detected = result["languages_detected"]
         self.solidity_src_path = result["solidity_src_path"]
         self.submodule_data = result["submodule_data"]
         self.gitignore_spec = result["gitignore_spec"]
@@ -297,6 +300,7 @@ class RepositoryAnalyzer:
             logger=self.logger,
         )
 
+        scanned_count = len(self.source_files)
         file_imports, local_imports_map, file_package_components = imports_mod.extract_imports(
             self.source_files,
             self.language_handlers,
@@ -310,6 +314,10 @@ class RepositoryAnalyzer:
         self.local_imports_map = local_imports_map
         self.file_package_components = file_package_components
 
+        # Local resolution can append files found on disk; pick up their languages too
+        for file_info in itertools.islice(self.source_files.values(), scanned_count, None):
+            self.languages_detected.add(file_info.get("language", "unknown"))
+
     def _get_local_resolver(self):
         """
         Lazily construct and return the LocalImportResolver
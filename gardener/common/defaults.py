@@ -15,7 +15,12 @@ class GraphAnalysisConfig:
     # PageRank/Katz parameters
     CENTRALITY_METRIC = "pagerank"  # Either 'pagerank' or 'katz'
     PAGERANK_ALPHA = 0.85  # Damping parameter for PageRank
+    PAGERANK_AITKEN_PERIOD = 0  # Aitken-extrapolate PageRank every N (>= 3) iterations; 0 disables
     KATZ_ALPHA = 0.15  # Alpha parameter for Katz
+    CENTRALITY_TOL = 1e-6  # Convergence tolerance of centrality iterations; bounds the iteration count
+    CENTRALITY_DTYPE = "float32"  # Precision of centrality iterations; scores only need to rank, not 1e-15 accuracy
+    CENTRALITY_WORKERS = 1  # Threads for row-chunked sparse mat-vecs on large graphs (1 = serial)
+    CENTRALITY_GPU_MIN_EDGES = 1000000  # Offload to nx-cugraph (when installed) at or above this many edges
 
     # Edge weights (tunable via CLI overrides)
     EDGE_W_IMPORTS_PACKAGE = 0.5
@@ -71,6 +76,9 @@ class ResourceLimits:
     # Timeouts
     PARSE_TIMEOUT = 300  # Seconds to timeout a single file parsing
 
+    # Import extraction
+    PARSE_WORKERS = 1  # Processes for per-file parsing and import extraction (1 = serial, 0 = one per CPU)
+
     # Path and string limits (should not need retuning)
     MAX_PATH_LENGTH = 4096  # Maximum file path length
     MAX_URL_LENGTH = 2048  # Maximum URL length
@@ -4,6 +4,7 @@ Secure file operations available in lieu of standard file operations
 
 import json
 import os
+import stat
 from contextlib import contextmanager
 from pathlib import Path
 
@@ -187,6 +188,23 @@ class SecureFileAccess:
         safe_path = self.validate_path(path)
         return safe_path.read_text(encoding=encoding)
 
+    def read_bytes(self, path):
+        """
+        Read raw file content
+
+        Args:
+            path (str): Path to the file
+
+        Returns:
+            File content as bytes
+
+        Raises:
+            SecurityError: If path validation fails
+            IOError: If file operation fails
+        """
+        safe_path = self.validate_path(path)
+        return safe_path.read_bytes()
+
     def write_text(self, path, content, encoding="utf-8"):
         """
         Write text to file
@@ -274,6 +292,29 @@ class SecureFileOps:
         except Exception as e:
             raise FileOperationError(f"Failed to read file {path}: {e}")
 
+    def read_bytes(self, path):
+        """
+        Read raw file content safely
+
+        Args:
+            path (str): Path to the file
+
+        Returns:
+            File content as bytes
+
+        Raises:
+            FileOperationError: If read fails
+            SecurityError: If security constraints are violated
+        """
+        try:
+            return self.secure_access.read_bytes(path)
+        except SecurityError as e:
+            if self.logger:
+                self.logger.error(f"Security error reading file {path}: {e}")
+            raise
+        except Exception as e:
+            raise FileOperationError(f"Failed to read file {path}: {e}")
+
     def write_file(self, path, content, encoding="utf-8"):
         """
         Write content to file safely
@@ -320,6 +361,38 @@ class SecureFileOps:
         """
         return self.secure_access.is_file(path)
 
+    def stat(self, path):
+        """
+        Stat a path within the repository, following symlinks
+
+        Args:
+            path (str): Path to check
+
+        Returns:
+            os.stat_result, or None if path does not exist or is not within repository
+        """
+        try:
+            return self.secure_access.validate_path(path).stat()
+        except (SecurityError, OSError):
+            return None
+
+    def file_size(self, path):
+        """
+        Get the size of a regular file within the repository
+
+        Answers is_file and the size with a single stat
+
+        Args:
+            path (str): Path to check
+
+        Returns:
+            Size in bytes, or None if path is not a regular file within repository
+        """
+        st = self.stat(path)
+        if st is None:
+            return None
+        return st.st_size if stat.S_ISREG(st.st_mode) else None
+
     def is_dir(self, path):
         """
         Check if a path is a directory within the repository
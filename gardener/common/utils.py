@@ -44,6 +44,20 @@ class Logger:
         self.seen_messages = set()  # Track already seen messages to avoid duplication
         self.log_level = 1 if not verbose else 0  # 0=debug, 1=info, 2=warning, 3=error
 
+    def isEnabledFor(self, level):
+        """
+        Report whether messages at a standard logging level would be emitted
+
+        Mirrors logging.Logger.isEnabledFor so callers can skip building messages
+
+        Args:
+            level (int): Standard logging level (e.g., logging.DEBUG)
+
+        Returns:
+            True if this logger emits messages at that level
+        """
+        return self.log_level <= min(max(level // 10 - 1, 0), 3)
+
     def debug(self, message):
         """
         Log a debug message (only in verbose mode)
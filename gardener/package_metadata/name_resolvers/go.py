@@ -7,6 +7,8 @@ import re
 from gardener.common.secure_file_ops import FileOperationError
 from gardener.package_metadata.name_resolvers.base import BaseResolver
 
+_LINE_COMMENT = re.compile(r"//.*")
+
 
 class GoResolver(BaseResolver):
     """
@@ -49,7 +51,7 @@ class GoResolver(BaseResolver):
         in_require_block = False
 
         for line in lines:
-            line = re.sub(r"//.*", "", line).strip()
+            line = _LINE_COMMENT.sub("", line).strip()
             if not line:
                 continue
 
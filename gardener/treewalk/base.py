@@ -63,6 +63,33 @@ class TreeVisitor:
             # Always decrement depth after visiting
             self._depth -= 1
 
+    def visit_import_nodes(self, tree_node, import_query=None):
+        """
+        Visit a whole tree, or only the import nodes an import query captures
+
+        The query runs in tree-sitter, so only the captured subtrees are walked in Python. Nodes nested in
+        another captured node are left to that node's visit method, which matches a full traversal
+
+        Args:
+            tree_node (object): Root node of the tree
+            import_query (object): Query from LanguageHandler.import_query capturing @node, or None
+        """
+        if import_query is None:
+            self.visit(tree_node)
+            return
+
+        captures = import_query.captures(tree_node)
+        if isinstance(captures, dict):
+            nodes = list(captures.get("node", []))
+        else:  # py-tree-sitter < 0.23 returns (node, capture_name) pairs
+            nodes = [node for node, name in captures if name == "node"]
+        nodes.sort(key=lambda node: (node.start_byte, -node.end_byte))
+        covered_until = -1
+        for node in nodes:
+            if node.start_byte >= covered_until:
+                self.visit(node)
+                covered_until = node.end_byte
+
     def generic_visit(self, node):
         """
         Default visit method that traverses all children
@@ -88,6 +115,10 @@ class LanguageHandler(ABC):
     This class will be extended as additional languages are supported
     """
 
+    # Tree-sitter query capturing, as @node, every node type the import visitor has a visit method for;
+    # None makes extract_imports walk the whole tree
+    IMPORT_QUERY = None
+
     @abstractmethod
     def get_manifest_files(self):
         """
@@ -114,7 +145,9 @@ class LanguageHandler(ABC):
         pass
 
     @abstractmethod
-    def extract_imports(self, tree_node, rel_path, file_components_dict, local_resolver_func, logger=None):
+    def extract_imports(
+        self, tree_node, rel_path, file_components_dict, local_resolver_func, logger=None, import_query=None
+    ):
         """
         Extract imports from a tree node
 
@@ -124,6 +157,7 @@ class LanguageHandler(ABC):
             file_components_dict (dict): Dictionary to update with file components
             local_resolver_func (callable): Function to resolve local module paths
             logger (Logger): Optional logger instance for debug output
+            import_query (object): Optional query from import_query() for the tree's language
 
         Returns:
             Tuple of (external_imports, local_imports) where:
@@ -132,6 +166,23 @@ class LanguageHandler(ABC):
         """
         pass
 
+    def import_query(self, language):
+        """
+        Compile IMPORT_QUERY for the tree-sitter language the handler's trees are parsed with
+
+        Args:
+            language (object): tree-sitter Language, e.g. the parser's
+
+        Returns:
+            Compiled query, or None when the handler has none or the grammar rejects it
+        """
+        if self.IMPORT_QUERY is None or language is None:
+            return None
+        try:
+            return language.query(self.IMPORT_QUERY)
+        except Exception:
+            return None
+
     def get_file_extensions(self):
         """
         Get the file extensions supported by this language handler
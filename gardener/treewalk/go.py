@@ -114,6 +114,8 @@ class GoImportVisitor(TreeVisitor):
 class GoLanguageHandler(LanguageHandler):
     """Handler for Go language"""
 
+    IMPORT_QUERY = "(import_declaration) @node"
+
     def __init__(self, logger=None):
         """
         Args:
@@ -164,7 +166,9 @@ class GoLanguageHandler(LanguageHandler):
             return package_path
         return None  # Likely standard library
 
-    def extract_imports(self, tree_node, rel_path, file_components_dict, local_resolver_func, logger=None):
+    def extract_imports(
+        self, tree_node, rel_path, file_components_dict, local_resolver_func, logger=None, import_query=None
+    ):
         """
         Extract external package imports and resolved local imports from a Go source file
 
@@ -174,10 +178,11 @@ class GoLanguageHandler(LanguageHandler):
             file_components_dict (dict): Dictionary to track imported external components
             local_resolver_func (callable): Function to resolve local imports
             logger (Logger): Optional logger instance for debug output
+            import_query (object): Optional query from import_query() for the tree's language
 
         Returns:
             Tuple of (external_imports, local_imports)
         """
         visitor = GoImportVisitor(rel_path, file_components_dict, local_resolver_func)
-        visitor.visit(tree_node)
+        visitor.visit_import_nodes(tree_node, import_query)
         return visitor.imports, visitor.local_imports
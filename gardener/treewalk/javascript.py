@@ -351,6 +351,13 @@ class JSImportVisitor(TreeVisitor):
 class JavaScriptLanguageHandler(LanguageHandler):
     """Handler for JavaScript language"""
 
+    # Only require() and import() calls are import nodes; other calls merely lead the visitor to nested ones
+    IMPORT_QUERY = """
+    [(import_statement) (export_statement)] @node
+    (call_expression function: (identifier) @_function (#eq? @_function "require")) @node
+    (call_expression function: (import)) @node
+    """
+
     def __init__(self, logger=None):
         """
         Args:
@@ -441,10 +448,12 @@ class JavaScriptLanguageHandler(LanguageHandler):
         else:
             return package_path.split("/")[0]
 
-    def extract_imports(self, tree_node, rel_path, file_components_dict, local_resolver_func, logger=None):
+    def extract_imports(
+        self, tree_node, rel_path, file_components_dict, local_resolver_func, logger=None, import_query=None
+    ):
         """
         Extract external package imports and resolved local imports from a JS/TS source file
         """
         visitor = JSImportVisitor(rel_path, file_components_dict, local_resolver_func, logger)
-        visitor.visit(tree_node)
+        visitor.visit_import_nodes(tree_node, import_query)
         return list(set(visitor.imports)), list(set(visitor.local_imports))
@@ -378,6 +378,8 @@ class PythonLanguageHandler(LanguageHandler):
     manifest files to extract imports, definitions, and references
     """
 
+    IMPORT_QUERY = "[(import_statement) (import_from_statement) (future_import_statement)] @node"
+
     def __init__(self, logger=None):
         """
         Args:
@@ -883,7 +885,9 @@ class PythonLanguageHandler(LanguageHandler):
 
         return package_path.split(".")[0]
 
-    def extract_imports(self, tree_node, rel_path, file_components_dict, local_resolver_func, logger=None):
+    def extract_imports(
+        self, tree_node, rel_path, file_components_dict, local_resolver_func, logger=None, import_query=None
+    ):
         """
         Extract external package imports and resolved local imports from a Python source file
 
@@ -893,10 +897,11 @@ class PythonLanguageHandler(LanguageHandler):
             file_components_dict (dict): Dictionary to track imported external components
             local_resolver_func (callable): Function to resolve local module paths
             logger (Logger): Optional logger instance for debug output
+            import_query (object): Optional query from import_query() for the tree's language
 
         Returns:
             Tuple of (list of external package names, list of resolved local file paths)
         """
         visitor = PythonImportVisitor(rel_path, file_components_dict, local_resolver_func)
-        visitor.visit(tree_node)
+        visitor.visit_import_nodes(tree_node, import_query)
         return visitor.imports, visitor.local_imports
@@ -88,6 +88,14 @@ class RustImportVisitor(TreeVisitor):
         # Then proceed with the normal visitation logic for all nodes
         super().visit(node)
 
+    def visit_import_nodes(self, tree_node, import_query=None):
+        """
+        Run the inline module pre-scan that visit() would do at the root before visiting the captured nodes
+        """
+        if import_query is not None and tree_node.type == "source_file":
+            self._scan_for_inline_modules(tree_node)
+        super().visit_import_nodes(tree_node, import_query)
+
     def _get_initial_segment(self, node):
         """Helper to get the first textual segment of a use path node"""
         if node.type == "identifier":
@@ -424,6 +432,8 @@ class RustLanguageHandler(LanguageHandler):
     to extract imports, definitions, and references
     """
 
+    IMPORT_QUERY = "[(use_declaration) (attribute_item) (mod_item)] @node"
+
     def __init__(self, logger=None):
         """
         Args:
@@ -564,7 +574,9 @@ class RustLanguageHandler(LanguageHandler):
             else:
                 return None
 
-    def extract_imports(self, tree_node, rel_path, file_components_dict, local_resolver_func, logger=None):
+    def extract_imports(
+        self, tree_node, rel_path, file_components_dict, local_resolver_func, logger=None, import_query=None
+    ):
         """
         Extract external crate imports and resolved local imports from a Rust source file
 
@@ -574,11 +586,12 @@ class RustLanguageHandler(LanguageHandler):
             file_components_dict (dict): Dictionary to track imported external components
             local_resolver_func (callable): Function to resolve local Rust module paths
             logger (Logger): Optional logger instance for debug output
+            import_query (object): Optional query from import_query() for the tree's language
 
         Returns:
             Tuple of (list of external crate names, list of resolved local file paths)
         """
         visitor = RustImportVisitor(rel_path, file_components_dict, local_resolver_func)
-        visitor.visit(tree_node)
+        visitor.visit_import_nodes(tree_node, import_query)
         # Deduplicate external imports before returning
         return list(set(visitor.imports)), visitor.local_imports
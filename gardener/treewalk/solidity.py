@@ -265,6 +265,8 @@ class SolidityLanguageHandler(LanguageHandler):
     Handler for Solidity language
     """
 
+    IMPORT_QUERY = "(import_directive) @node"
+
     def __init__(self, logger=None):
         """
         Args:
@@ -491,7 +493,9 @@ class SolidityLanguageHandler(LanguageHandler):
             # Otherwise, return the first part as before
             return parts[0]
 
-    def extract_imports(self, tree_node, rel_path, file_components_dict, local_resolver_func, logger=None):
+    def extract_imports(
+        self, tree_node, rel_path, file_components_dict, local_resolver_func, logger=None, import_query=None
+    ):
         """
         Extract external package imports and resolved local imports from a Solidity source file
 
@@ -503,6 +507,7 @@ class SolidityLanguageHandler(LanguageHandler):
             file_components_dict (dict): Dictionary to track imported external components
             local_resolver_func (callable): Function to resolve local Solidity import paths
             logger (Logger): Optional logger instance for debug output
+            import_query (object): Optional query from import_query() for the tree's language
 
         Returns:
             Tuple of (list of external package names, list of resolved local file paths)
@@ -517,7 +522,7 @@ class SolidityLanguageHandler(LanguageHandler):
                 return [], []  # Cannot proceed without a tree
 
         visitor = SolidityImportVisitor(rel_path, file_components_dict, local_resolver_func, logger)
-        visitor.visit(tree_node)
+        visitor.visit_import_nodes(tree_node, import_query)
 
         # Deduplicate imports before returning
         return list(set(visitor.imports)), list(set(visitor.local_imports))
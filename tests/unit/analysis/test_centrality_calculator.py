@@ -29,3 +29,245 @@ def test_centrality_scores_attached(logger):
         scores2 = builder.calculate_importance()
         assert scores2, "Expected non-empty centrality scores for katz"
         assert "katz" in builder.graph.nodes["pkg"]
+
+
+def _weighted_digraph():
+    import networkx as nx
+
+    G = nx.DiGraph()
+    G.add_edge("a.py", "b.py", weight=0.7)
+    G.add_edge("a.py", "pkg", weight=0.5)
+    G.add_edge("b.py", "pkg", weight=0.5)
+    G.add_edge("b.py", "pkg.Comp", weight=1.0)
+    G.add_edge("pkg", "pkg.Comp", weight=1.0)
+    G.add_node("orphan")
+    return G
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("dtype, rel", [("float64", 1e-6), ("float32", 1e-5)])
+def test_pagerank_matches_networkx(logger, dtype, rel):
+    import networkx as nx
+
+    from gardener.analysis.centrality import CentralityCalculator
+    from gardener.common.defaults import GraphAnalysisConfig as cfg
+
+    G = _weighted_digraph()
+    with ConfigOverride({"CENTRALITY_DTYPE": dtype}, logger=logger):
+        ranked = CentralityCalculator(logger)._calculate_pagerank(G)
+    expected = nx.pagerank(G, weight="weight", alpha=cfg.PAGERANK_ALPHA)
+    assert ranked.keys() == expected.keys()
+    for node, score in expected.items():
+        assert ranked[node] == pytest.approx(score, rel=rel)
+
+
+@pytest.mark.unit
+def test_csr_conversion_reused_across_weight_variants(logger):
+    from gardener.analysis.centrality import CentralityCalculator
+
+    G = _weighted_digraph()
+    calc = CentralityCalculator(logger)
+    nodelist, weighted = calc._graph_to_csr(G)
+    nodelist2, unweighted = calc._graph_to_csr(G, use_weights=False)
+    assert nodelist2 is nodelist
+    assert set(unweighted.data.tolist()) == {1.0}
+    # Binarizing for the fallback must not clobber the cached weighted matrix
+    assert calc._graph_to_csr(G)[1] is weighted
+    assert 0.5 in weighted.data.tolist()
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("dtype", ["float64", "float32"])
+def test_katz_matches_networkx(logger, dtype):
+    import networkx as nx
+
+    from gardener.analysis.centrality import CentralityCalculator
+    from gardener.common.defaults import GraphAnalysisConfig as cfg
+
+    G = _weighted_digraph()
+    with ConfigOverride({"CENTRALITY_DTYPE": dtype}, logger=logger):
+        ranked = CentralityCalculator(logger)._calculate_katz(G)
+    expected = nx.katz_centrality(G, alpha=cfg.KATZ_ALPHA, beta=1.0, normalized=False, weight="weight")
+    for node, score in expected.items():
+        assert ranked[node] == pytest.approx(score, rel=1e-5)
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("alpha", [0.05, 0.15])
+def test_katz_top_k_matches_full_ranking(logger, alpha):
+    import networkx as nx
+
+    from gardener.analysis.centrality import CentralityCalculator
+
+    G = nx.gnp_random_graph(200, 0.01, directed=True, seed=7)
+    with ConfigOverride({"CENTRALITY_METRIC": "katz", "KATZ_ALPHA": alpha}, logger=logger):
+        calc = CentralityCalculator(logger)
+        full = calc.calculate_importance(G)
+        top = calc.calculate_importance(G, top_k=5)
+
+    expected = sorted(full, key=full.get, reverse=True)[:5]
+    assert list(top) == expected
+    for node in expected:
+        assert top[node] == pytest.approx(full[node], rel=1e-4)
+
+
+@pytest.mark.unit
+def test_chunked_spmv_matches_serial(logger, monkeypatch):
+    import networkx as nx
+
+    from gardener.analysis import centrality
+    from gardener.analysis.centrality import CentralityCalculator
+
+    G = nx.gnp_random_graph(300, 0.02, directed=True, seed=3)
+    serial = CentralityCalculator(logger)._calculate_pagerank(G)
+
+    monkeypatch.setattr(centrality, "PARALLEL_SPMV_MIN_NNZ", 0)
+    with ConfigOverride({"CENTRALITY_WORKERS": 3}, logger=logger):
+        chunked = CentralityCalculator(logger)._calculate_pagerank(G)
+
+    assert chunked == pytest.approx(serial)
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("metric", ["pagerank", "katz"])
+def test_edgeless_graph_short_circuits_to_constant_scores(logger, metric, monkeypatch):
+    import networkx as nx
+
+    from gardener.analysis.centrality import CentralityCalculator
+
+    G = nx.DiGraph()
+    G.add_nodes_from(["a.py", "b.py", "pkg"])
+    calc = CentralityCalculator(logger)
+    if metric == "pagerank":
+        expected = nx.pagerank(G)
+    else:
+        expected = nx.katz_centrality(G, beta=1.0, normalized=False)
+    with ConfigOverride({"CENTRALITY_METRIC": metric}, logger=logger):
+        monkeypatch.setattr(calc, "_graph_to_csr", lambda *a, **k: pytest.fail("matrix should not be built"))
+        ranked = calc.calculate_importance(G)
+
+    assert ranked == pytest.approx(expected)
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("metric", ["pagerank", "katz"])
+def test_warm_start_matches_cold_start(logger, metric):
+    import networkx as nx
+
+    from gardener.analysis.centrality import CentralityCalculator
+
+    G = nx.gnp_random_graph(200, 0.02, directed=True, seed=5)
+    H = G.copy()
+    H.add_edge(0, 5)
+    H.add_edge("new", 0)
+
+    warm = CentralityCalculator(logger)
+    compute = warm._calculate_pagerank if metric == "pagerank" else warm._calculate_katz
+    compute(G)
+    assert warm._warm_start_vector((metric, True), list(H), 1.0, "float64") is not None
+
+    cold = CentralityCalculator(logger)
+    cold_compute = cold._calculate_pagerank if metric == "pagerank" else cold._calculate_katz
+    assert compute(H) == pytest.approx(cold_compute(H), abs=1e-5)
+
+
+@pytest.mark.unit
+def test_centrality_tolerance_is_configurable(logger):
+    import networkx as nx
+
+    from gardener.analysis.centrality import CentralityCalculator
+
+    G = nx.gnp_random_graph(200, 0.02, directed=True, seed=7)
+    with ConfigOverride({"CENTRALITY_DTYPE": "float64", "CENTRALITY_TOL": 1e-10}, logger=logger):
+        ranked = CentralityCalculator(logger)._calculate_pagerank(G)
+
+    assert ranked == pytest.approx(nx.pagerank(G, tol=1e-12), rel=1e-6)
+
+
+@pytest.mark.unit
+def test_fused_pagerank_step_matches_scipy_loop(logger, monkeypatch):
+    import networkx as nx
+
+    from gardener.analysis import centrality
+    from gardener.analysis.centrality import CentralityCalculator
+
+    G = nx.gnp_random_graph(150, 0.03, directed=True, seed=11)
+    monkeypatch.setattr(centrality, "NUMBA_AVAILABLE", False)
+    expected = CentralityCalculator(logger)._calculate_pagerank(G)
+
+    # Runs the kernel as plain Python when numba is not installed
+    monkeypatch.setattr(centrality, "NUMBA_AVAILABLE", True)
+    fused = CentralityCalculator(logger)._calculate_pagerank(G)
+
+    assert fused == pytest.approx(expected, rel=1e-5)
+
+
+@pytest.mark.unit
+def test_transition_matrix_reused_across_calls(logger):
+    from gardener.analysis.centrality import CentralityCalculator
+
+    G = _weighted_digraph()
+    calc = CentralityCalculator(logger)
+    first = calc._calculate_pagerank(G)
+    _, M, dangling = calc._transition_matrix(G)
+
+    assert calc._calculate_pagerank(G) == pytest.approx(first, rel=1e-5)
+    assert calc._transition_matrix(G)[1] is M
+    assert dangling.tolist() == [G.out_degree(n) == 0 for n in G]
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("metric", ["pagerank", "katz"])
+def test_rcm_reordering_preserves_scores(logger, metric, monkeypatch):
+    import networkx as nx
+
+    from gardener.analysis import centrality
+    from gardener.analysis.centrality import CentralityCalculator
+
+    G = nx.gnp_random_graph(300, 0.02, directed=True, seed=13)
+    compute = "_calculate_pagerank" if metric == "pagerank" else "_calculate_katz"
+    expected = getattr(CentralityCalculator(logger), compute)(G)
+
+    monkeypatch.setattr(centrality, "RCM_MIN_NODES", 0)
+    calc = CentralityCalculator(logger)
+    reordered = getattr(calc, compute)(G)
+
+    assert calc._graph_to_csr(G)[0] != list(G)
+    assert reordered == pytest.approx(expected, rel=1e-5)
+
+
+@pytest.mark.unit
+def test_aitken_extrapolation_converges_to_pagerank(logger):
+    import networkx as nx
+
+    from gardener.analysis.centrality import CentralityCalculator
+
+    G = nx.DiGraph(nx.gn_graph(300, seed=17))
+    overrides = {"CENTRALITY_DTYPE": "float64", "CENTRALITY_TOL": 1e-10, "PAGERANK_AITKEN_PERIOD": 3}
+    with ConfigOverride(overrides, logger=logger):
+        ranked = CentralityCalculator(logger)._calculate_pagerank(G)
+
+    assert sum(ranked.values()) == pytest.approx(1.0)
+    assert ranked == pytest.approx(nx.pagerank(G, tol=1e-12), rel=1e-6)
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("metric", ["pagerank", "katz"])
+def test_raw_importance_matches_shielded_call(logger, metric):
+    from gardener.analysis.centrality import CentralityCalculator
+
+    G = _weighted_digraph()
+    with ConfigOverride({"CENTRALITY_METRIC": metric}, logger=logger):
+        expected = CentralityCalculator(logger).calculate_importance(G)
+        raw = CentralityCalculator().calculate_importance_raw(G)
+
+    assert raw == pytest.approx(expected)
+
+
+@pytest.mark.unit
+def test_raw_importance_raises_on_invalid_metric(logger):
+    from gardener.analysis.centrality import CentralityCalculator
+
+    with ConfigOverride({"CENTRALITY_METRIC": "bogus"}, logger=logger):
+        with pytest.raises(KeyError):
+            CentralityCalculator().calculate_importance_raw(_weighted_digraph())
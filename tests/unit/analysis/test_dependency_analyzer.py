@@ -0,0 +1,98 @@
+"""
+Unit tests for DependencyAnalyzer orchestration helpers
+"""
+
+import os
+import tempfile
+import threading
+
+import networkx as nx
+
+from gardener.analysis import main as main_mod
+from gardener.analysis.main import DependencyAnalyzer
+from gardener.analysis.tree import RepositoryAnalyzer
+from gardener.common.defaults import ResourceLimits
+from gardener.visualization import generate_graph
+
+
+def test_normalize_top_dependencies_adds_percentages_and_metadata():
+    """Test that scores become percentages and known packages get their URL and ecosystem"""
+    with tempfile.TemporaryDirectory() as repo_dir:
+        analyzer = DependencyAnalyzer()
+        analyzer.repo_analyzer = RepositoryAnalyzer(repo_dir, None, analyzer.logger)
+        analyzer.repo_analyzer.external_packages = {
+            "requests": {"ecosystem": "pypi", "repository_url": "https://github.com/psf/requests"}
+        }
+
+        top_deps = analyzer._normalize_top_dependencies([("requests", 3.0), ("unknown-pkg", 1.0)])
+
+        assert top_deps[0] == {
+            "package_name": "requests",
+            "percentage": 75.0,
+            "package_url": "https://github.com/psf/requests",
+            "ecosystem": "pypi",
+        }
+        assert top_deps[1]["percentage"] == 25.0
+        assert top_deps[1]["package_url"] == ""
+        assert top_deps[1]["ecosystem"] == "unknown"
+        assert analyzer._normalize_top_dependencies([("requests", 0.0)])[0]["percentage"] == 0
+
+
+def test_graph_viz_reuses_live_graph(monkeypatch):
+    """Test that the visualization gets the live graph instead of one rebuilt from node-link data"""
+    seen = []
+    monkeypatch.setattr(generate_graph, "generate_graph_viz", lambda graph, logger: seen.append(graph) or "<html>")
+
+    class _Persistence:
+        def save_graph_visualization(self, graph_html, output_prefix):
+            pass
+
+    graph = nx.DiGraph()
+    graph.add_edge("a.py", "pkg")
+    results = {"dependency_graph": main_mod.DependencyGraphBuilder._serialize_graph(graph)}
+    logger = DependencyAnalyzer().logger
+
+    main_mod._maybe_generate_graph_viz(results, "out", _Persistence(), logger, live_graph=graph)
+    main_mod._maybe_generate_graph_viz(results, "out", _Persistence(), logger)
+
+    assert seen[0] is graph
+    assert seen[1] is not graph and set(seen[1].edges) == set(graph.edges)
+
+
+def test_assemble_results_can_omit_per_file_details():
+    """Test that include_details=False keeps only the summary entries in analyzer_details"""
+    with tempfile.TemporaryDirectory() as repo_dir:
+        analyzer = DependencyAnalyzer()
+        analyzer.repo_analyzer = RepositoryAnalyzer(repo_dir, None, analyzer.logger)
+        analyzer.repo_analyzer.source_files = {"a.py": {"language": "python"}}
+        analyzer.repo_analyzer.languages_detected = {"python"}
+
+        full = analyzer._assemble_results(None, [])["analyzer_details"]
+        summary = analyzer._assemble_results(None, [], include_details=False)["analyzer_details"]
+
+        assert {"local_imports_map", "file_imports", "file_package_components"} <= set(full)
+        assert summary == {"total_files": 1, "languages_detected": ["python"]}
+
+
+def test_analyze_resolves_urls_alongside_import_extraction(monkeypatch):
+    """Test that URLs resolved on the helper thread reach the results when extraction runs serially"""
+    resolver_threads = []
+
+    def _fake_resolve(packages, logger, cache=None):
+        resolver_threads.append(threading.get_ident())
+        return {name: f"https://example.com/{name}" for name in packages}
+
+    monkeypatch.setattr(main_mod, "resolve_package_urls", _fake_resolve)
+    monkeypatch.setattr(ResourceLimits, "PARSE_WORKERS", 1)
+    with tempfile.TemporaryDirectory() as repo_dir:
+        with open(os.path.join(repo_dir, "requirements.txt"), "w") as f:
+            f.write("requests==2.31.0\n")
+        with open(os.path.join(repo_dir, "app.py"), "w") as f:
+            f.write("import requests\n\nrequests.get('https://example.com')\n")
+
+        results = DependencyAnalyzer().analyze(repo_dir)
+
+    assert resolver_threads and resolver_threads[0] != threading.get_ident()
+    assert results["external_packages"]["requests"]["repository_url"] == "https://example.com/requests"
+    assert results["top_dependencies"][0]["package_url"] == "https://example.com/requests"
+    assert results["analyzer_details"]["file_imports"]["app.py"] == ["requests"]
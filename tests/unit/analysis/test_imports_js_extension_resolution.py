@@ -46,3 +46,31 @@ def test_relative_js_resolution_uses_alias_extensions_when_available(tmp_path):
 
     resolved = lir.resolve_js('src/main.js', './foo')
     assert resolved == 'src/foo.customx'
+
+
+def test_legacy_path_aliases_resolve_in_configuration_order(tmp_path):
+    """
+    Legacy tsconfig paths are tried in declaration order, against files registered after construction too
+    """
+    source_files = {
+        'lib/shared/index.ts': {'absolute_path': str(tmp_path / 'lib/shared/index.ts'), 'language': 'typescript'},
+        'src/shared.js': {'absolute_path': str(tmp_path / 'src/shared.js'), 'language': 'javascript'},
+    }
+    lir = LocalImportResolver(
+        repo_path=str(tmp_path),
+        source_files=source_files,
+        alias_resolver=None,
+        js_ts_base_url=None,
+        js_ts_path_aliases={'@app/*': ['lib/*', 'src/*'], '@app*': ['src/*'], '@app/util': ['src/util']},
+        go_module_path=None,
+        remappings=None,
+        hardhat_remappings=None,
+        solidity_src_path=None,
+        logger=None,
+    )
+
+    assert lir._js_legacy_path_alias('src/main.js', '@app/shared') == 'lib/shared/index.ts'
+    assert lir._js_legacy_path_alias('src/main.js', '@app/util') is None
+
+    source_files['src/util.mjs'] = {'absolute_path': str(tmp_path / 'src/util.mjs'), 'language': 'javascript'}
+    assert lir._js_legacy_path_alias('src/main.js', '@app/util') == 'src/util.mjs'
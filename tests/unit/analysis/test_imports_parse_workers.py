@@ -0,0 +1,37 @@
+import pytest
+
+from gardener.analysis.tree import RepositoryAnalyzer
+from gardener.common.defaults import ConfigOverride
+from gardener.treewalk.javascript import JavaScriptLanguageHandler
+from gardener.treewalk.python import PythonLanguageHandler
+
+
+def _extract(repo_path, logger):
+    analyzer = RepositoryAnalyzer(str(repo_path), logger=logger)
+    analyzer.register_language_handler("python", PythonLanguageHandler(logger))
+    analyzer.register_language_handler("javascript", JavaScriptLanguageHandler(logger))
+    analyzer.scan_repo()
+    analyzer.extract_imports_from_all_files()
+    return analyzer
+
+
+@pytest.mark.unit
+def test_process_pool_matches_serial_extraction(tmp_path, logger):
+    (tmp_path / "pkg").mkdir()
+    (tmp_path / "pkg" / "__init__.py").write_text("")
+    (tmp_path / "pkg" / "util.py").write_text("import requests\nfrom numpy import array\n")
+    (tmp_path / "main.py").write_text("from pkg import util\nimport os\n")
+    (tmp_path / "data.json").write_text("{}\n")
+    (tmp_path / "a.js").write_text("import React from 'react';\nimport data from './data.json';\n")
+    (tmp_path / "b.js").write_text("const data = require('./data.json');\nconst x = require('lodash');\n")
+
+    serial = _extract(tmp_path, logger)
+    with ConfigOverride({"PARSE_WORKERS": 2}, logger=logger):
+        pooled = _extract(tmp_path, logger)
+
+    assert dict(pooled.file_imports) == dict(serial.file_imports)
+    assert dict(pooled.local_imports_map) == dict(serial.local_imports_map)
+    assert dict(pooled.file_package_components) == dict(serial.file_package_components)
+    # Files the resolver registered in the workers are merged back in serial order
+    assert list(pooled.source_files.items()) == list(serial.source_files.items())
+    assert "data.json" in pooled.source_files
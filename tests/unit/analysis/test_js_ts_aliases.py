@@ -0,0 +1,47 @@
+import pytest
+
+from gardener.analysis import js_ts_aliases
+from gardener.analysis.js_ts_aliases import parse_ts_js_config
+
+
+def test_tsconfig_comments_and_trailing_commas_are_ignored_outside_strings(tmp_path):
+    config = tmp_path / 'tsconfig.json'
+    config.write_text(
+        '{\n'
+        '  // compiler settings\n'
+        '  "compilerOptions": {\n'
+        '    "baseUrl": "./src", /* relative to the root */\n'
+        '    "paths": {\n'
+        '      "@app/*": ["app/*", "legacy//app/*",],\n'
+        '      "@odd,}/*": ["odd/*"], // trailing\n'
+        '    },\n'
+        '  },\n'
+        '}\n'
+    )
+
+    base_url, paths = parse_ts_js_config(str(tmp_path), [], [str(config)], None, None)
+
+    assert base_url == './src'
+    assert paths == {'@app/*': ['app/*', 'legacy//app/*'], '@odd,}/*': ['odd/*']}
+
+
+def test_parsed_config_is_reused_until_the_file_changes(tmp_path, monkeypatch):
+    config = tmp_path / 'tsconfig.json'
+    config.write_text('{"compilerOptions": {"paths": {"@a/*": ["a/*"]}}}')
+    first = parse_ts_js_config(str(tmp_path), [], [str(config)], None, None)
+    first[1]['@a/*'].append('mutated')
+
+    monkeypatch.setattr(js_ts_aliases, '_load_jsonc', lambda content: pytest.fail('config parsed again'))
+    assert parse_ts_js_config(str(tmp_path), [], [str(config)], None, None) == (None, {'@a/*': ['a/*']})
+
+    monkeypatch.undo()
+    config.write_text('{"compilerOptions": {"baseUrl": ".", "paths": {}}}')
+    assert parse_ts_js_config(str(tmp_path), [], [str(config)], None, None) == ('.', {})
+
+
+def test_plain_json_config_skips_comment_stripping(tmp_path, monkeypatch):
+    config = tmp_path / 'jsconfig.json'
+    config.write_text('{"compilerOptions": {"baseUrl": "src", "paths": {"~/*": ["./*"]}}}')
+    monkeypatch.setattr(js_ts_aliases, '_strip_jsonc', lambda content: pytest.fail('plain JSON was stripped'))
+
+    assert parse_ts_js_config(str(tmp_path), [str(config)], [], None, None) == ('src', {'~/*': ['./*']})
@@ -0,0 +1,66 @@
+from gardener.analysis.imports import LocalImportResolver
+
+
+def _resolver(tmp_path, source_files, **overrides):
+    kwargs = dict(
+        alias_resolver=None,
+        js_ts_base_url=None,
+        js_ts_path_aliases=None,
+        go_module_path=None,
+        remappings=None,
+        hardhat_remappings=None,
+        solidity_src_path=None,
+        logger=None,
+    )
+    kwargs.update(overrides)
+    return LocalImportResolver(repo_path=str(tmp_path), source_files=source_files, **kwargs)
+
+
+def test_resolutions_are_shared_by_files_in_the_same_directory(tmp_path):
+    source_files = {'pkg/util.py': {'absolute_path': str(tmp_path / 'pkg/util.py'), 'language': 'python'}}
+    lir = _resolver(tmp_path, source_files)
+
+    assert lir.resolve_python('pkg/a.py', 'util', 1) == 'pkg/util.py'
+    assert lir.resolve_python('pkg/b.py', 'util', 1) == 'pkg/util.py'
+    assert lir.resolve_python('other/c.py', 'util', 1) is None
+    assert len(lir._resolve_cache) == 2
+
+
+def test_cached_misses_are_retried_after_files_are_registered(tmp_path):
+    (tmp_path / 'src').mkdir()
+    (tmp_path / 'src' / 'data.json').write_text('{}')
+    source_files = {'src/a.js': {'absolute_path': str(tmp_path / 'src/a.js'), 'language': 'javascript'}}
+    lir = _resolver(tmp_path, source_files)
+
+    assert lir.resolve_js('src/a.js', './data') is None
+    assert lir.resolve_js('src/a.js', './data.json') == 'src/data.json'
+    # Files added to source_files are seen by lookups that previously missed
+    source_files['src/data.js'] = {'absolute_path': str(tmp_path / 'src/data.js'), 'language': 'javascript'}
+    assert lir.resolve_js('src/a.js', './data') == 'src/data.js'
+
+
+def test_solidity_remappings_prefer_the_longest_prefix(tmp_path):
+    source_files = {
+        path: {'absolute_path': str(tmp_path / path), 'language': 'solidity'}
+        for path in ('lib/oz/up/token/ERC20.sol', 'lib/oz-upgradeable/token/ERC20.sol')
+    }
+    lir = _resolver(tmp_path, source_files, remappings={'@oz/': 'lib/oz/', '@oz/up/': 'lib/oz-upgradeable/'})
+
+    # '@oz/' also maps this import onto an existing file, but the longer prefix wins
+    assert lir.resolve_solidity('src/A.sol', '@oz/up/token/ERC20.sol') == 'lib/oz-upgradeable/token/ERC20.sol'
+    assert lir.resolve_solidity('src/A.sol', '@oz/up/ERC20.sol') is None
+
+
+def test_rust_use_paths_resolve_to_the_longest_module(tmp_path):
+    source_files = {
+        path: {'absolute_path': str(tmp_path / path), 'language': 'rust'}
+        for path in ('src/lib.rs', 'src/net.rs', 'src/net/http/mod.rs', 'src/net/http.rs')
+    }
+    lir = _resolver(tmp_path, source_files)
+
+    # A file module wins over a directory module of the same path
+    assert lir.resolve_rust('src/lib.rs', ['crate', 'net', 'http', 'Client']) == 'src/net/http.rs'
+    assert lir.resolve_rust('src/lib.rs', ['crate', 'net', 'tcp', 'connect']) == 'src/net.rs'
+    del source_files['src/net/http.rs']
+    lir = _resolver(tmp_path, source_files)
+    assert lir.resolve_rust('src/lib.rs', ['crate', 'net', 'http', 'Client']) == 'src/net/http/mod.rs'
@@ -393,5 +393,18 @@ from pathlib import Path
         tree = parser.parse(content.encode())
         assert tree is not None
 
+    def test_invalid_utf8_source_still_yields_imports(self):
+        """Invalid UTF-8 bytes are dropped before parsing instead of failing the file"""
+        from gardener.analysis.tree import RepositoryAnalyzer
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            Path(tmpdir, "bad.py").write_bytes(b"# caf\xe9\nimport requests\nimport caf\xe9_mod\n")
+            analyzer = RepositoryAnalyzer(tmpdir, logger=Logger())
+            analyzer.register_language_handler("python", PythonLanguageHandler())
+            analyzer.scan_repo()
+            analyzer.extract_imports_from_all_files()
+
+        assert "requests" in analyzer.file_imports.get("bad.py", [])
+
 
 pytestmark = pytest.mark.security
@@ -238,6 +238,25 @@ class TestResourceLimits:
         except MemoryError:
             pytest.fail("Graph building caused memory exhaustion")
 
+    def test_scan_records_size_used_by_file_size_limit(self):
+        """Files over MAX_FILE_SIZE are skipped using the size recorded by the scan"""
+        from gardener.common.defaults import ConfigOverride
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            Path(tmpdir, "small.py").write_text("import requests\n")
+            Path(tmpdir, "big.py").write_text("import numpy\n" * 100)
+            analyzer = RepositoryAnalyzer(tmpdir, logger=Logger())
+            analyzer.register_language_handler("python", PythonLanguageHandler())
+            analyzer.scan_repo()
+
+            assert analyzer.source_files["big.py"]["size"] == len("import numpy\n" * 100)
+            with ConfigOverride({"MAX_FILE_SIZE": 100}):
+                analyzer.extract_imports_from_all_files()
+
+            assert "small.py" in analyzer.file_imports
+            assert "big.py" not in analyzer.file_imports
+            assert SecureFileOps(tmpdir).file_size(tmpdir) is None
+
     def test_secure_file_ops_path_limit(self):
         """Test secure file operations with extremely long paths"""
         with tempfile.TemporaryDirectory() as tmpdir:
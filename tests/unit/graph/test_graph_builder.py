@@ -678,3 +678,175 @@ def test_build_graph_empty_inputs(graph_builder, logger):
     # Expected: An empty graph
     assert graph.number_of_nodes() == 0
     assert graph.number_of_edges() == 0
+
+
+def test_build_graph_registers_adjacency_matching_networkx(graph_builder, logger, monkeypatch):
+    """
+    Test that the adjacency matrix recorded while building matches NetworkX's conversion
+
+    Includes a repeated import so the later edge overwrites the earlier one, as in the DiGraph
+    """
+    import networkx as nx
+    import pytest
+
+    source_files = {
+        "main.py": "/path/to/repo/main.py",
+        "utils.py": "/path/to/repo/utils.py",
+        "lonely.py": "/path/to/repo/lonely.py",
+    }
+    external_packages = {"numpy": {"ecosystem": "pypi", "import_names": ["numpy", "np"]}}
+    file_imports = {"main.py": ["numpy", "np"], "utils.py": ["numpy"]}
+    file_package_components = {"main.py": [("numpy", "numpy.array")]}
+    local_imports_map = {"main.py": ["utils.py"]}
+
+    graph_builder.build_dependency_graph(
+        source_files=source_files,
+        external_packages=external_packages,
+        file_imports=file_imports,
+        file_package_components=file_package_components,
+        local_imports_map=local_imports_map,
+    )
+    graph = graph_builder.graph
+
+    with monkeypatch.context() as m:
+        m.setattr(nx, "to_scipy_sparse_array", lambda *a, **k: pytest.fail("graph should not be converted"))
+        nodelist, adjacency = graph_builder.centrality_calculator._graph_to_csr(graph)
+    expected = nx.to_scipy_sparse_array(graph, nodelist=nodelist, weight="weight", format="csr")
+
+    assert sorted(nodelist) == sorted(graph.nodes)
+    assert adjacency.nnz == graph.number_of_edges()
+    assert abs(adjacency - expected).max() < 1e-6
+
+
+def test_resolve_dist_node_uses_longest_slash_prefix(graph_builder, logger):
+    """
+    Test longest-prefix resolution of hierarchical (Go-style) imports
+    """
+    graph_builder.build_dependency_graph(
+        source_files={"main.go": "/path/to/repo/main.go"},
+        external_packages={
+            "github.com/org/mod": {"ecosystem": "go", "import_names": ["github.com/org/mod"]},
+            "github.com/org/mod/v2": {"ecosystem": "go", "import_names": ["github.com/org/mod/v2"]},
+            "github.com/org/mod-extra": {"ecosystem": "go", "import_names": ["github.com/org/mod-extra"]},
+        },
+        file_imports={},
+        file_package_components={},
+        local_imports_map={},
+    )
+
+    resolve = graph_builder._resolve_dist_node_for_import
+    assert resolve("github.com/org/mod/v2/pkg/sub") == "github.com/org/mod/v2"
+    assert resolve("github.com/org/mod/v3") == "github.com/org/mod"
+    assert resolve("github.com/org/mod-extra/x") == "github.com/org/mod-extra"
+    assert resolve("github.com/org/modx/y") is None
+    assert resolve("github.com/other") is None
+
+
+def test_debug_messages_skipped_unless_logger_is_verbose(capsys):
+    """
+    Test that the builder only formats debug messages when the logger would emit them
+    """
+    import logging
+
+    from gardener.analysis.graph import DependencyGraphBuilder
+    from gardener.common.utils import Logger
+
+    quiet, verbose = Logger(verbose=False), Logger(verbose=True)
+    assert not quiet.isEnabledFor(logging.DEBUG) and quiet.isEnabledFor(logging.INFO)
+    assert verbose.isEnabledFor(logging.DEBUG)
+
+    inputs = ({"a.py": "/abs/a.py"}, {"pkg": {"ecosystem": "pypi", "import_names": ["pkg"]}}, {"a.py": ["pkg"]}, {}, {})
+    DependencyGraphBuilder(quiet).build_dependency_graph(*inputs)
+    assert "Debug:" not in capsys.readouterr().out
+
+    DependencyGraphBuilder(verbose).build_dependency_graph(*inputs)
+    assert "Added imports_package edge: a.py -> pkg" in capsys.readouterr().out
+
+
+def test_component_nodes_share_interned_attribute_strings(graph_builder):
+    """
+    Test that package/distribution/ecosystem attributes of component nodes are pooled strings
+    """
+    components = {f"f{i}.py": [("".join(["p", "kg"]), f"C{i}")] for i in range(3)}
+    G = graph_builder.build_dependency_graph(
+        source_files={path: f"/abs/{path}" for path in components},
+        external_packages={"pkg": {"ecosystem": "pypi", "import_names": ["pkg"]}},
+        file_imports={path: ["pkg"] for path in components},
+        file_package_components=components,
+        local_imports_map={},
+    )
+
+    attrs = [G.nodes[f"pkg.C{i}"] for i in range(3)]
+    for key in ("package", "distribution_name", "ecosystem"):
+        assert all(a[key] is attrs[0][key] for a in attrs)
+    assert attrs[0]["ecosystem"] is G.nodes["pkg"]["ecosystem"]
+
+
+def test_local_import_creates_missing_file_node_that_also_imports(graph_builder):
+    """
+    Test that a file node created for a local import still contributes its own imports
+    """
+    G = graph_builder.build_dependency_graph(
+        source_files={"a.py": "/abs/a.py", "b.py": "", "c.py": "/abs/c.py"},
+        external_packages={},
+        file_imports={},
+        file_package_components={},
+        local_imports_map={"a.py": ["b.py", "missing.py"], "b.py": ["c.py"]},
+    )
+
+    assert G.nodes["b.py"] == {"type": "file", "language": "python"}
+    assert set(G.edges) == {("a.py", "b.py"), ("b.py", "c.py")}
+
+
+def test_serialized_graph_matches_node_link_data(graph_builder):
+    """
+    Test that the direct serializer produces networkx.node_link_data output
+    """
+    import networkx as nx
+
+    G = graph_builder.build_dependency_graph(
+        source_files={"a.py": "/abs/a.py", "b.py": "/abs/b.py"},
+        external_packages={"pkg": {"ecosystem": "pypi", "import_names": ["pkg"]}},
+        file_imports={"a.py": ["pkg", "os"]},
+        file_package_components={"a.py": [("pkg", "Thing")]},
+        local_imports_map={"b.py": ["a.py"]},
+    )
+
+    assert graph_builder._serialize_graph(G) == nx.node_link_data(G)
+
+
+def test_log_levels_resolved_again_on_each_build(capsys):
+    """
+    Test that a logger made verbose after construction gets debug output on the next build
+    """
+    from gardener.analysis.graph import DependencyGraphBuilder
+    from gardener.common.utils import Logger
+
+    logger = Logger(verbose=False)
+    builder = DependencyGraphBuilder(logger)
+    inputs = ({"a.py": "/abs/a.py"}, {}, {}, {}, {"a.py": ["b.py"]})
+    builder.build_dependency_graph(*inputs)
+    assert "Debug:" not in capsys.readouterr().out
+
+    logger.log_level = 0
+    builder.build_dependency_graph(*inputs)
+    assert "Debug: Added 0 local import edges" in capsys.readouterr().out
+
+
+def test_flushed_edges_get_independent_attribute_dicts(graph_builder):
+    """
+    Test that edges queued with shared attributes end up with their own dicts in both directions
+    """
+    G = graph_builder.build_dependency_graph(
+        source_files={"a.py": "/abs/a.py", "b.py": "/abs/b.py"},
+        external_packages={"pkg": {"ecosystem": "pypi", "import_names": ["pkg"]}},
+        file_imports={"a.py": ["pkg"], "b.py": ["pkg"]},
+        file_package_components={},
+        local_imports_map={"a.py": ["b.py"], "b.py": ["a.py"]},
+    )
+
+    G["a.py"]["pkg"]["weight"] = 2.0
+    G["a.py"]["b.py"]["weight"] = 3.0
+    assert G["b.py"]["pkg"]["weight"] == graph_builder.EDGE_W_IMPORTS_PACKAGE
+    assert G["b.py"]["a.py"]["weight"] == graph_builder.EDGE_W_IMPORTS_LOCAL
+    assert G.pred["pkg"]["a.py"] is G["a.py"]["pkg"]
@@ -7,6 +7,7 @@ from collections import defaultdict
 
 import pytest
 
+from gardener.common.tsl import get_parser
 from gardener.treewalk.javascript import JavaScriptLanguageHandler
 
 
@@ -87,3 +88,20 @@ def test_no_imports_file_has_none(tree_parser, logger):
     comps = defaultdict(list)
     external, local = handler.extract_imports(root, "no_imports_fixture.mjs", comps, _mock_resolve_local, logger=logger)
     assert not external and not local and not comps.get("no_imports_fixture.mjs")
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("rel", ["server.js", "utils.js", "api/client.mjs"])
+def test_import_query_matches_full_tree_walk(rel, logger):
+    parser = get_parser("javascript")
+    root = parser.parse(_load(rel).encode()).root_node
+    handler = JavaScriptLanguageHandler(logger)
+    query = handler.import_query(parser.language)
+    assert query is not None
+
+    walked, queried = defaultdict(list), defaultdict(list)
+    full = handler.extract_imports(root, rel, walked, _mock_resolve_local, logger=logger)
+    fast = handler.extract_imports(root, rel, queried, _mock_resolve_local, logger=logger, import_query=query)
+
+    assert sorted(fast[0]) == sorted(full[0]) and sorted(fast[1]) == sorted(full[1])
+    assert queried == walked
@@ -7,6 +7,7 @@ from collections import defaultdict
 
 import pytest
 
+from gardener.common.tsl import get_parser
 from gardener.treewalk.rust import RustLanguageHandler
 
 
@@ -91,3 +92,21 @@ def test_services_mod_rs_internal_helper(tree_parser, logger):
     assert "src/models/user.rs" in set(local)
     _comps = set(comps["src/services/mod.rs"])
     assert any(s.endswith("internal_helper::perform_action") for (_, s) in _comps)
+
+
+@pytest.mark.unit
+def test_import_query_matches_full_tree_walk(logger):
+    code = _load("src/main.rs") + "mod inline { use crate::config; fn f() { use skipped::x; } }\n"
+    parser = get_parser("rust")
+    root = parser.parse(code.encode()).root_node
+    handler = RustLanguageHandler(logger)
+
+    walked, queried = defaultdict(list), defaultdict(list)
+    full = handler.extract_imports(root, "src/main.rs", walked, _mock_resolve)
+    query = handler.import_query(parser.language)
+    fast = handler.extract_imports(root, "src/main.rs", queried, _mock_resolve, import_query=query)
+
+    # Statements nested below inline module items are still left out, as in the full walk
+    assert "skipped" not in full[0]
+    assert sorted(fast[0]) == sorted(full[0]) and fast[1] == full[1]
+    assert queried == walked